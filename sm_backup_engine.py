@@ -6,18 +6,73 @@ Yazar: Dr. Mustafa Afyonluoğlu
 Gerekli Kütüphaneler:
     - os (standart kütüphane)
     - shutil (standart kütüphane)
-    - glob (standart kütüphane)
     - datetime (standart kütüphane)
     - pathlib (standart kütüphane)
+    - time (standart kütüphane)
+    - threading (standart kütüphane)
+    - concurrent.futures (standart kütüphane)
 """
 
 import os
 import shutil
-import glob
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple, Callable, Optional
 
+from sm_scanner import (SourceScanner, ScanResult, scan_target, stat_target_file, has_target_files,
+                        merge_listings,
+                        EXCLUDED_STATS_FULL, EXCLUDED_STATS_SIZE, EXCLUDED_STATS_NONE)
+from sm_parallel import get_device_id
+from sm_file_copy import (copy_file, delta_copy_file, is_appended, append_tail,
+                          CopyCancelled, CopyResult)
+from sm_hasher import FileHasher
+from sm_revision_store import RevisionStore, STORE_DIR
+from sm_revision_compress import (RevisionCompressor, is_compressed_revision, get_logical_size,
+                                  find_revision_file, strip_compressed_suffix,
+                                  TEMP_SUFFIX as COMPRESS_TEMP_SUFFIX)
+from sm_retention import RetentionPolicy, plan_retention
+
+
+# Aynı hedef diske aynı anda yapılan kopyalama sayısı (varsayılan)
+DEFAULT_COPY_WORKERS_PER_DEVICE = 4
+
+# Bu boyuttan büyük değişmiş dosyalarda sadece değişen bloklar yazılır (0: kapalı)
+DEFAULT_DELTA_MIN_SIZE = 64 * 1024 * 1024
+
+# _backup_file() sonuçları
+COPY_NEW = 'new'            # Hedefte yoktu, kopyalandı
+COPY_REVISED = 'revised'    # Eski sürüm _REVISIONS'a taşındı, yenisi kopyalandı
+COPY_SKIPPED = 'skipped'    # Hedef güncel, atlandı
+COPY_APPENDED = 'appended'  # Sadece kaynağın sonuna eklenen kısım hedefe eklendi
+
+# Yedekleme nedenleri (analiz sonucundaki 'reason' alanı)
+REASON_NEW = 'yeni dosya'                   # Hedefte yok
+REASON_NEWER = 'daha yeni'                  # Kaynağın tarihi hedeften yeni
+REASON_SIZE_CHANGED = 'boyut farklı'        # Boyut+tarih karşılaştırması: boyutlar farklı
+REASON_APPENDED = 'sona eklendi'            # Hedef kaynağın başıyla aynı, sadece eklenen kısım kopyalanır
+REASON_CONTENT_CHANGED = 'içerik değişti'   # İçerik karşılaştırması: özetler farklı
+REASON_TOUCHED = 'sadece tarihi değişti'    # İçerik karşılaştırması: tarih yeni, içerik aynı (atlanır)
+
+# Eşleşme karşılaştırma yöntemleri (mappings.compare_policy)
+COMPARE_MTIME = 'mtime'                      # Kaynağın tarihi hedeften yeniyse kopyala
+COMPARE_MTIME_TOLERANCE = 'mtime_tolerance'  # Tarih farkı toleranstan büyükse kopyala
+COMPARE_SIZE_MTIME = 'size_mtime'            # Boyut farklıysa ya da tarih toleranstan yeniyse kopyala
+COMPARE_HASH = 'hash'                        # Aynı boyutlu dosyaların içerik özetlerini karşılaştır
+COMPARE_POLICIES = (COMPARE_MTIME, COMPARE_MTIME_TOLERANCE, COMPARE_SIZE_MTIME, COMPARE_HASH)
+
+# FAT/exFAT tarihleri 2 saniye hassasiyetle saklar
+DEFAULT_MTIME_TOLERANCE = 2.0
+
+# Byte ilerlemesinin bildirilme aralığı (saniye)
+PROGRESS_INTERVAL = 0.1
+
+# Aynalama ile silinen dosyaların _REVISIONS'taki ön eki
+DELETED_PREFIX = 'sil_'
+
 
 class BackupEngine:
     """Yedekleme işlemlerini gerçekleştiren motor sınıfı"""
@@ -26,12 +81,27 @@ class BackupEngine:
         self.cancelled = False
         self.progress_callback = None
         self.status_callback = None
+        self.copy_workers_per_device = DEFAULT_COPY_WORKERS_PER_DEVICE
+        self.delta_min_size = DEFAULT_DELTA_MIN_SIZE
+        self.dedup_revisions = False  # Aynı içerikli arşiv sürümleri tek kopya (hard link) tutulur
+        self.revision_folders = set()  # Bu yedeklemede sürüm taşınan _REVISIONS tarih klasörleri
+        # _REVISIONS'a taşınan sürümler (arşiv indeksine yazılmak üzere):
+        # (target_path, revision_folder, stored_path, rel_path, file_size, disk_size, archived_date)
+        # disk_size: diskte kaplanan alan - tekilleştirilen sürümlerde 0, sıkıştırılanlarda sıkıştırılmış boyut
+        self.archived_revisions = []
+        
+        # Kopyalanan byte ilerlemesi (kopyalama worker'ları ortak günceller)
+        self._progress_lock = threading.Lock()
+        self._bytes_copied = 0
+        self._bytes_total = 0
+        self._last_progress_time = 0.0
     
-    def set_progress_callback(self, callback: Callable[[float], None]):
+    def set_progress_callback(self, callback: Callable[[int, int], None]):
         """İlerleme callback'ini ayarla
         
         Args:
-            callback: İlerleme yüzdesi alan fonksiyon (0.0 - 1.0)
+            callback: (kopyalanan_byte, toplam_byte) alan fonksiyon - kopyalama
+                sırasında en fazla PROGRESS_INTERVAL saniyede bir çağrılır
         """
         self.progress_callback = callback
     
@@ -51,6 +121,31 @@ class BackupEngine:
         """İptal bayrağını sıfırla"""
         self.cancelled = False
     
+    def _scan_source(self, source_path: str, file_filter: str,
+                     exclude_filter: str, include_subdirs: bool,
+                     excluded_stats: str = EXCLUDED_STATS_FULL,
+                     catalog: Optional[Dict[str, Tuple[int, float, int]]] = None,
+                     dir_catalog: Optional[Dict[str, Tuple[float, int]]] = None,
+                     trust_catalog: bool = False) -> ScanResult:
+        """Kaynak klasörü tek geçişte tara (tüm analiz metodları bunu kullanır)
+
+        Args:
+            source_path: Kaynak klasör
+            file_filter: Dosya filtresi
+            exclude_filter: Hariç tutulacak dosya filtresi
+            include_subdirs: Alt klasörleri dahil et
+            excluded_stats: Hariç tutulan dosyalar için istatistik modu (EXCLUDED_STATS_*)
+            catalog: Dosya kataloğu (opsiyonel, klasör kataloğu ile birlikte kullanılır)
+            dir_catalog: Klasör kataloğu - tarihi değişmeyen klasörler listelenmez (opsiyonel)
+            trust_catalog: Listelenmeyen klasörlerdeki dosyaları stat etme
+
+        Returns:
+            ScanResult (dahil / hariç-filtre / hariç-gizli dosyalar)
+        """
+        scanner = SourceScanner(source_path, file_filter, exclude_filter, include_subdirs,
+                                excluded_stats, catalog, dir_catalog, trust_catalog)
+        return scanner.scan(lambda: self.cancelled)
+    
     def get_files_from_mapping(self, source_path: str, file_filter: str, 
                                exclude_filter: str, include_subdirs: bool) -> List[str]:
         """Eşleşmeye göre dosya listesi oluştur
@@ -79,117 +174,12 @@ class BackupEngine:
                 self.status_callback(f"UYARI: Kaynak yol bir klasör değil: {source_path}")
             return files
         
-        # File filter'ı virgülle ayır (birden fazla pattern destekle)
-        filter_patterns = [p.strip() for p in file_filter.split(',') if p.strip()]
-        if not filter_patterns:
-            filter_patterns = ['*.*']  # Varsayılan: tüm dosyalar
-        
-        # Her pattern için dosyaları topla
-        all_files = set()  # Tekrar etmemeleri için set kullan
-        for pattern in filter_patterns:
-            if include_subdirs:
-                # Alt klasörler dahil
-                full_pattern = os.path.join(source_path, '**', pattern)
-                matched = glob.glob(full_pattern, recursive=True)
-            else:
-                # Sadece ana klasör
-                full_pattern = os.path.join(source_path, pattern)
-                matched = glob.glob(full_pattern, recursive=False)
-            
-            all_files.update(matched)
-        
-        # Sadece dosyaları al (klasörleri değil)
-        files = [f for f in all_files if os.path.isfile(f)]
+        # Tek geçişte tara - exclude filtresi tarama sırasında uygulanır,
+        # tamamen hariç tutulan klasörlere hiç girilmez
+        scan_result = self._scan_source(source_path, file_filter, exclude_filter, include_subdirs,
+                                        EXCLUDED_STATS_NONE)
         
-        # Exclude filter uygula
-        if exclude_filter:
-            files = self._apply_exclude_filter(files, source_path, exclude_filter, include_subdirs)
-        
-        return files
-    
-    def _apply_exclude_filter(self, files: List[str], source_path: str, 
-                              exclude_filter: str, include_subdirs: bool) -> List[str]:
-        """Exclude filter uygula
-        
-        Args:
-            files: Dosya listesi
-            source_path: Kaynak klasör
-            exclude_filter: Hariç tutulacak dosya filtresi (virgülle ayrılmış)
-                          Pattern örnekleri:
-                          - "*.zip" -> tüm zip dosyaları  
-                          - "__pycache__\\*.*" -> her seviyedeki __pycache__ klasörü (recursive modda)
-                          - "temp\\*.*" -> temp klasöründeki tüm dosyalar (relative)
-                          - "**\\*.log" -> tüm alt klasörlerdeki log dosyaları (explicit)
-                          - "SmartBackup\\TEST_MAIN\\*.*" -> belirli klasördeki dosyalar
-            include_subdirs: Alt klasörleri dahil et
-            
-        Returns:
-            Filtrelenmiş dosya listesi
-        """
-        if not exclude_filter:
-            return files
-        
-        # Virgülle ayrılmış filtreleri ayır
-        exclude_patterns = [p.strip() for p in exclude_filter.split(',') if p.strip()]
-        
-        excluded_files = set()
-        
-        for pattern in exclude_patterns:
-            # Tam yol mu yoksa relative pattern mı kontrol et
-            if os.path.isabs(pattern) or ':' in pattern:
-                # Tam yol - direkt glob kullan
-                matched = glob.glob(pattern, recursive=True)
-            else:
-                # Relative pattern - source_path'e ekle
-                if '**' in pattern:
-                    # Zaten ** var, direkt ekle
-                    full_pattern = os.path.join(source_path, pattern)
-                    matched = glob.glob(full_pattern, recursive=True)
-                else:
-                    # ** yok
-                    if include_subdirs:
-                        # Alt klasörlerde ara - ** ekle
-                        # Örnek: "__pycache__\*.*" -> "source_path\**\__pycache__\*.*"
-                        # Bu her seviyedeki __pycache__ klasörlerini bulur
-                        full_pattern = os.path.join(source_path, '**', pattern)
-                        matched = glob.glob(full_pattern, recursive=True)
-                        
-                        # Kaynak klasörün doğrudan altındaki eşleşmeleri de ekle
-                        # Örnek: "build\*.*" -> "source_path\build\*.*"
-                        direct_pattern = os.path.join(source_path, pattern)
-                        matched_direct = glob.glob(direct_pattern, recursive=False)
-                        matched.extend(matched_direct)
-                        
-                        # Eğer pattern "klasör\*.*" formatındaysa, klasörün alt klasörlerini de dahil et
-                        # Örnek: "build\*.*" -> hem "build\*.*" hem de "build\**\*.*" eşleşmeli
-                        # Pattern'i analiz et: klasör\*.* veya klasör/*.* formatında mı?
-                        pattern_normalized = pattern.replace('/', os.sep).replace('\\', os.sep)
-                        parts = pattern_normalized.split(os.sep)
-                        if len(parts) >= 2 and '*' in parts[-1]:
-                            # Klasör adı + wildcard formatı (örn: build\*.*)
-                            # Alt klasörleri de dahil etmek için ek pattern oluştur
-                            folder_part = os.sep.join(parts[:-1])  # klasör kısmı
-                            file_part = parts[-1]  # dosya paterni (*.*, *.pyc vs)
-                            
-                            # Kaynak klasörün altındaki build\**\*.* 
-                            direct_recursive = os.path.join(source_path, folder_part, '**', file_part)
-                            matched_direct_rec = glob.glob(direct_recursive, recursive=True)
-                            matched.extend(matched_direct_rec)
-                            
-                            # Her seviyedeki build klasörlerinin alt klasörleri
-                            # source_path\**\build\**\*.* formatında
-                            nested_recursive = os.path.join(source_path, '**', folder_part, '**', file_part)
-                            matched_nested = glob.glob(nested_recursive, recursive=True)
-                            matched.extend(matched_nested)
-                    else:
-                        # Sadece direkt alt klasörde
-                        full_pattern = os.path.join(source_path, pattern)
-                        matched = glob.glob(full_pattern, recursive=False)
-            
-            excluded_files.update(matched)
-        
-        # Hariç tutulanları çıkar
-        return [f for f in files if f not in excluded_files]
+        return [entry.path for entry in scan_result.included]
     
     def calculate_mapping_stats(self, source_path: str, file_filter: str,
                                 exclude_filter: str, include_subdirs: bool) -> Tuple[int, int, int, int]:
@@ -210,53 +200,13 @@ class BackupEngine:
         # Yolu normalize et
         source_path = os.path.normpath(source_path)
         
-        # Önce tüm dosyaları al (exclude olmadan) - get_files_from_mapping ile aynı mantıkla
-        filter_patterns = [p.strip() for p in file_filter.split(',') if p.strip()]
-        if not filter_patterns:
-            filter_patterns = ['*.*']
+        # Tek geçişte tara - boyutlar tarama sırasında alınan stat bilgisinden gelir
+        # Hariç tutulan dosyalar listelenmediği için budanan klasörler sadece sayılır
+        scan_result = self._scan_source(source_path, file_filter, exclude_filter, include_subdirs,
+                                        EXCLUDED_STATS_SIZE)
         
-        all_files_set = set()
-        for pattern in filter_patterns:
-            if include_subdirs:
-                full_pattern = os.path.join(source_path, '**', pattern)
-                matched = glob.glob(full_pattern, recursive=True)
-            else:
-                full_pattern = os.path.join(source_path, pattern)
-                matched = glob.glob(full_pattern, recursive=False)
-            all_files_set.update(matched)
-        
-        all_files = [f for f in all_files_set if os.path.isfile(f)]
-        
-        # Gizli klasörlerdeki dosyaları da say
-        hidden_files_count = 0
-        hidden_files_size = 0
-        
-        if include_subdirs:
-            for root, dirs, filenames in os.walk(source_path):
-                for dirname in dirs[:]:
-                    if dirname.startswith('.'):
-                        hidden_dir_path = os.path.join(root, dirname)
-                        for hidden_root, _, hidden_filenames in os.walk(hidden_dir_path):
-                            for hidden_file in hidden_filenames:
-                                hidden_file_path = os.path.join(hidden_root, hidden_file)
-                                if os.path.isfile(hidden_file_path):
-                                    hidden_files_count += 1
-                                    try:
-                                        hidden_files_size += os.path.getsize(hidden_file_path)
-                                    except:
-                                        pass
-                        dirs.remove(dirname)
-        
-        # Sonra exclude'lu dosyaları al
-        files = self.get_files_from_mapping(source_path, file_filter, exclude_filter, include_subdirs)
-        
-        # Hariç tutulanları bul
-        excluded_files = [f for f in all_files if f not in files]
-        
-        total_size = sum(os.path.getsize(f) for f in files if os.path.exists(f))
-        excluded_size = sum(os.path.getsize(f) for f in excluded_files if os.path.exists(f)) + hidden_files_size
-        
-        return len(files), total_size, len(excluded_files) + hidden_files_count, excluded_size
+        return (len(scan_result.included), scan_result.included_size,
+                scan_result.excluded_count, scan_result.excluded_size)
     
     def analyze_mapping(self, source_path: str, file_filter: str,
                        exclude_filter: str, include_subdirs: bool, target_path: str) -> Tuple[int, int, int, int]:
@@ -276,57 +226,45 @@ class BackupEngine:
         source_path = os.path.normpath(source_path)
         target_path = os.path.normpath(target_path)
         
-        # Önce tüm dosyaları al (exclude olmadan) - get_files_from_mapping ile aynı mantıkla
-        filter_patterns = [p.strip() for p in file_filter.split(',') if p.strip()]
-        if not filter_patterns:
-            filter_patterns = ['*.*']
-        
-        all_files_set = set()
-        for pattern in filter_patterns:
-            if include_subdirs:
-                full_pattern = os.path.join(source_path, '**', pattern)
-                matched = glob.glob(full_pattern, recursive=True)
-            else:
-                full_pattern = os.path.join(source_path, pattern)
-                matched = glob.glob(full_pattern, recursive=False)
-            all_files_set.update(matched)
-        
-        all_files = [f for f in all_files_set if os.path.isfile(f)]
-        
-        # Sonra exclude'lu dosyaları al
-        files = self.get_files_from_mapping(source_path, file_filter, exclude_filter, include_subdirs)
+        # Tek geçişte tara
+        scan_result = self._scan_source(source_path, file_filter, exclude_filter, include_subdirs,
+                                        EXCLUDED_STATS_SIZE)
         
-        # Hariç tutulanları bul
-        excluded_files = [f for f in all_files if f not in files]
-        excluded_size = sum(os.path.getsize(f) for f in excluded_files if os.path.exists(f))
+        # Hariç tutulanlar (filtre)
+        excluded_count = scan_result.user_excluded_count
+        excluded_size = scan_result.user_excluded_size
         
         files_to_backup = []
         total_size = 0
         
-        for source_file in files:
-            if not os.path.exists(source_file):
-                continue
-            
+        for entry in scan_result.included:
             # Hedef dosya yolunu oluştur
-            rel_path = os.path.relpath(source_file, source_path)
-            target_file = os.path.join(target_path, rel_path)
+            target_file = os.path.join(target_path, entry.rel_path)
             
             # Hedefte yoksa veya daha yeni ise yedekle
-            if not os.path.exists(target_file):
-                files_to_backup.append(source_file)
-                total_size += os.path.getsize(source_file)
-            else:
-                # Tarih karşılaştırması
-                source_mtime = os.path.getmtime(source_file)
+            try:
                 target_mtime = os.path.getmtime(target_file)
-                if source_mtime > target_mtime:
-                    files_to_backup.append(source_file)
-                    total_size += os.path.getsize(source_file)
+            except OSError:
+                target_mtime = None
+            
+            if target_mtime is None or entry.mtime > target_mtime:
+                files_to_backup.append(entry.path)
+                total_size += entry.size
         
-        return len(files_to_backup), total_size, len(excluded_files), excluded_size
+        return len(files_to_backup), total_size, excluded_count, excluded_size
     
     def analyze_mapping_detailed(self, source_path: str, file_filter: str,
-                                 exclude_filter: str, include_subdirs: bool, target_path: str, max_files_to_show) -> Dict:
+                                 exclude_filter: str, include_subdirs: bool, target_path: str, max_files_to_show,
+                                 excluded_stats: str = EXCLUDED_STATS_FULL,
+                                 catalog: Optional[Dict[str, Tuple[int, float, int]]] = None,
+                                 dir_catalog: Optional[Dict[str, Tuple[float, int]]] = None,
+                                 trust_catalog: bool = False,
+                                 hasher: Optional[FileHasher] = None,
+                                 compare_policy: str = COMPARE_MTIME,
+                                 mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE,
+                                 append_only: bool = False,
+                                 revision_summary: Optional[Dict] = None,
+                                 detect_deletions: bool = True) -> Dict:
         """Eşleşme için yedeklenecek dosyaları detaylı analiz et
         
         Args:
@@ -335,6 +273,34 @@ class BackupEngine:
             exclude_filter: Hariç tutulacak dosya filtresi
             include_subdirs: Alt klasörleri dahil et
             target_path: Hedef klasör
+            max_files_to_show: Listelerde tutulacak en fazla dosya sayısı
+            excluded_stats: Hariç tutulan dosyalar için istatistik modu
+                - EXCLUDED_STATS_FULL: hariç tutulan dosyalar tek tek listelenir
+                - EXCLUDED_STATS_SIZE: tamamen hariç klasörlere girilmez, sadece sayı/boyut hesaplanır
+                - EXCLUDED_STATS_NONE: tamamen hariç klasörler hiç taranmaz
+            catalog: Eşleşmenin dosya kataloğu {rel_path: (boyut, tarih, inode)} (opsiyonel)
+                Stat bilgisi katalogdakiyle aynı olan ve hedef kopyası katalogdaki boyutta
+                bulunan dosyalar karşılaştırılmadan atlanır. trust_catalog açık ve
+                detect_deletions kapalıysa hedef hiç listelenmez: bu dosyalar hedefe
+                bakılmadan atlanır, sadece katalogda olmayan/değişen dosyaların hedefi
+                tek tek stat edilir.
+            dir_catalog: Eşleşmenin klasör kataloğu {rel_dir: (tarih, kayıt sayısı)} (opsiyonel)
+                Tarihi değişmeyen klasörler yeniden listelenmez, sadece bilinen dosyaları stat edilir.
+            trust_catalog: True ise listelenmeyen klasörlerdeki dosyalar hiç stat edilmez
+                (detect_deletions kapalıysa katalog kayıtları hedefte de doğrulanmaz)
+            hasher: Verilirse içerik karşılaştırma modu - hedefte aynı boyutta bulunan
+                dosyaların özetleri karşılaştırılır. Tarihi geri alınmış içerik değişiklikleri
+                yakalanır (REASON_CONTENT_CHANGED), sadece tarihi değişen dosyalar
+                kopyalanmaz (REASON_TOUCHED).
+            compare_policy: Hedefte bulunan dosyalar için karşılaştırma yöntemi (COMPARE_*)
+                COMPARE_HASH seçiliyse hasher verilmese de içerik karşılaştırılır.
+            mtime_tolerance: Tolerans kullanan yöntemlerde tarih farkı toleransı (saniye)
+            append_only: Büyüyen dosyalarda hedef kaynağın başıyla aynıysa sadece eklenen
+                kısım kopyalanır (REASON_APPENDED) - log/journal dosyaları için
+            revision_summary: Arşiv indeksinden okunan _REVISIONS özeti (opsiyonel,
+                summarize_revisions biçiminde). Verilirse _REVISIONS klasörü taranmaz.
+            detect_deletions: Kaynakta olmayan hedef dosyalarını tespit et. Kapalıysa ve
+                kataloğa güveniliyorsa hedef listelenmez, silinen dosyalar tespit edilmez.
             
         Returns:
             {
@@ -344,7 +310,9 @@ class BackupEngine:
                 'skipped_count': atlanan_dosya_sayısı,
                 'total_size': toplam_boyut,
                 'excluded_size': hariç_tutulan_boyut,
-                'skipped_size': atlanan_dosya_boyutu
+                'skipped_size': atlanan_dosya_boyutu,
+                'revision_size': arşiv_sürümlerinin_orijinal_boyutu,
+                'revision_disk_size': arşiv_sürümlerinin_diskte_kapladığı_alan
             }
         """
 
@@ -352,171 +320,66 @@ class BackupEngine:
         source_path = os.path.normpath(source_path)
         target_path = os.path.normpath(target_path)
         
-        # Önce glob ile bulunan dosyaları al (exclude olmadan)
-        filter_patterns = [p.strip() for p in file_filter.split(',') if p.strip()]
-        if not filter_patterns:
-            filter_patterns = ['*.*']
+        # Hash yöntemi - önbellek verilmediyse sadece bu analiz için hesaplanır
+        if compare_policy == COMPARE_HASH and hasher is None:
+            hasher = FileHasher()
         
-        all_files_set = set()
-        for pattern in filter_patterns:
-            if include_subdirs:
-                full_pattern = os.path.join(source_path, '**', pattern)
-                matched = glob.glob(full_pattern, recursive=True)
-            else:
-                full_pattern = os.path.join(source_path, pattern)
-                matched = glob.glob(full_pattern, recursive=False)
-            all_files_set.update(matched)
-        
-        all_files = [f for f in all_files_set if os.path.isfile(f)]
-        
-        # Gizli klasörlerdeki dosyaları da say (glob bunları atlar)
-        # .git, .vscode gibi klasörler glob tarafından görmezden gelinir
-        hidden_files_count = 0
-        hidden_files_size = 0
-        hidden_files_list = []  # Gizli dosyaların listesi
-        
-        if include_subdirs:
-            # os.walk ile tüm dosyaları tara (gizli klasörler dahil)
-            for root, dirs, filenames in os.walk(source_path):
-                # Gizli klasörleri kontrol et
-                for dirname in dirs[:]:  # [:] ile kopya oluştur, güvenli silme için
-                    if dirname.startswith('.'):
-                        # Gizli klasör - dosyalarını say
-                        hidden_dir_path = os.path.join(root, dirname)
-                        for hidden_root, _, hidden_filenames in os.walk(hidden_dir_path):
-                            for hidden_file in hidden_filenames:
-                                hidden_file_path = os.path.join(hidden_root, hidden_file)
-                                if os.path.isfile(hidden_file_path):
-                                    hidden_files_count += 1
-                                    hidden_files_list.append(hidden_file_path)  # Listeye ekle
-                                    try:
-                                        hidden_files_size += os.path.getsize(hidden_file_path)
-                                    except:
-                                        pass
-                        # Bu klasöre girme (zaten saydık)
-                        dirs.remove(dirname)
-        
-        # Sonra exclude'lu dosyaları al
-        files = self.get_files_from_mapping(source_path, file_filter, exclude_filter, include_subdirs)
+        # Kaynağı tek geçişte tara - dosyalar dahil / hariç (filtre) / hariç (gizli)
+        # olarak ayrılmış gelir. Gizli klasörler (.git, .vscode gibi) ayrıca taranmaz.
+        scan_start = time.perf_counter()
+        scan_result = self._scan_source(source_path, file_filter, exclude_filter, include_subdirs,
+                                        excluded_stats, catalog, dir_catalog, trust_catalog)
+        scan_seconds = time.perf_counter() - scan_start
         
-        # Hariç tutulanları 2 gruba ayır:
-        # 1. Kullanıcı tanımlı exclude filtresi ile hariç tutulanlar
-        # 2. Gizli klasörlerde olduğu için hariç tutulanlar
-        
-        # Kullanıcı tanımlı exclude ile hariç tutulanlar
-        user_excluded_files_set = set(all_files) - set(files)
-        user_excluded_files_list = list(user_excluded_files_set)[:max_files_to_show]
-        user_excluded_count = len(user_excluded_files_set)
-        user_excluded_size = sum(os.path.getsize(f) for f in user_excluded_files_set if os.path.exists(f))
+        # Kullanıcı tanımlı exclude ile hariç tutulanlar (budanan klasörlerdekiler dahil)
+        user_excluded_files_list = [entry.path for entry in scan_result.user_excluded[:max_files_to_show]]
+        user_excluded_count = scan_result.user_excluded_count
+        user_excluded_size = scan_result.user_excluded_size
         
         # Gizli klasör dosyalarının listesi (ilk N tanesi)
-        hidden_excluded_files_list = hidden_files_list[:max_files_to_show]
+        hidden_excluded_files_list = [entry.path for entry in scan_result.hidden_excluded[:max_files_to_show]]
+        hidden_files_count = scan_result.hidden_excluded_count
+        hidden_files_size = scan_result.hidden_excluded_size
         
         # Toplam hariç tutulanlar
         total_excluded_count = user_excluded_count + hidden_files_count
         total_excluded_size = user_excluded_size + hidden_files_size
         
-        # _REVISIONS klasöründeki dosyaları say ve listele
-        revision_count = 0
-        revision_size = 0
-        revision_files_list = []  # Revision dosyalarının detaylı listesi
-        revisions_path = os.path.join(target_path, '_REVISIONS')
+        # _REVISIONS özeti - indeks yoksa klasör taranır
+        if revision_summary is None:
+            revision_summary = self.summarize_revisions(
+                target_path, self.scan_revisions(target_path), max_files_to_show
+            )
+        
+        # Kataloğa güvenilen ve silinen dosya istenmeyen analizde hedef listelenmez:
+        # katalogla aynı dosyalar hedefe bakılmadan atlanır, diğerlerinin hedefi tek tek
+        # stat edilir. Hedef klasör yoksa ya da boşsa (disk değişmiş / biçimlendirilmiş)
+        # katalog geçersiz sayılır ve hedef normal şekilde listelenir.
+        catalog_only = (bool(catalog) and trust_catalog and not detect_deletions
+                        and has_target_files(target_path))
+        
+        # Diğer durumlarda hedef klasör bir kez listelenir - kaynak ile hedef, relative
+        # yola göre sıralanmış iki liste olarak tek geçişte karşılaştırılır (karşı tarafta
+        # dosya başına stat yok). Katalog kaydı sadece hedef kopyası listede katalogdaki
+        # boyutta bulunursa geçerlidir.
+        if catalog_only:
+            pairs = ((entry, None) for entry in scan_result.included)
+        else:
+            pairs = merge_listings(scan_result.included,
+                                   scan_target(target_path, lambda: self.cancelled))
+        
+        # Silinen dosya tespiti için: kaynakta olup yedeklemeye dahil olmayan dosyalar
+        # ve içeriği tam bilinen (listelenen) kaynak klasörler
+        normcase = os.path.normcase
+        source_other_files = scan_result.non_included_keys()
+        source_listed_dirs = set(normcase(rel_dir) for rel_dir in scan_result.listed_dirs)
+        unlisted_dir_exists = {}  # Taramada içine girilmeyen kaynak klasörler: {rel_dir: var mı}
         
-        if os.path.exists(revisions_path):
-            try:
-                for root, dirs, filenames in os.walk(revisions_path):
-                    for filename in filenames:
-                        file_path = os.path.join(root, filename)
-                        if os.path.isfile(file_path):
-                            revision_count += 1
-                            try:
-                                file_size = os.path.getsize(file_path)
-                                revision_size += file_size
-                                
-                                # Tarih-saat klasörünü bul (_REVISIONS\20251122_143020 gibi)
-                                # file_path örnek: D:\Backup\_REVISIONS\20251122_143020\project\file.txt
-                                # revisions_path örnek: D:\Backup\_REVISIONS
-                                rel_to_revisions = os.path.relpath(file_path, revisions_path)
-                                # rel_to_revisions: 20251122_143020\project\file.txt
-                                parts = rel_to_revisions.split(os.sep)
-                                timestamp_folder = parts[0] if parts else "Unknown"
-                                
-                                # İlk 50 dosyayı sakla
-                                if len(revision_files_list) < max_files_to_show:
-                                    revision_files_list.append({
-                                        'path': file_path,
-                                        'size': file_size,
-                                        'timestamp_folder': timestamp_folder
-                                    })
-                            except:
-                                pass
-            except Exception as e:
-                # Erişim hatası durumunda sessizce devam et
-                pass
-        
-        # Hedefte olup kaynakta olmayan dosyaları tespit et (silinmiş dosyalar)
         deleted_files_list = []  # Görüntülemek için (ilk N tane)
         deleted_files_all = []   # Yedekleme işlemi için (tümü)
         deleted_count = 0
         deleted_size = 0
         
-        if os.path.exists(target_path):
-            try:
-                # DEBUG: Log dosyası oluştur
-                debug_log_path = os.path.join(os.path.dirname(__file__), 'debug_deleted_files.txt')
-               
-                # Hedef klasördeki dosyaları tara (exclude _REVISIONS klasörü)
-                for root, dirs, filenames in os.walk(target_path):
-
-                    
-                    # ÖNCELİKLE: root path'ini klasör isimlerine ayırarak _REVISIONS kontrolü yap
-                    path_parts = root.split(os.sep)
-                    
-                    if '_REVISIONS' in path_parts:
-                        continue  # Bu klasör _REVISIONS altındaysa atla
-                    
-                    # İKİNCİL: Alt klasörlerden _REVISIONS'ı çıkar
-                    if '_REVISIONS' in dirs:
-                        dirs.remove('_REVISIONS')
-                    
-                    for filename in filenames:
-                        target_file = os.path.join(root, filename)
-                        
-                        # ÜÇÜNCÜL: Güvenlik kontrolü - path component olarak kontrol
-                        target_parts = target_file.split(os.sep)
-                        if '_REVISIONS' in target_parts:
-                            continue
-                        
-                        # Hedef dosyanın kaynak karşılığını bul
-                        rel_path = os.path.relpath(target_file, target_path)
-                        source_file = os.path.join(source_path, rel_path)
-                        
-                        # Kaynakta yoksa, silinmiş demektir
-                        if not os.path.exists(source_file):
-                            deleted_count += 1
-                            try:
-                                file_size = os.path.getsize(target_file)
-                                deleted_size += file_size
-                                
-                                file_info = {
-                                    'path': target_file,
-                                    'size': file_size
-                                }
-                                
-                                # Tüm silinen dosyaları kaydet (yedekleme için)
-                                deleted_files_all.append(file_info)
-                                
-                                # İlk N tanesini görüntüleme listesine ekle
-                                if len(deleted_files_list) < max_files_to_show:
-                                    deleted_files_list.append(file_info)
-                            except:
-                                pass
-                                    
-                # print(f"[DEBUG] Log dosyası kaydedildi: {debug_log_path}")
-            except Exception as e:
-                # Erişim hatası durumunda sessizce devam et
-                pass
-        
         files_to_backup = []
         files_to_skip = []
         skipped_files_list = []  
@@ -524,60 +387,159 @@ class BackupEngine:
         skipped_count = 0
         skipped_size = 0
         
+        # Katalog: değişmemiş dosyalar (hedef kopyası yerindeyse) karşılaştırılmadan atlanır
+        catalog_skipped_count = 0
+        catalog_synced_entries = []   # Bu analizde hedefle eşit bulunan (katalogda olmayan/değişen) dosyalar
+        catalog_seen = set()          # Kaynakta hâlâ bulunan katalog kayıtları
+        
+        # İçerik karşılaştırması: özeti hesaplanacak (kaynak, hedef) çiftleri
+        hash_candidates = []
+        touched_files_list = []
+        touched_count = 0
+        touched_size = 0
+        
+        def add_to_backup(entry, target_mtime, reason):
+            nonlocal total_size
+            file_info = {
+                'path': entry.path,
+                'rel_path': entry.rel_path,
+                'size': entry.size,
+                'inode': entry.inode,
+                'reason': reason,
+                'source_mtime': entry.mtime,
+                'target_mtime': target_mtime
+            }
+            if target_mtime is not None:
+                # Tarih farkı bilgisi
+                file_info['source_date'] = datetime.fromtimestamp(entry.mtime).strftime('%Y-%m-%d %H:%M:%S')
+                file_info['target_date'] = datetime.fromtimestamp(target_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            files_to_backup.append(file_info)
+            total_size += entry.size
+        
+        def add_changed(entry, target_entry, reason):
+            # Sadece sonuna ekleme yapılarak büyümüş dosya - eklenen kısım kopyalanır
+            if (append_only and 0 < target_entry.size < entry.size
+                    and is_appended(entry.path, target_entry.path, target_entry.size)):
+                reason = REASON_APPENDED
+            add_to_backup(entry, target_entry.mtime, reason)
+            if reason == REASON_APPENDED:
+                files_to_backup[-1]['target_size'] = target_entry.size
+        
+        def add_to_skip(entry):
+            nonlocal skipped_count, skipped_size
+            # Dosya güncel, atlandı
+            files_to_skip.append(entry.path)
+            if len(skipped_files_list) < max_files_to_show: 
+                skipped_files_list.append(entry.path)
+            skipped_count += 1
+            skipped_size += entry.size
+            if catalog is not None:
+                catalog_synced_entries.append((entry.rel_path, entry.size, entry.mtime, entry.inode))
+        
         # İlerleme mesajı
         # if self.status_callback:
-        #    self.status_callback(f"🟢 : {source_path} : {len(files)} dosya kontrol ediliyor...")
+        #    self.status_callback(f"🟢 : {source_path} : {len(scan_result.included)} dosya kontrol ediliyor...")
 
-        for source_file in files:
-            if not os.path.exists(source_file):
+        for entry, target_entry in pairs:
+            if entry is None:
+                # Sadece hedefte var - kaynakta da yoksa silinmiş demektir
+                rel_key = normcase(target_entry.rel_path)
+                if rel_key in source_other_files:
+                    continue
+                parent = os.path.dirname(rel_key)
+                if parent not in source_listed_dirs:
+                    # Budanan klasör, alt klasörsüz mod vb. - kaynağa doğrudan bak
+                    parent_exists = unlisted_dir_exists.get(parent)
+                    if parent_exists is None:
+                        parent_exists = os.path.isdir(os.path.join(source_path, parent))
+                        unlisted_dir_exists[parent] = parent_exists
+                    if parent_exists and os.path.exists(os.path.join(source_path, target_entry.rel_path)):
+                        continue
+                
+                deleted_count += 1
+                deleted_size += target_entry.size
+                file_info = {
+                    'path': target_entry.path,
+                    'size': target_entry.size
+                }
+                
+                # Tüm silinen dosyaları kaydet (yedekleme için)
+                deleted_files_all.append(file_info)
+                
+                # İlk N tanesini görüntüleme listesine ekle
+                if len(deleted_files_list) < max_files_to_show:
+                    deleted_files_list.append(file_info)
                 continue
             
-            file_size = os.path.getsize(source_file)
+            source_file = entry.path
+            file_size = entry.size
             
-            # Hedef dosya yolunu oluştur
-            rel_path = os.path.relpath(source_file, source_path)
-            target_file = os.path.join(target_path, rel_path)
+            if catalog is not None:
+                cached = catalog.get(entry.rel_path)
+                if cached is not None:
+                    catalog_seen.add(entry.rel_path)
+                    # Hedef kopyası silinmiş / değiştirilmişse (disk değişti, biçimlendirildi)
+                    # katalog kaydı geçersizdir - normal karşılaştırmaya düşer
+                    if (cached == (file_size, entry.mtime, entry.inode)
+                            and (catalog_only or
+                                 (target_entry is not None and target_entry.size == cached[0]))):
+                        # Son yedeklemeden beri değişmemiş (hedef kopyası yerinde) - karşılaştırmadan atla
+                        files_to_skip.append(source_file)
+                        if len(skipped_files_list) < max_files_to_show:
+                            skipped_files_list.append(source_file)
+                        skipped_count += 1
+                        skipped_size += file_size
+                        catalog_skipped_count += 1
+                        continue
+            
+            if catalog_only:
+                # Katalogda olmayan / değişen dosya - sadece bu dosyanın hedefi stat edilir
+                target_entry = stat_target_file(target_path, entry.rel_path)
+            
+            # Hedef dosyanın tarihi (yoksa None)
+            target_mtime = target_entry.mtime if target_entry is not None else None
             
             # Hedefte yoksa veya daha yeni ise yedekle
-            if not os.path.exists(target_file):
-                # YENİ: Neden bilgisi ekle
-                file_info = {
-                    'path': source_file,
-                    'size': file_size,
-                    'reason': 'yeni dosya',
-                    'source_mtime': os.path.getmtime(source_file),
-                    'target_mtime': None
-                }
-                files_to_backup.append(file_info)
-                total_size += file_size
+            if target_mtime is None:
+                add_to_backup(entry, None, REASON_NEW)
+            elif hasher is not None:
+                # İçerik karşılaştırması: boyut farklıysa içerik kesin değişmiştir,
+                # aynıysa özetler döngüden sonra thread havuzunda karşılaştırılır
+                if file_size != target_entry.size:
+                    add_changed(entry, target_entry, REASON_CONTENT_CHANGED)
+                else:
+                    hash_candidates.append((entry, target_entry))
             else:
-                # Tarih karşılaştırması
-                source_mtime = os.path.getmtime(source_file)
-                target_mtime = os.path.getmtime(target_file)
-                if source_mtime > target_mtime:
-                    # YENİ: Tarih farkı bilgisi ekle
-                    from datetime import datetime
-                    source_dt = datetime.fromtimestamp(source_mtime)
-                    target_dt = datetime.fromtimestamp(target_mtime)
-                    
-                    file_info = {
-                        'path': source_file,
-                        'size': file_size,
-                        'reason': 'daha yeni',
-                        'source_mtime': source_mtime,
-                        'target_mtime': target_mtime,
-                        'source_date': source_dt.strftime('%Y-%m-%d %H:%M:%S'),
-                        'target_date': target_dt.strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    files_to_backup.append(file_info)
-                    total_size += file_size
+                reason = self.get_backup_reason(compare_policy, mtime_tolerance, file_size, entry.mtime,
+                                                target_entry.size, target_mtime)
+                if reason:
+                    add_changed(entry, target_entry, reason)
+                else:
+                    add_to_skip(entry)
+        
+        if hash_candidates and not self.cancelled:
+            if self.status_callback:
+                self.status_callback(f"İçerik karşılaştırılıyor: {source_path} ({len(hash_candidates):,} dosya)")
+            hashes = hasher.hash_files(
+                [entry.path for entry, _ in hash_candidates] +
+                [target_entry.path for _, target_entry in hash_candidates],
+                lambda: self.cancelled
+            )
+            for entry, target_entry in hash_candidates:
+                source_hash = hashes.get(entry.path)
+                if source_hash is not None and source_hash == hashes.get(target_entry.path):
+                    add_to_skip(entry)
+                    if entry.mtime > target_entry.mtime:
+                        # Tarihi yeni ama içeriği aynı - kopyalanmaz
+                        touched_count += 1
+                        touched_size += entry.size
+                        if len(touched_files_list) < max_files_to_show:
+                            touched_files_list.append(entry.path)
                 else:
-                    # Dosya güncel, atlandı
-                    files_to_skip.append(source_file)
-                    if len(skipped_files_list) < max_files_to_show: 
-                        skipped_files_list.append(source_file)
-                    skipped_count += 1
-                    skipped_size += file_size
+                    add_to_backup(entry, target_entry.mtime, REASON_CONTENT_CHANGED)
+        
+        # Kaynakta artık olmayan (ya da filtre dışı kalan) katalog kayıtları
+        catalog_stale = [rel_path for rel_path in catalog if rel_path not in catalog_seen] if catalog else []
         
         return {
             'files_to_backup': files_to_backup,
@@ -597,18 +559,82 @@ class BackupEngine:
             'skipped_count': skipped_count,
             'total_size': total_size,
             'skipped_size': skipped_size,
-            'revision_count': revision_count,
-            'revision_size': revision_size,
-            'revision_files': revision_files_list,
+            'revision_count': revision_summary['count'],
+            'revision_size': revision_summary['size'],
+            'revision_disk_size': revision_summary['disk_size'],
+            'revision_files': revision_summary['files'],
             # Silinmiş dosyalar
             'deleted_files': deleted_files_list,        # Görüntüleme için (ilk N tane)
             'deleted_files_all': deleted_files_all,     # Yedekleme için (tümü)
             'deleted_count': deleted_count,
-            'deleted_size': deleted_size
+            'deleted_size': deleted_size,
+            # Dosya kataloğu
+            'catalog_skipped_count': catalog_skipped_count,   # Katalogdan, karşılaştırılmadan atlananlar
+            'target_listed': not catalog_only,                # False: hedef listelenmedi, silinenler tespit edilmedi
+            'catalog_synced_entries': catalog_synced_entries, # Kataloğa yazılacak güncel dosyalar
+            'catalog_stale': catalog_stale,                   # Katalogdan silinecek kayıtlar
+            # İçerik karşılaştırması
+            'compare_policy': compare_policy,
+            'mtime_tolerance': mtime_tolerance,
+            'compare_content': hasher is not None,
+            'hash_compared_count': len(hash_candidates),      # Özeti karşılaştırılan dosyalar
+            'content_changed_count': sum(1 for f in files_to_backup
+                                         if f['reason'] == REASON_CONTENT_CHANGED),
+            'touched_files': touched_files_list,              # Sadece tarihi değişenler (ilk N tane)
+            'touched_count': touched_count,
+            'touched_size': touched_size,
+            # Sona ekleme
+            'appended_count': sum(1 for f in files_to_backup if f['reason'] == REASON_APPENDED),
+            'appended_size': sum(f['size'] - f['target_size'] for f in files_to_backup if f['reason'] == REASON_APPENDED),
+            'hashed_count': hasher.hashed_count if hasher else 0,         # Okunan dosyalar
+            'hash_cached_count': hasher.cached_count if hasher else 0,    # Önbellekten gelenler
+            # Klasör kataloğu
+            'dir_catalog_entries': [(rel_dir, mtime, child_count)
+                                    for rel_dir, (mtime, child_count) in scan_result.dirs.items()],
+            'listed_dir_count': scan_result.listed_dir_count,   # Listelenen klasörler
+            'reused_dir_count': scan_result.reused_dir_count,   # Listelenmeden geçilen klasörler
+            'scan_seconds': scan_seconds                        # Kaynak tarama süresi
         }
     
+    @staticmethod
+    def get_backup_reason(compare_policy: str, mtime_tolerance: float,
+                          source_size: int, source_mtime: float,
+                          target_size: int, target_mtime: float) -> Optional[str]:
+        """Hedefte bulunan dosyanın yedeklenmesi gerekiyor mu (tarih/boyut karşılaştırması)
+        
+        COMPARE_HASH için içerik karşılaştırması analizde yapılır; burada tarih kullanılır.
+        
+        Returns:
+            Yedekleme nedeni (REASON_NEWER / REASON_SIZE_CHANGED), hedef güncelse None
+        """
+        if compare_policy == COMPARE_SIZE_MTIME and source_size != target_size:
+            return REASON_SIZE_CHANGED
+        if compare_policy in (COMPARE_MTIME_TOLERANCE, COMPARE_SIZE_MTIME):
+            # FAT/exFAT ve bazı NAS paylaşımları tarihleri yuvarlar
+            return REASON_NEWER if source_mtime > target_mtime + mtime_tolerance else None
+        return REASON_NEWER if source_mtime > target_mtime else None
+    
+    @staticmethod
+    def get_catalog_entries(files_to_backup: List) -> List[Tuple[str, int, float, int]]:
+        """Yedeklenen dosyaları dosya kataloğu kaydına çevir
+        
+        Args:
+            files_to_backup: Analiz sonucundaki yedeklenecek dosyalar (dict formatı)
+            
+        Returns:
+            [(rel_path, boyut, tarih, inode), ...] - eski format (string) kayıtlar atlanır
+        """
+        entries = []
+        for file_info in files_to_backup:
+            if isinstance(file_info, dict) and 'rel_path' in file_info:
+                entries.append((file_info['rel_path'], file_info['size'],
+                                file_info['source_mtime'], file_info.get('inode', 0)))
+        return entries
+    
     def backup_mapping(self, source_path: str, file_filter: str,
-                      exclude_filter: str, include_subdirs: bool, target_path: str) -> Dict:
+                      exclude_filter: str, include_subdirs: bool, target_path: str,
+                      compare_policy: str = COMPARE_MTIME,
+                      mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE) -> Dict:
         """Tek bir eşleşme için yedekleme yap
         
         Args:
@@ -617,6 +643,8 @@ class BackupEngine:
             exclude_filter: Hariç tutulacak dosya filtresi
             include_subdirs: Alt klasörleri dahil et
             target_path: Hedef klasör
+            compare_policy: Karşılaştırma yöntemi (COMPARE_* - hash burada tarih ile karşılaştırılır)
+            mtime_tolerance: Tarih farkı toleransı (saniye)
             
         Returns:
             {
@@ -625,7 +653,15 @@ class BackupEngine:
                 'files_skipped': int,
                 'size_copied': int,
                 'size_moved': int,
-                'size_skipped': int
+                'size_skipped': int,
+                'files_cloned': int,   # Kopyalananlardan reflink ile klonlananlar
+                'size_cloned': int,
+                'files_delta': int,    # Sadece değişen blokları yazılanlar
+                'size_delta': int,     # Bu dosyaların mantıksal boyutu
+                'bytes_written': int,  # Hedef diske fiilen yazılan byte
+                'files_appended': int, # Kopyalananlardan sadece eklenen kısmı yazılanlar
+                'files_deduplicated': int,  # Arşivde aynı içerik bulunduğundan yer kaplamayan sürümler
+                'size_deduplicated': int
             }
         """
         stats = {
@@ -634,10 +670,21 @@ class BackupEngine:
             'files_skipped': 0,
             'size_copied': 0,
             'size_moved': 0,
-            'size_skipped': 0
+            'size_skipped': 0,
+            'files_cloned': 0,
+            'size_cloned': 0,
+            'files_delta': 0,
+            'size_delta': 0,
+            'bytes_written': 0,
+            'files_appended': 0,
+            'files_deduplicated': 0,
+            'size_deduplicated': 0
         }
         
         files = self.get_files_from_mapping(source_path, file_filter, exclude_filter, include_subdirs)
+        allow_clone = self._is_same_filesystem(source_path, target_path)
+        revision_store = self._get_revision_store(target_path)
+        self._start_progress(sum(os.path.getsize(f) for f in files if os.path.exists(f)))
         
         for source_file in files:
             if self.cancelled:
@@ -658,10 +705,12 @@ class BackupEngine:
             
             # Hedefte dosya var mı kontrol et
             if os.path.exists(target_file):
-                source_mtime = os.path.getmtime(source_file)
-                target_mtime = os.path.getmtime(target_file)
+                target_stat = os.stat(target_file)
+                reason = self.get_backup_reason(compare_policy, mtime_tolerance,
+                                                file_size, os.path.getmtime(source_file),
+                                                target_stat.st_size, target_stat.st_mtime)
                 
-                if source_mtime > target_mtime:
+                if reason:
                     # Hedef dosya daha eski, REVISIONS'a taşı
                     revision_folder = self._create_revision_folder(target_path)
                     revision_file = os.path.join(revision_folder, rel_path)
@@ -670,13 +719,17 @@ class BackupEngine:
                     print(f"Creating revision folder: {os.path.dirname(revision_file)}")
                     os.makedirs(os.path.dirname(revision_file), exist_ok=True)
                     
-                    # Eski dosyayı taşı
-                    shutil.move(target_file, revision_file)
+                    # Yeni dosyayı kopyala, yerine koymadan önce eskisini taşı
+                    try:
+                        transfer = self._copy_file(source_file, target_file,
+                                                   lambda: self._archive_file(target_path, rel_path, revision_file,
+                                                                              revision_store),
+                                                   allow_clone, allow_delta=True)
+                    except CopyCancelled:
+                        break
+                    self._add_transfer(stats, transfer, file_size)
                     stats['files_moved_to_revisions'] += 1
                     stats['size_moved'] += file_size
-                    
-                    # Yeni dosyayı kopyala
-                    shutil.copy2(source_file, target_file)
                     stats['files_copied'] += 1
                     stats['size_copied'] += file_size
                     
@@ -687,13 +740,18 @@ class BackupEngine:
                     # Dosyalar aynı veya hedef daha yeni, atla
                     stats['files_skipped'] += 1
                     stats['size_skipped'] += file_size
+                    self._add_progress(file_size)
                     
                     if self.status_callback:
                         size_str = self.format_size(file_size)
                         # Mustafa self.status_callback(f"○ Atlandı (değişiklik yok): {os.path.basename(source_file)} ({size_str})")
             else:
                 # Hedefte dosya yok, direkt kopyala
-                shutil.copy2(source_file, target_file)
+                try:
+                    transfer = self._copy_file(source_file, target_file, allow_clone=allow_clone)
+                except CopyCancelled:
+                    break
+                self._add_transfer(stats, transfer, file_size)
                 stats['files_copied'] += 1
                 stats['size_copied'] += file_size
                 
@@ -701,11 +759,15 @@ class BackupEngine:
                     size_str = self.format_size(file_size)
                     self.status_callback(f"✓ Kopyalandı (yeni): {os.path.basename(source_file)} ({size_str})")
         
+        self._report_progress(force=True)
+        self._add_revision_stats(stats, revision_store)
         return stats
     
     def backup_from_analysis(self, source_path: str, target_path: str, 
                             files_to_backup: List, mirror_deletions: bool = False,
-                            deleted_files: List[Dict] = None) -> Dict:
+                            deleted_files: List[Dict] = None,
+                            compare_policy: str = COMPARE_MTIME,
+                            mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE) -> Dict:
         """Analiz sonuçlarına göre yedekleme yap (dosyaları tekrar taramadan)
         
         Args:
@@ -714,6 +776,9 @@ class BackupEngine:
             files_to_backup: Yedeklenecek dosya listesi - artık dict formatında (path, reason, vb.)
             mirror_deletions: Silinenleri yansıt (kaynakta olmayan dosyaları hedefte de sil/arşivle)
             deleted_files: Silinmiş dosyalar listesi (analiz sonucundan)
+            compare_policy: Analizde kullanılan karşılaştırma yöntemi (COMPARE_*) - kopyalamadan
+                hemen önce hedef aynı yöntemle tekrar kontrol edilir
+            mtime_tolerance: Tarih farkı toleransı (saniye)
             
         Returns:
             {
@@ -724,7 +789,18 @@ class BackupEngine:
                 'size_copied': int,
                 'size_moved': int,
                 'size_skipped': int,
-                'size_deleted': int
+                'size_deleted': int,
+                'files_cloned': int,   # Kopyalananlardan reflink ile klonlananlar
+                'size_cloned': int,
+                'files_delta': int,    # Sadece değişen blokları yazılanlar
+                'size_delta': int,     # Bu dosyaların mantıksal boyutu
+                'bytes_written': int,  # Hedef diske fiilen yazılan byte
+                'files_appended': int, # Kopyalananlardan sadece eklenen kısmı yazılanlar
+                'files_deduplicated': int,  # Arşivde aynı içerik bulunduğundan yer kaplamayan sürümler
+                'size_deduplicated': int,
+                'copied_files': [file_info, ...]  # Hedefe fiilen yazılanlar (COPY_NEW / COPY_REVISED /
+                                                  # COPY_APPENDED) - atlanan, kaynakta bulunamayan,
+                                                  # iptal edilen ve hata veren dosyalar yer almaz
             }
         """
         stats = {
@@ -735,65 +811,60 @@ class BackupEngine:
             'size_copied': 0,
             'size_moved': 0,
             'size_skipped': 0,
-            'size_deleted': 0
+            'size_deleted': 0,
+            'files_cloned': 0,
+            'size_cloned': 0,
+            'files_delta': 0,
+            'size_delta': 0,
+            'bytes_written': 0,
+            'files_appended': 0,
+            'files_deduplicated': 0,
+            'size_deduplicated': 0,
+            'copied_files': []
         }
         
-        for file_info in files_to_backup:
-            if self.cancelled:
-                break
-            
-            # Yeni format: dict ile gelebilir veya eski format: string
-            if isinstance(file_info, dict):
-                source_file = file_info['path']
-            else:
-                source_file = file_info  # Eski format uyumluluğu
-            
-            if not os.path.exists(source_file):
-                continue
-            
-            # Hedef dosya yolunu oluştur
-            rel_path = os.path.relpath(source_file, source_path)
-            target_file = os.path.join(target_path, rel_path)
-            
-            # Dosya boyutu
-            file_size = os.path.getsize(source_file)
-            
-            # Hedef klasörü oluştur
-            os.makedirs(os.path.dirname(target_file), exist_ok=True)
-            
-            # Hedefte dosya var mı kontrol et
-            if os.path.exists(target_file):
-                source_mtime = os.path.getmtime(source_file)
-                target_mtime = os.path.getmtime(target_file)
+        # Kopyalama hattı: dosyalar sınırlı sayıda worker ile paralel kopyalanır.
+        # Sonuçlar gönderim sırasıyla işlenir - istatistik ve mesajlar sıralı kalır.
+        # Yedeklemeler sırayla çalıştığından hedef diske eşzamanlı kopya sayısını
+        # worker sayısı sınırlar.
+        workers = max(1, self.copy_workers_per_device)
+        # Aynı dosya sistemindeyse dosyalar reflink ile klonlanmaya çalışılır
+        allow_clone = self._is_same_filesystem(source_path, target_path)
+        revision_store = self._get_revision_store(target_path)
+        window = deque()
+        self._start_progress(sum(self._get_file_info_size(f) for f in files_to_backup))
+        
+        def account(item):
+            future, file_info = item
+            outcome, source_file, file_size, transfer = future.result()
+            if transfer is not None:
+                self._add_transfer(stats, transfer, file_size)
+            if outcome in (COPY_NEW, COPY_REVISED, COPY_APPENDED):
+                stats['copied_files'].append(file_info)
+            if outcome == COPY_REVISED:
+                stats['files_moved_to_revisions'] += 1
+                stats['size_moved'] += file_size
+                stats['files_copied'] += 1
+                stats['size_copied'] += file_size
                 
-                if source_mtime > target_mtime:
-                    # Hedef dosya daha eski, REVISIONS'a taşı
-                    revision_folder = self._create_revision_folder(target_path)
-                    revision_file = os.path.join(revision_folder, rel_path)
-                    
-                    # Revision klasörünü oluştur
-                    os.makedirs(os.path.dirname(revision_file), exist_ok=True)
-                    
-                    # Eski dosyayı taşı
-                    shutil.move(target_file, revision_file)
-                    stats['files_moved_to_revisions'] += 1
-                    stats['size_moved'] += file_size
-                    
-                    # Yeni dosyayı kopyala
-                    shutil.copy2(source_file, target_file)
-                    stats['files_copied'] += 1
-                    stats['size_copied'] += file_size
-                    
-                    if self.status_callback:
-                        size_str = self.format_size(file_size)
-                        self.status_callback(f"✓ Kopyalandı (eski sürüm arşivlendi): {os.path.basename(source_file)} ({size_str})")
-                else:
-                    # Dosyalar aynı veya hedef daha yeni, atla
-                    stats['files_skipped'] += 1
-                    stats['size_skipped'] += file_size
-            else:
-                # Hedefte dosya yok, direkt kopyala
-                shutil.copy2(source_file, target_file)
+                if self.status_callback:
+                    size_str = self.format_size(file_size)
+                    self.status_callback(f"✓ Kopyalandı (eski sürüm arşivlendi): {os.path.basename(source_file)} ({size_str})")
+            elif outcome == COPY_APPENDED:
+                # Eski sürüm yeni sürümün başı olduğundan arşivlenmez
+                stats['files_copied'] += 1
+                stats['size_copied'] += file_size
+                stats['files_appended'] += 1
+                
+                if self.status_callback:
+                    size_str = self.format_size(file_size)
+                    added_str = self.format_size(transfer.written)
+                    self.status_callback(f"✓ Sonuna eklendi (+{added_str}): {os.path.basename(source_file)} ({size_str})")
+            elif outcome == COPY_SKIPPED:
+                # Dosyalar aynı veya hedef daha yeni, atla
+                stats['files_skipped'] += 1
+                stats['size_skipped'] += file_size
+            elif outcome == COPY_NEW:
                 stats['files_copied'] += 1
                 stats['size_copied'] += file_size
                 
@@ -801,6 +872,27 @@ class BackupEngine:
                     size_str = self.format_size(file_size)
                     self.status_callback(f"✓ Kopyalandı (yeni): {os.path.basename(source_file)} ({size_str})")
         
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for file_info in files_to_backup:
+                if self.cancelled:
+                    break
+                
+                window.append((executor.submit(self._backup_file, source_path, target_path,
+                                               file_info, allow_clone,
+                                               compare_policy, mtime_tolerance, revision_store),
+                               file_info))
+                # Bellekte sınırlı sayıda bekleyen iş tutulur
+                if len(window) >= workers * 4:
+                    account(window.popleft())
+            
+            while window:
+                account(window.popleft())
+        finally:
+            # Hata durumunda başlamamış kopyalamalar çalıştırılmaz
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._report_progress(force=True)
+        
         # Mirror deletions: Silinenleri yansıt
         if mirror_deletions and deleted_files:
             revision_folder = self._create_revision_folder(target_path)
@@ -821,13 +913,13 @@ class BackupEngine:
                     rel_path = os.path.relpath(target_file, target_path)
                     
                     # _REVISIONS'a "sil_" prefix'i ile taşı
-                    revision_file = os.path.join(revision_folder, f"sil_{rel_path}")
+                    revision_file = os.path.join(revision_folder, f"{DELETED_PREFIX}{rel_path}")
                     
                     # Revision klasörünü oluştur
                     os.makedirs(os.path.dirname(revision_file), exist_ok=True)
                     
                     # Dosyayı taşı
-                    shutil.move(target_file, revision_file)
+                    self._archive_file(target_path, rel_path, revision_file, revision_store)
                     stats['files_deleted'] += 1
                     stats['size_deleted'] += file_size
                     
@@ -838,8 +930,321 @@ class BackupEngine:
                     if self.status_callback:
                         self.status_callback(f"⚠ Silme hatası: {os.path.basename(target_file)} - {str(e)}")
         
+        self._add_revision_stats(stats, revision_store)
         return stats
     
+    def _backup_file(self, source_path: str, target_path: str, file_info,
+                     allow_clone: bool = False,
+                     compare_policy: str = COMPARE_MTIME,
+                     mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE,
+                     revision_store: Optional[RevisionStore] = None) -> Tuple[Optional[str], str, int, Optional[CopyResult]]:
+        """Tek bir dosyayı yedekle (kopyalama hattındaki worker'lar çalıştırır)
+        
+        Yeni dosya önce geçici isimle kopyalanır; hedefte eski sürüm varsa yenisi
+        yerine konmadan hemen önce _REVISIONS'a taşınır (depo verildiyse tekilleştirilerek).
+        
+        Returns:
+            (sonuç, kaynak_dosya, boyut, kopyalama_sonucu) - sonuç COPY_NEW / COPY_REVISED /
+            COPY_SKIPPED, dosya kaynakta yoksa ya da işlem iptal edildiyse None.
+            Kopyalama yapılmadıysa kopyalama_sonucu None olur.
+        """
+        # Yeni format: dict ile gelebilir veya eski format: string
+        if isinstance(file_info, dict):
+            source_file = file_info['path']
+            # İçerik karşılaştırmasında değiştiği görülen dosya, tarihi eski olsa da kopyalanır
+            content_changed = file_info.get('reason') == REASON_CONTENT_CHANGED
+            appended = file_info.get('reason') == REASON_APPENDED
+        else:
+            source_file = file_info  # Eski format uyumluluğu
+            content_changed = False
+            appended = False
+        
+        if self.cancelled or not os.path.exists(source_file):
+            return None, source_file, 0, None
+        
+        # Hedef dosya yolunu oluştur
+        rel_path = os.path.relpath(source_file, source_path)
+        target_file = os.path.join(target_path, rel_path)
+        
+        # Dosya boyutu
+        file_size = os.path.getsize(source_file)
+        
+        # Hedef klasörü oluştur
+        os.makedirs(os.path.dirname(target_file), exist_ok=True)
+        
+        # Hedefte dosya var mı kontrol et
+        if os.path.exists(target_file):
+            target_stat = os.stat(target_file)
+            reason = self.get_backup_reason(compare_policy, mtime_tolerance,
+                                            file_size, os.path.getmtime(source_file),
+                                            target_stat.st_size, target_stat.st_mtime)
+            
+            if not reason and not content_changed and not appended:
+                self._add_progress(file_size)
+                return COPY_SKIPPED, source_file, file_size, None
+            
+            # Analizden sonra hedef değişmediyse sadece eklenen kısım yazılır
+            old_size = target_stat.st_size
+            if appended and is_appended(source_file, target_file, old_size):
+                self._add_progress(old_size)
+                try:
+                    transfer = append_tail(source_file, target_file, old_size,
+                                           lambda: self.cancelled, self._add_progress)
+                except CopyCancelled:
+                    return None, source_file, 0, None
+                return COPY_APPENDED, source_file, file_size, transfer
+            
+            # Hedef dosya daha eski, REVISIONS'a taşı
+            revision_folder = self._create_revision_folder(target_path)
+            revision_file = os.path.join(revision_folder, rel_path)
+            
+            # Revision klasörünü oluştur
+            os.makedirs(os.path.dirname(revision_file), exist_ok=True)
+            
+            # Yeni dosyayı kopyala, yerine koymadan önce eskisini taşı
+            try:
+                transfer = self._copy_file(source_file, target_file,
+                                           lambda: self._archive_file(target_path, rel_path, revision_file,
+                                                                      revision_store),
+                                           allow_clone, allow_delta=True)
+            except CopyCancelled:
+                return None, source_file, 0, None
+            return COPY_REVISED, source_file, file_size, transfer
+        
+        # Hedefte dosya yok, direkt kopyala
+        try:
+            transfer = self._copy_file(source_file, target_file, allow_clone=allow_clone)
+        except CopyCancelled:
+            return None, source_file, 0, None
+        return COPY_NEW, source_file, file_size, transfer
+
+    def _copy_file(self, source_file: str, target_file: str,
+                   before_replace: Optional[Callable[[], None]] = None,
+                   allow_clone: bool = False, allow_delta: bool = False) -> CopyResult:
+        """Dosyayı iptal edilebilir şekilde kopyala ve byte ilerlemesini bildir
+        
+        Args:
+            allow_clone: Kaynak ve hedef aynı dosya sisteminde - reflink denenir
+            allow_delta: Hedefte eski sürüm var - dosya delta_min_size'dan büyükse
+                sadece değişen bloklar yazılır (hedefin dosya sistemi reflink desteklemeli)
+        
+        Raises:
+            CopyCancelled: İşlem iptal edildi (hedef değişmedi)
+        """
+        cancel_check = lambda: self.cancelled
+        # Kaynak klonlanabiliyorsa hiç veri yazılmaz - blok farkına gerek yok
+        if (allow_delta and not allow_clone and self.delta_min_size > 0
+                and os.path.getsize(source_file) >= self.delta_min_size):
+            transfer = delta_copy_file(source_file, target_file, cancel_check,
+                                       self._add_progress, before_replace)
+            if transfer is not None:
+                return transfer
+        return copy_file(source_file, target_file,
+                         cancel_check=cancel_check,
+                         progress=self._add_progress,
+                         before_replace=before_replace,
+                         allow_clone=allow_clone)
+    
+    @staticmethod
+    def _add_transfer(stats: Dict, transfer: CopyResult, file_size: int):
+        """Kopyalama sonucunu (klon / blok farkı / yazılan byte) istatistiklere ekle"""
+        stats['bytes_written'] += transfer.written
+        if transfer.cloned:
+            stats['files_cloned'] += 1
+            stats['size_cloned'] += transfer.cloned
+        if transfer.delta:
+            stats['files_delta'] += 1
+            stats['size_delta'] += file_size
+    
+    @staticmethod
+    def _is_same_filesystem(source_path: str, target_path: str) -> bool:
+        """Kaynak ve hedef aynı dosya sisteminde mi (reflink sadece bu durumda mümkün)"""
+        return get_device_id(source_path) == get_device_id(target_path)
+    
+    @staticmethod
+    def _get_file_info_size(file_info) -> int:
+        """Yedeklenecek dosyanın boyutu (analiz sonucunda yoksa diskten okunur)"""
+        if isinstance(file_info, dict) and 'size' in file_info:
+            return file_info['size']
+        path = file_info['path'] if isinstance(file_info, dict) else file_info
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    # ==================== İLERLEME İŞLEMLERİ ====================
+    
+    def _start_progress(self, total_bytes: int):
+        """Byte ilerlemesini sıfırla"""
+        with self._progress_lock:
+            self._bytes_copied = 0
+            self._bytes_total = total_bytes
+            self._last_progress_time = 0.0
+        self._report_progress(force=True)
+    
+    def _add_progress(self, byte_count: int):
+        """Kopyalanan byte'ları ekle (worker thread'lerden çağrılır)"""
+        with self._progress_lock:
+            self._bytes_copied += byte_count
+        self._report_progress()
+    
+    def _report_progress(self, force: bool = False):
+        """İlerlemeyi callback'e bildir (PROGRESS_INTERVAL ile seyreltilmiş)"""
+        if not self.progress_callback:
+            return
+        with self._progress_lock:
+            now = time.monotonic()
+            if not force and now - self._last_progress_time < PROGRESS_INTERVAL:
+                return
+            self._last_progress_time = now
+            copied = min(self._bytes_copied, self._bytes_total)
+            total = self._bytes_total
+        self.progress_callback(copied, total)
+    
+    def _get_revision_store(self, target_path: str) -> Optional[RevisionStore]:
+        """Hedefin arşiv deposunu getir (tekilleştirme kapalıysa None)"""
+        if not self.dedup_revisions:
+            return None
+        return RevisionStore(os.path.join(target_path, '_REVISIONS'))
+    
+    def _archive_file(self, target_path: str, rel_path: str, revision_file: str,
+                      revision_store: Optional[RevisionStore] = None):
+        """Hedefteki dosyayı _REVISIONS'a taşı ve arşiv indeksi için kaydet
+        
+        Depo varsa aynı içerik tekrar yer kaplamaz.
+        """
+        file_path = os.path.join(target_path, rel_path)
+        file_size = os.path.getsize(file_path)
+        deduplicated = False
+        if revision_store is not None:
+            deduplicated = revision_store.archive(file_path, revision_file)
+        else:
+            shutil.move(file_path, revision_file)
+        
+        revisions_path = os.path.join(target_path, '_REVISIONS')
+        revision_folder, stored_path = os.path.relpath(revision_file, revisions_path).split(os.sep, 1)
+        self.archived_revisions.append((
+            os.path.normpath(target_path), revision_folder, stored_path, os.path.normpath(rel_path),
+            file_size, 0 if deduplicated else file_size, datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ))
+    
+    def pop_archived_revisions(self) -> List[Tuple[str, str, str, str, int, int, str]]:
+        """Son çağrıdan beri _REVISIONS'a taşınan sürümleri getir ve listeyi boşalt
+        
+        Returns:
+            [(target_path, revision_folder, stored_path, rel_path, file_size, disk_size,
+              archived_date), ...] - tekilleştirilen sürümlerin disk_size değeri 0
+        """
+        archived, self.archived_revisions = self.archived_revisions, []
+        return archived
+    
+    @staticmethod
+    def refresh_disk_sizes(archived: List[Tuple]) -> List[Tuple]:
+        """Sıkıştırmadan sonra arşivlenen sürümlerin diskte kapladığı alanı güncelle"""
+        refreshed = []
+        for target_path, revision_folder, stored_path, rel_path, file_size, disk_size, archived_date in archived:
+            if disk_size:
+                existing = find_revision_file(os.path.join(target_path, '_REVISIONS', revision_folder, stored_path))
+                if existing is not None and is_compressed_revision(existing):
+                    try:
+                        disk_size = os.path.getsize(existing)
+                    except OSError:
+                        pass
+            refreshed.append((target_path, revision_folder, stored_path, rel_path, file_size, disk_size, archived_date))
+        return refreshed
+    
+    def scan_revisions(self, target_path: str) -> List[Dict]:
+        """_REVISIONS klasörünü tarayarak arşiv sürümlerini listele (arşiv indeksini yenilemek için)
+        
+        Sıkıştırılmış sürümler arşivlendikleri adla, silinen dosyalar ön eksiz göreli
+        yollarıyla listelenir. Tekilleştirme deposu (_STORE) sürüm sayılmaz; hard link'li
+        sürümlerin disk alanı bir kez sayılır.
+        
+        Returns:
+            [{'revision_folder', 'stored_path', 'rel_path', 'file_size' (orijinal boyut),
+              'disk_size', 'archived_date'}, ...]
+        """
+        revisions_path = os.path.join(os.path.normpath(target_path), '_REVISIONS')
+        entries = []
+        if not os.path.isdir(revisions_path):
+            return entries
+        
+        seen_links = set()  # Hard link'li sürümler diskte bir kez sayılır
+        try:
+            for revision_folder in sorted(os.listdir(revisions_path)):
+                folder_path = os.path.join(revisions_path, revision_folder)
+                # Tekilleştirme deposundaki içerikler sürüm değil - sürümler tarih klasörlerinde
+                if revision_folder == STORE_DIR or not os.path.isdir(folder_path):
+                    continue
+                try:
+                    archived_date = datetime.strptime(revision_folder, '%Y-%m-%d %H-%M').strftime('%Y-%m-%d %H:%M:%S')
+                except ValueError:
+                    archived_date = datetime.fromtimestamp(os.path.getmtime(folder_path)).strftime('%Y-%m-%d %H:%M:%S')
+                
+                for root, dirs, filenames in os.walk(folder_path):
+                    if self.cancelled:
+                        return entries
+                    for filename in filenames:
+                        if filename.endswith(COMPRESS_TEMP_SUFFIX):
+                            continue
+                        file_path = os.path.join(root, filename)
+                        try:
+                            st = os.stat(file_path)
+                        except OSError:
+                            continue
+                        disk_size = st.st_size
+                        if st.st_nlink > 1:
+                            link_key = (st.st_dev, st.st_ino)
+                            if link_key in seen_links:
+                                disk_size = 0
+                            seen_links.add(link_key)
+                        file_size = st.st_size
+                        if is_compressed_revision(file_path):
+                            file_size = get_logical_size(file_path, st.st_size)
+                        
+                        stored_path = strip_compressed_suffix(os.path.relpath(file_path, folder_path))
+                        rel_path = stored_path[len(DELETED_PREFIX):] if stored_path.startswith(DELETED_PREFIX) else stored_path
+                        entries.append({
+                            'revision_folder': revision_folder,
+                            'stored_path': stored_path,
+                            'rel_path': rel_path,
+                            'file_size': file_size,
+                            'disk_size': disk_size,
+                            'archived_date': archived_date
+                        })
+        except OSError:
+            # Erişim hatası durumunda bulunanlarla devam et
+            pass
+        return entries
+    
+    @staticmethod
+    def summarize_revisions(target_path: str, entries: List[Dict], max_files: int) -> Dict:
+        """Arşiv sürümlerinden analiz raporundaki _REVISIONS özetini hazırla
+        
+        Returns:
+            {'count': int, 'size': int (orijinal boyut), 'disk_size': int,
+             'files': [{'path', 'size', 'timestamp_folder'}, ...] (en yeni ilk max_files sürüm)}
+        """
+        revisions_path = os.path.join(os.path.normpath(target_path), '_REVISIONS')
+        newest = sorted(entries, key=lambda e: e['archived_date'], reverse=True)[:max_files]
+        return {
+            'count': len(entries),
+            'size': sum(e['file_size'] for e in entries),
+            'disk_size': sum(e['disk_size'] for e in entries),
+            'files': [{
+                'path': os.path.join(revisions_path, e['revision_folder'], e['stored_path']),
+                'size': e['file_size'],
+                'timestamp_folder': e['revision_folder']
+            } for e in newest]
+        }
+    
+    @staticmethod
+    def _add_revision_stats(stats: Dict, revision_store: Optional[RevisionStore]):
+        """Depoda zaten bulunan (yeni yer kaplamayan) arşiv sürümlerini istatistiklere ekle"""
+        if revision_store is not None:
+            stats['files_deduplicated'] = revision_store.deduplicated_count
+            stats['size_deduplicated'] = revision_store.deduplicated_size
+    
     def _create_revision_folder(self, target_path: str) -> str:
         """_REVISIONS klasörü oluştur
         
@@ -852,8 +1257,100 @@ class BackupEngine:
         now = datetime.now().strftime('%Y-%m-%d %H-%M')
         revision_folder = os.path.join(target_path, '_REVISIONS', now)
         os.makedirs(revision_folder, exist_ok=True)
+        self.revision_folders.add(revision_folder)
         return revision_folder
     
+    def prune_revisions(self, target_path: str, entries: List[Dict],
+                        policy: RetentionPolicy, dry_run: bool = True) -> Dict:
+        """Saklama politikasına göre _REVISIONS'daki eski sürümleri temizle
+        
+        Klasör taranmaz - sürümler arşiv indeksinden gelir. Sıkıştırılmış sürümler ve
+        tekilleştirme deposunda artık bağlı sürümü kalmayan içerikler de silinir.
+        
+        Args:
+            target_path: Hedef klasör
+            entries: Hedefin arşiv indeksi kayıtları (get_revision_entries)
+            policy: Saklama kuralları
+            dry_run: True ise hiçbir dosya silinmez, sadece silinecekler listelenir
+            
+        Returns:
+            {
+                'kept': [kayıtlar], 'pruned': [silinen (dry_run'da silinecek) kayıtlar],
+                'kept_size': int, 'pruned_size': int,
+                'missing': int,   # İndekste olup diskte bulunamayan (indeksten silinir)
+                'errors': int     # Silinemeyen (pruned listesine alınmaz)
+            }
+        """
+        keep, prune = plan_retention(entries, policy)
+        result = {
+            'kept': keep,
+            'pruned': prune,
+            'kept_size': sum(e.get('file_size') or 0 for e in keep),
+            'pruned_size': sum(e.get('file_size') or 0 for e in prune),
+            'missing': 0,
+            'errors': 0
+        }
+        if dry_run or not prune:
+            return result
+        
+        revisions_path = os.path.join(target_path, '_REVISIONS')
+        store = RevisionStore(revisions_path) if os.path.isdir(os.path.join(revisions_path, STORE_DIR)) else None
+        pruned = []
+        for entry in prune:
+            if self.cancelled:
+                break
+            revision_file = os.path.join(revisions_path, entry['revision_folder'], entry['stored_path'])
+            existing = find_revision_file(revision_file)
+            if existing is None:
+                result['missing'] += 1
+                pruned.append(entry)
+                continue
+            try:
+                blob = store.resolve(revision_file) if store is not None else None
+                os.remove(existing)
+                # Depodaki içeriğe bağlı başka sürüm kalmadıysa içerik de silinir
+                if blob is not None and os.stat(blob).st_nlink == 1:
+                    os.remove(blob)
+                    self._remove_empty_dirs(os.path.dirname(blob), store.store_path)
+            except OSError as e:
+                result['errors'] += 1
+                if self.status_callback:
+                    self.status_callback(f"⚠ Arşiv silinemedi: {existing} - {str(e)}")
+                continue
+            pruned.append(entry)
+            self._remove_empty_dirs(os.path.dirname(existing), revisions_path)
+        
+        result['pruned'] = pruned
+        result['pruned_size'] = sum(e.get('file_size') or 0 for e in pruned)
+        return result
+    
+    @staticmethod
+    def _remove_empty_dirs(folder: str, stop_at: str):
+        """Boşalan klasörleri stop_at klasörüne kadar yukarı doğru sil"""
+        stop_at = os.path.normpath(stop_at)
+        folder = os.path.normpath(folder)
+        while folder != stop_at and folder.startswith(stop_at):
+            try:
+                os.rmdir(folder)
+            except OSError:
+                return
+            folder = os.path.dirname(folder)
+    
+    def compress_revisions(self, method: str) -> Dict:
+        """Bu yedeklemede arşivlenen sürümleri sıkıştır (yedekleme bittikten sonra)
+        
+        Args:
+            method: Sıkıştırma yöntemi (sm_revision_compress.COMPRESS_*)
+            
+        Returns:
+            RevisionCompressor.compress_folders() istatistikleri
+        """
+        folders = sorted(self.revision_folders)
+        self.revision_folders.clear()
+        if self.status_callback and folders:
+            self.status_callback(f"🗜 Arşivlenen sürümler sıkıştırılıyor ({len(folders)} klasör)...")
+        return RevisionCompressor(method).compress_folders(folders, lambda: self.cancelled)
+    
     @staticmethod
     def format_size(size_bytes: int) -> str:
         """Boyutu okunabilir formata çevir
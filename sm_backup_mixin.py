@@ -8,8 +8,12 @@ Bu modül SmartBackupApp sınıfı için yedekleme işlemlerini içerir.
 
 import os
 import time
+import queue
 import threading
-from sm_backup_engine import BackupEngine
+from sm_backup_engine import BackupEngine, COMPARE_MTIME, COMPARE_HASH, DEFAULT_MTIME_TOLERANCE
+from sm_scanner import EXCLUDED_STATS_FULL, EXCLUDED_STATS_SIZE, EXCLUDED_STATS_NONE
+from sm_parallel import run_by_device, get_mapping_devices, DEFAULT_MAX_WORKERS
+from sm_hasher import FileHasher
 from sm_ui_components import (ProgressDialog, ConfirmDialog, 
                                BackupSelectionDialog, AnalysisSelectionDialog)
 from sm_deleted_files_dialog import DeletedFilesConfirmDialog
@@ -40,37 +44,153 @@ class BackupMixin:
         self.update_idletasks()
         # self.log_textbox.update_idletasks()
 
-        total_files = 0
-        total_size = 0
-        total_excluded = 0
-        total_excluded_size = 0
-        
-        for idx, mapping in enumerate(mappings, 1):
-            # Log'a eşleşme bilgisi yaz
-            self._log_write(f"\n[{idx}] {mapping['source_path']}", "#FFAE35")
-            self._log_write(f"    Filtre: {mapping['file_filter']}", "#ADADAD")
-            if mapping.get('exclude_filter'):
-                self._log_write(f"    Hariç: {mapping.get('exclude_filter')}", "#ADADAD")
-            
-            file_count, size, excluded_count, excluded_size = self.backup_engine.calculate_mapping_stats(
+        totals = {
+            'files': 0,
+            'size': 0,
+            'excluded': 0,
+            'excluded_size': 0
+        }
+        
+        # Hesaplama ayrı thread'de yapılır; sonuçlar kuyruk üzerinden arayüze aktarılır
+        result_queue = queue.Queue()
+        
+        # Engine durum mesajları da kuyruğa gider - worker thread'ler arayüze dokunmaz
+        def status_callback(message: str):
+            result_queue.put(('status', message))
+        
+        self.backup_engine.set_status_callback(status_callback)
+        # Önceki iptal edilen analizin bayrağı taramayı durdurmasın
+        self.backup_engine.reset_cancel()
+        
+        # Analiz dialogunda seçilen paralel çalışma ayarları hesaplamada da kullanılır
+        selections = self.db.get_analysis_selections(self.current_project_id)
+        parallel_plan = self._get_parallel_plan(
+            mappings, selections['parallel_analysis'], selections['per_device_limit']
+        )
+        
+        # Progress dialog aç - İptal butonu hesaplamayı durdurur
+        progress_dialog = ProgressDialog(self, "Hesaplama İşlemi")
+        
+        threading.Thread(
+            target=self._calculation_worker,
+            args=(mappings, parallel_plan, result_queue),
+            daemon=True
+        ).start()
+        
+        self.after(100, lambda: self._drain_calculation_queue(
+            result_queue, progress_dialog, len(mappings), totals
+        ))
+    
+    def _calculation_worker(self, mappings: list, parallel_plan: tuple, result_queue: queue.Queue):
+        """Eşleşmelerin kaynak istatistiklerini arka planda hesapla (arayüze dokunmaz)
+        
+        Kuyruğa konan mesajlar:
+            ('running', idx, mapping)               - eşleşmenin hesaplaması başladı
+            ('result', idx, mapping, stats, hata)   - eşleşmenin hesaplaması tamamlandı
+            ('status', mesaj)                       - engine durum mesajı
+            ('done', None)                          - tüm hesaplama bitti (ya da iptal edildi)
+        """
+        def calculate(mapping: dict):
+            stats = self.backup_engine.calculate_mapping_stats(
                 mapping['source_path'],
                 mapping['file_filter'],
                 mapping.get('exclude_filter', ''),
                 bool(mapping['include_subdirs'])
             )
+            # İptal edilen taramanın sonucu eksiktir
+            return stats, self.backup_engine.cancelled
+        
+        max_workers, per_device_limit, devices = parallel_plan
+        try:
+            # Sonuçlar eşleşme sırasıyla gelir
+            for index, mapping, output, error in run_by_device(
+                    mappings, devices, calculate, max_workers, per_device_limit,
+                    cancel_check=lambda: self.backup_engine.cancelled,
+                    on_start=lambda i, m: result_queue.put(('running', i + 1, m))):
+                if error is not None:
+                    result_queue.put(('result', index + 1, mapping, None, str(error)))
+                    continue
+                
+                stats, cancelled = output
+                if cancelled:
+                    continue
+                result_queue.put(('result', index + 1, mapping, stats, None))
+        finally:
+            result_queue.put(('done', None))
+    
+    def _drain_calculation_queue(self, result_queue: queue.Queue, progress_dialog: ProgressDialog,
+                                 mapping_count: int, totals: dict):
+        """Hesaplama kuyruğundaki mesajları arayüze aktar (ana thread'de zamanlayıcı ile çalışır)"""
+        # Dialog iptal edilirse engine'i de iptal et
+        if progress_dialog.cancelled and not self.backup_engine.cancelled:
+            self.backup_engine.cancel()
+            self.stats_label.configure(text="Hesaplama iptal ediliyor...")
+        
+        while True:
+            try:
+                message = result_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Eşleşme sonuçlarını logla
-            if file_count == 0 and excluded_count == 0:
-                self._log_write(f"    → Dosya bulunamadı!", "#FF0000")
-            else:
-                self._log_write(f"    → {file_count} dosya ({BackupEngine.format_size(size)})", "#01F001")
-                if excluded_count > 0:
-                    self._log_write(f"    → Hariç: {excluded_count} dosya ({BackupEngine.format_size(excluded_size)})", "#FFA500")
-            
-            total_files += file_count
-            total_size += size
-            total_excluded += excluded_count
-            total_excluded_size += excluded_size
+            kind = message[0]
+            if kind == 'status':
+                progress_dialog.update_detail(message[1])
+            elif kind == 'running':
+                _, idx, mapping = message
+                progress_dialog.update_status(f"Eşleşme {idx}/{mapping_count} hesaplanıyor...")
+                progress_dialog.update_detail(mapping['source_path'])
+            elif kind == 'result':
+                _, idx, mapping, stats, error = message
+                progress_dialog.update_progress(idx / mapping_count)
+                self._log_calculation_result(idx, mapping, stats, error, totals)
+            elif kind == 'done':
+                if not progress_dialog.is_closed:
+                    progress_dialog.destroy()
+                # Engine kuyruğu bu hesaplamaya ait - sonraki işlemlere mesaj aktarılmaz
+                self.backup_engine.set_status_callback(None)
+                self._finish_calculation(totals)
+                return
+        
+        self.after(100, lambda: self._drain_calculation_queue(
+            result_queue, progress_dialog, mapping_count, totals
+        ))
+    
+    def _log_calculation_result(self, idx: int, mapping: dict, stats, error, totals: dict):
+        """Bir eşleşmenin hesaplama sonucunu toplamlara ekle ve log'a yaz"""
+        # Log'a eşleşme bilgisi yaz
+        self._log_write(f"\n[{idx}] {mapping['source_path']}", "#FFAE35")
+        self._log_write(f"    Filtre: {mapping['file_filter']}", "#ADADAD")
+        if mapping.get('exclude_filter'):
+            self._log_write(f"    Hariç: {mapping.get('exclude_filter')}", "#ADADAD")
+        
+        if error is not None:
+            self._log_write(f"    ❌ Hesaplama hatası: {error}", "#FF0000")
+            return
+        
+        file_count, size, excluded_count, excluded_size = stats
+        
+        # Eşleşme sonuçlarını logla
+        if file_count == 0 and excluded_count == 0:
+            self._log_write(f"    → Dosya bulunamadı!", "#FF0000")
+        else:
+            self._log_write(f"    → {file_count} dosya ({BackupEngine.format_size(size)})", "#01F001")
+            if excluded_count > 0:
+                self._log_write(f"    → Hariç: {excluded_count} dosya ({BackupEngine.format_size(excluded_size)})", "#FFA500")
+        
+        totals['files'] += file_count
+        totals['size'] += size
+        totals['excluded'] += excluded_count
+        totals['excluded_size'] += excluded_size
+    
+    def _finish_calculation(self, totals: dict):
+        """Hesaplama bittiğinde özeti log'a ve durum satırına yaz"""
+        total_files = totals['files']
+        total_size = totals['size']
+        total_excluded = totals['excluded']
+        total_excluded_size = totals['excluded_size']
+        
+        if self.backup_engine.cancelled:
+            self._log_write("\n⚠️ Hesaplama iptal edildi - toplamlar sadece tamamlanan eşleşmeleri içerir", "#FF6B6B")
         
         # Özet
         self._log_write("\n" + "=" * 80, "#00A0E9")
@@ -127,8 +247,19 @@ class BackupMixin:
         show_skipped_files = result.get('show_skipped_files', True)
         show_revision_files = result.get('show_revision_files', True)
         show_deleted_files = result.get('show_deleted_files', True)
+        calculate_excluded_stats = result.get('calculate_excluded_stats', True)
+        trust_catalog = result.get('trust_catalog', False)
         max_files_to_show = result.get('max_files_to_show', 50)
         
+        # Hariç tutulan dosyalar listelenmeyecekse tamamen hariç klasörlere girilmez,
+        # istatistik de istenmiyorsa bu klasörler hiç taranmaz
+        if not calculate_excluded_stats:
+            excluded_stats = EXCLUDED_STATS_NONE
+        elif show_user_excluded_files or show_hidden_excluded_files:
+            excluded_stats = EXCLUDED_STATS_FULL
+        else:
+            excluded_stats = EXCLUDED_STATS_SIZE
+        
         # -1 ise tümünü göster (çok büyük sayı)
         if max_files_to_show == -1:
             max_files_to_show = 999999
@@ -157,118 +288,337 @@ class BackupMixin:
             ConfirmDialog.show_warning(self, "Hedef Disklere Erişilemiyor", error_message)
             return
         
-        # Status callback ayarla - backup_engine'den log paneline mesaj göndermek için
-        def status_callback(message: str):
-            self.after(0, lambda msg=message: self._log_write(msg, "#FBFF2C"))
-        
-        self.backup_engine.set_status_callback(status_callback)
-        
         # Log temizle ve başlat
         self._log_clear()
         self._log_write("=" * 80, "#00A0E9")
         self._log_write("ANALİZ İŞLEMİ", "#A9E4FF")
         self._log_write("=" * 80, "#00A0E9")
-        
-        # Analiz süresini ölç
-        analysis_start_time = time.time()
 
         self.stats_label.configure(text="Hesaplanıyor...")                    
-        self.update_idletasks()
-        
-        total_files = 0
-        total_size = 0
-        total_excluded = 0
-        total_excluded_size = 0
-        total_skipped = 0
-        total_skipped_size = 0
         
         # Analiz sonuçlarını sakla - yedekleme için kullanılacak
         # Önceki analiz sonuçlarını temizle
         self.analysis_results = {}
         
-        for idx, mapping in enumerate(selected_mappings, 1):
-            self.stats_label.configure(text=f"Hesaplanıyor: {mapping['source_path']}")  
-            self.update_idletasks()
-            # Log'a eşleşme bilgisi yaz
-            self._log_write(f"\n[{idx}/{len(selected_mappings)}] {mapping['source_path']}", "#FFAE35")
-            self._log_write(f"    Hedef: {mapping['target_path']}", "#ADADAD")
-            self._log_write(f"    Filtre: {mapping['file_filter']}", "#ADADAD")
-            if mapping.get('exclude_filter'):
-                self._log_write(f"    Hariç: {mapping.get('exclude_filter')}", "#ADADAD")
-            
+        options = {
+            'selected_mapping_ids': selected_mapping_ids,
+            'show_backup_files': show_backup_files,
+            'show_user_excluded_files': show_user_excluded_files,
+            'show_hidden_excluded_files': show_hidden_excluded_files,
+            'show_skipped_files': show_skipped_files,
+            'show_revision_files': show_revision_files,
+            'show_deleted_files': show_deleted_files,
+            'calculate_excluded_stats': calculate_excluded_stats,
+            'trust_catalog': trust_catalog,
+            'parallel_analysis': result.get('parallel_analysis', False),
+            'per_device_limit': result.get('per_device_limit', 1),
+            'compare_content': result.get('compare_content', False),
+            'excluded_stats': excluded_stats,
+            'max_files_to_show': max_files_to_show,
+            # Analiz süresini ölç
+            'start_time': time.time()
+        }
+        totals = {
+            'files': 0,
+            'size': 0,
+            'excluded': 0,
+            'excluded_size': 0,
+            'skipped': 0,
+            'skipped_size': 0
+        }
+        
+        # Analiz ayrı thread'de yapılır; sonuçlar kuyruk üzerinden arayüze aktarılır
+        result_queue = queue.Queue()
+        
+        # Status callback ayarla - backup_engine'den log paneline mesaj göndermek için
+        def status_callback(message: str):
+            result_queue.put(('status', message))
+        
+        self.backup_engine.set_status_callback(status_callback)
+        self.backup_engine.reset_cancel()
+        
+        # Progress dialog aç - İptal butonu analizi durdurur
+        progress_dialog = ProgressDialog(self, "Analiz İşlemi")
+        
+        threading.Thread(
+            target=self._analysis_worker,
+            args=(selected_mappings, options, result_queue),
+            daemon=True
+        ).start()
+        
+        self.after(100, lambda: self._drain_analysis_queue(
+            result_queue, progress_dialog, len(selected_mappings), options, totals
+        ))
+    
+    def _analysis_worker(self, selected_mappings: list, options: dict, result_queue: queue.Queue):
+        """Seçili eşleşmeleri arka planda analiz et (arayüze dokunmaz)
+        
+        Paralel modda farklı disklerdeki eşleşmeler aynı anda analiz edilir;
+        sonuçlar her durumda eşleşme sırasıyla kuyruğa konur.
+        
+        Kuyruğa konan mesajlar:
+            ('running', idx, mapping)        - eşleşmenin analizi başladı
+            ('start', idx, mapping)          - sıradaki eşleşmenin sonucu geliyor
+            ('result', idx, mapping, result) - eşleşmenin analizi tamamlandı
+            ('status', mesaj)                - engine durum mesajı
+            ('error', mapping, hata)         - eşleşme analiz edilemedi
+            ('done', None)                   - tüm analiz bitti (ya da iptal edildi)
+        """
+        # Eşleşmenin karşılaştırma yöntemi - analiz seçeneği açıksa tümünde içerik karşılaştırılır
+        def get_compare_policy(mapping: dict) -> str:
+            if options['compare_content']:
+                return COMPARE_HASH
+            return mapping.get('compare_policy') or COMPARE_MTIME
+        
+        # İçerik karşılaştırması: özet önbelleği bir kez okunur, tüm eşleşmeler paylaşır
+        hash_cache = None
+        if any(get_compare_policy(m) == COMPARE_HASH for m in selected_mappings):
+            hash_cache = self.db.get_hash_cache()
+        
+        def analyze(mapping: dict):
             # Detaylı analiz yap
-            # print(f"Gösterilecek dosya sayısı: {max_files_to_show}")
-
             print(f"✨Analiz yapılıyor: {mapping['source_path']}")
+            # Son yedeklemeden kalan dosya/klasör kataloğu - değişmeyen dosyalar hedefe
+            # bakılmadan atlanır, tarihi değişmeyen klasörler yeniden listelenmez
+            # (her analiz thread'i kendi veritabanı bağlantısını kullanır)
+            catalog = self.db.get_file_catalog(mapping['id'])
+            dir_catalog = self.db.get_dir_catalog(mapping['id'])
+            revision_summary = self.db.get_revision_summary(mapping['target_path'], options['max_files_to_show'])
+            # Hedefin arşiv indeksi yoksa _REVISIONS bir kez taranarak oluşturulur,
+            # sonraki analizlerde klasör taranmaz
+            if revision_summary is None:
+                revision_entries = self.backup_engine.scan_revisions(mapping['target_path'])
+                if not self.backup_engine.cancelled:
+                    self.db.reconcile_revision_entries(mapping['target_path'], revision_entries, mapping['id'])
+                revision_summary = BackupEngine.summarize_revisions(
+                    mapping['target_path'], revision_entries, options['max_files_to_show']
+                )
+            compare_policy = get_compare_policy(mapping)
+            hasher = FileHasher(hash_cache) if compare_policy == COMPARE_HASH else None
             result = self.backup_engine.analyze_mapping_detailed(
                 mapping['source_path'],
                 mapping['file_filter'],
                 mapping.get('exclude_filter', ''),
                 bool(mapping['include_subdirs']),
                 mapping['target_path'],
-                max_files_to_show
+                options['max_files_to_show'],
+                options['excluded_stats'],
+                catalog,
+                dir_catalog,
+                options['trust_catalog'],
+                hasher,
+                compare_policy,
+                mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+                bool(mapping.get('append_only')),
+                revision_summary,
+                options['show_deleted_files']
             )
-            toplam_ncelenen_dosya = (len(result['files_to_backup']) + 
-                                    result.get('total_excluded_count', 0) + 
-                                    result['skipped_count'])
-            print(f"✅{toplam_ncelenen_dosya} dosya için Analiz tamamlandı: {mapping['source_path']}")
-            
-
-            files_to_backup = result['files_to_backup']
-            user_excluded_count = result.get('user_excluded_count', 0)
-            hidden_excluded_count = result.get('hidden_excluded_count', 0)
-            mapping_excluded_count = result.get('total_excluded_count', 0)
-            skipped_count = result['skipped_count']
-            size = result['total_size']
-            user_excluded_size = result.get('user_excluded_size', 0)
-            hidden_excluded_size = result.get('hidden_excluded_size', 0)
-            mapping_excluded_size = result.get('total_excluded_size', 0)
-            skipped_size = result['skipped_size']
-            revision_count = result.get('revision_count', 0)
-            revision_size = result.get('revision_size', 0)
-            deleted_count = result.get('deleted_count', 0)
-            deleted_size = result.get('deleted_size', 0)
-            
-            # Analiz sonuçlarını sakla
-            self.analysis_results[mapping['id']] = result
-            
-            # Toplam sayıları güncelle
-            total_files += len(files_to_backup)
-            total_size += size
-            total_excluded += mapping_excluded_count
-            total_excluded_size += mapping_excluded_size
-            total_skipped += skipped_count
-            total_skipped_size += skipped_size
-            
-            # Analiz sonuçlarını logla
-            if len(files_to_backup) == 0 and mapping_excluded_count == 0 and skipped_count == 0:
-                self._log_write(f"    → Yedeklenecek dosya bulunamadı!", "#FFA0A0")
-            else:
-                toplam_dosya = len(files_to_backup) + mapping_excluded_count + skipped_count
-                toplam_dosya_boyutu = size + mapping_excluded_size + skipped_size
-                self._log_write(f"    → Toplam incelenen dosya: {toplam_dosya:,}  ({BackupEngine.format_size(toplam_dosya_boyutu)})", "#60C2FF")
-                if len(files_to_backup) > 0:
-                    self._log_write(f"    → Yedeklenecek: {len(files_to_backup):,} dosya ({BackupEngine.format_size(size)})", "#01F001")
-                else:
-                    self._log_write(f"    → Yedeklenecek: 0 dosya", "#65FE65")
-                
-                if skipped_count > 0:
-                    self._log_write(f"    → Atlanan (güncel): {skipped_count:,} dosya ({BackupEngine.format_size(skipped_size)})", "#FFCC6C")
-                
-                if user_excluded_count > 0:
-                    self._log_write(f"    → Hariç (filtre): {user_excluded_count:,} dosya ({BackupEngine.format_size(user_excluded_size)})", "#FFA500")
+            # Yeni hesaplanan özetler iptal edilse de geçerlidir - önbelleğe yazılır
+            if hasher is not None:
+                self.db.update_hash_cache(hasher.new_entries)
+            # İptal edilen analizin sonucu eksiktir (yarım kalan tarama silinmiş dosya
+            # gibi görünür) - yedeklemede kullanılmaması için işaretlenir
+            return result, self.backup_engine.cancelled
+        
+        try:
+            max_workers, per_device_limit, devices = self._get_parallel_plan(
+                selected_mappings, options['parallel_analysis'], options['per_device_limit']
+            )
+            for index, mapping, output, error in run_by_device(
+                    selected_mappings, devices, analyze, max_workers, per_device_limit,
+                    cancel_check=lambda: self.backup_engine.cancelled,
+                    on_start=lambda i, m: result_queue.put(('running', i + 1, m))):
+                idx = index + 1
+                if error is not None:
+                    result_queue.put(('start', idx, mapping))
+                    result_queue.put(('error', mapping, str(error)))
+                    continue
                 
-                if hidden_excluded_count > 0:
-                    self._log_write(f"    → Hariç (gizli): {hidden_excluded_count:,} dosya ({BackupEngine.format_size(hidden_excluded_size)})", "#FFA500")
+                result, cancelled = output
+                if cancelled:
+                    continue
                 
-                if deleted_count > 0:
-                    self._log_write(f"    → Silinmiş (kaynakta yok): {deleted_count:,} dosya ({BackupEngine.format_size(deleted_size)})", "#FF6B6B")
+                toplam_ncelenen_dosya = (len(result['files_to_backup']) + 
+                                        result.get('total_excluded_count', 0) + 
+                                        result['skipped_count'])
+                print(f"✅{toplam_ncelenen_dosya} dosya için Analiz tamamlandı: {mapping['source_path']}")
+                result_queue.put(('start', idx, mapping))
+                result_queue.put(('result', idx, mapping, result))
+        finally:
+            result_queue.put(('done', None))
+    
+    @staticmethod
+    def _get_parallel_plan(mappings: list, parallel: bool, per_device_limit: int):
+        """Eşleşmelerin paralel çalıştırma planını hazırla
+        
+        Returns:
+            (max_workers, per_device_limit, her eşleşmenin disk listesi)
+        """
+        if not parallel or len(mappings) < 2:
+            # Sıralı mod - disk bilgisine gerek yok
+            return 1, 1, [()] * len(mappings)
+        devices = [get_mapping_devices(m) for m in mappings]
+        return DEFAULT_MAX_WORKERS, per_device_limit, devices
+    
+    def _drain_analysis_queue(self, result_queue: queue.Queue, progress_dialog: ProgressDialog,
+                              mapping_count: int, options: dict, totals: dict):
+        """Analiz kuyruğundaki mesajları arayüze aktar (ana thread'de zamanlayıcı ile çalışır)"""
+        # Dialog iptal edilirse engine'i de iptal et
+        if progress_dialog.cancelled and not self.backup_engine.cancelled:
+            self.backup_engine.cancel()
+            self.stats_label.configure(text="Analiz iptal ediliyor...")
+        
+        while True:
+            try:
+                message = result_queue.get_nowait()
+            except queue.Empty:
+                break
             
-                if revision_count > 0:
-                    self._log_write(f"    → Arşivlenmiş (_REVISIONS): {revision_count:,} dosya ({BackupEngine.format_size(revision_size)})", "#D896FF")
-                
-            # Ekranı güncelle - büyük analizlerde donma olmasın
-            self.update_idletasks()
+            kind = message[0]
+            if kind == 'status':
+                self._log_write(message[1], "#FBFF2C")
+            elif kind == 'running':
+                _, idx, mapping = message
+                self.stats_label.configure(text=f"Hesaplanıyor: {mapping['source_path']}")  
+                progress_dialog.update_status(f"Eşleşme {idx}/{mapping_count} analiz ediliyor...")
+                progress_dialog.update_detail(mapping['source_path'])
+            elif kind == 'start':
+                _, idx, mapping = message
+                # Log'a eşleşme bilgisi yaz
+                self._log_write(f"\n[{idx}/{mapping_count}] {mapping['source_path']}", "#FFAE35")
+                self._log_write(f"    Hedef: {mapping['target_path']}", "#ADADAD")
+                self._log_write(f"    Filtre: {mapping['file_filter']}", "#ADADAD")
+                if mapping.get('exclude_filter'):
+                    self._log_write(f"    Hariç: {mapping.get('exclude_filter')}", "#ADADAD")
+            elif kind == 'result':
+                _, idx, mapping, result = message
+                progress_dialog.update_progress(idx / mapping_count)
+                self._log_analysis_result(mapping, result, options, totals)
+            elif kind == 'error':
+                _, mapping, error = message
+                self._log_write(f"    ❌ Analiz hatası: {error}", "#FF0000")
+            elif kind == 'done':
+                if not progress_dialog.is_closed:
+                    progress_dialog.destroy()
+                # Engine kuyruğu bu analize ait - sonraki işlemlere mesaj aktarılmaz
+                self.backup_engine.set_status_callback(None)
+                self._finish_analysis(options, totals)
+                return
+        
+        self.after(100, lambda: self._drain_analysis_queue(
+            result_queue, progress_dialog, mapping_count, options, totals
+        ))
+    
+    def _log_analysis_result(self, mapping: dict, result: dict, options: dict, totals: dict):
+        """Bir eşleşmenin analiz sonucunu sakla, toplamlara ekle ve log'a yaz"""
+        files_to_backup = result['files_to_backup']
+        user_excluded_count = result.get('user_excluded_count', 0)
+        hidden_excluded_count = result.get('hidden_excluded_count', 0)
+        mapping_excluded_count = result.get('total_excluded_count', 0)
+        skipped_count = result['skipped_count']
+        size = result['total_size']
+        user_excluded_size = result.get('user_excluded_size', 0)
+        hidden_excluded_size = result.get('hidden_excluded_size', 0)
+        mapping_excluded_size = result.get('total_excluded_size', 0)
+        skipped_size = result['skipped_size']
+        revision_count = result.get('revision_count', 0)
+        revision_size = result.get('revision_size', 0)
+        deleted_count = result.get('deleted_count', 0)
+        deleted_size = result.get('deleted_size', 0)
+        
+        # Analiz sonuçlarını sakla
+        self.analysis_results[mapping['id']] = result
+        
+        # Toplam sayıları güncelle
+        totals['files'] += len(files_to_backup)
+        totals['size'] += size
+        totals['excluded'] += mapping_excluded_count
+        totals['excluded_size'] += mapping_excluded_size
+        totals['skipped'] += skipped_count
+        totals['skipped_size'] += skipped_size
+        
+        # Analiz sonuçlarını logla
+        if len(files_to_backup) == 0 and mapping_excluded_count == 0 and skipped_count == 0:
+            self._log_write(f"    → Yedeklenecek dosya bulunamadı!", "#FFA0A0")
+        else:
+            toplam_dosya = len(files_to_backup) + mapping_excluded_count + skipped_count
+            toplam_dosya_boyutu = size + mapping_excluded_size + skipped_size
+            self._log_write(f"    → Toplam incelenen dosya: {toplam_dosya:,}  ({BackupEngine.format_size(toplam_dosya_boyutu)})", "#60C2FF")
+            if len(files_to_backup) > 0:
+                self._log_write(f"    → Yedeklenecek: {len(files_to_backup):,} dosya ({BackupEngine.format_size(size)})", "#01F001")
+            else:
+                self._log_write(f"    → Yedeklenecek: 0 dosya", "#65FE65")
+            
+            if skipped_count > 0:
+                self._log_write(f"    → Atlanan (güncel): {skipped_count:,} dosya ({BackupEngine.format_size(skipped_size)})", "#FFCC6C")
+                catalog_skipped_count = result.get('catalog_skipped_count', 0)
+                if catalog_skipped_count > 0:
+                    self._log_write(f"      (Katalogdan, karşılaştırılmadan: {catalog_skipped_count:,} dosya)", "#ADADAD")
+                touched_count = result.get('touched_count', 0)
+                if touched_count > 0:
+                    self._log_write(f"      (Sadece tarihi değişen, içeriği aynı: {touched_count:,} dosya - "
+                                    f"{BackupEngine.format_size(result.get('touched_size', 0))})", "#ADADAD")
+            
+            appended_count = result.get('appended_count', 0)
+            if appended_count > 0:
+                self._log_write(f"    → Sonuna eklenen (log): {appended_count:,} dosya "
+                                f"(+{BackupEngine.format_size(result.get('appended_size', 0))})", "#01F001")
+            
+            if user_excluded_count > 0:
+                self._log_write(f"    → Hariç (filtre): {user_excluded_count:,} dosya ({BackupEngine.format_size(user_excluded_size)})", "#FFA500")
+            
+            if hidden_excluded_count > 0:
+                self._log_write(f"    → Hariç (gizli): {hidden_excluded_count:,} dosya ({BackupEngine.format_size(hidden_excluded_size)})", "#FFA500")
+            
+            if deleted_count > 0:
+                self._log_write(f"    → Silinmiş (kaynakta yok): {deleted_count:,} dosya ({BackupEngine.format_size(deleted_size)})", "#FF6B6B")
+        
+            if revision_count > 0:
+                revision_disk_size = result.get('revision_disk_size', revision_size)
+                disk_note = f", diskte {BackupEngine.format_size(revision_disk_size)}" if revision_disk_size != revision_size else ""
+                self._log_write(f"    → Arşivlenmiş (_REVISIONS): {revision_count:,} dosya ({BackupEngine.format_size(revision_size)}{disk_note})", "#D896FF")
+        
+        # Kataloğa güvenilip silinenler istenmediğinde hedef listelenmez
+        if not result.get('target_listed', True):
+            self._log_write("    → Hedef klasör listelenmedi (kataloğa güven, silinenler kapalı) - "
+                            "silinen dosyalar tespit edilmedi", "#ADADAD")
+        
+        # Klasör kataloğu kazancı
+        reused_dir_count = result.get('reused_dir_count', 0)
+        scanned_dir_count = reused_dir_count + result.get('listed_dir_count', 0)
+        if reused_dir_count > 0:
+            reuse_percent = reused_dir_count * 100 / scanned_dir_count
+            trust_note = ", dosya tarihleri kontrol edilmedi" if options['trust_catalog'] else ""
+            self._log_write(f"    → Klasör kataloğu: {reused_dir_count:,}/{scanned_dir_count:,} klasör listelenmeden geçildi "
+                            f"(%{reuse_percent:.0f}{trust_note}) - tarama {result.get('scan_seconds', 0):.2f} sn", "#ADADAD")
+        
+        # İçerik karşılaştırması özeti
+        if result.get('compare_content') and result.get('hash_compared_count', 0) > 0:
+            self._log_write(f"    → İçerik karşılaştırması: {result['hash_compared_count']:,} dosya "
+                            f"(okunan: {result.get('hashed_count', 0):,}, önbellekten: {result.get('hash_cached_count', 0):,}), "
+                            f"içeriği değişen: {result.get('content_changed_count', 0):,}", "#ADADAD")
+            
+    
+    def _finish_analysis(self, options: dict, totals: dict):
+        """Analiz bittiğinde özet ve dosya listelerini log'a yaz, seçimleri kaydet"""
+        show_backup_files = options['show_backup_files']
+        show_user_excluded_files = options['show_user_excluded_files']
+        show_hidden_excluded_files = options['show_hidden_excluded_files']
+        show_skipped_files = options['show_skipped_files']
+        show_revision_files = options['show_revision_files']
+        show_deleted_files = options['show_deleted_files']
+        max_files_to_show = options['max_files_to_show']
+        total_files = totals['files']
+        total_size = totals['size']
+        total_excluded = totals['excluded']
+        total_excluded_size = totals['excluded_size']
+        total_skipped = totals['skipped']
+        total_skipped_size = totals['skipped_size']
+        
+        # İptal edildiyse sadece tamamlanan eşleşmelerin sonuçları kullanılabilir
+        cancelled = self.backup_engine.cancelled
+        if cancelled:
+            self._log_write("\n⚠️ Analiz iptal edildi - sadece tamamlanan eşleşmeler yedeklenebilir", "#FF6B6B")
         
         # Özet
         self._log_write("\n" + "=" * 80, "#00A0E9")
@@ -318,6 +668,12 @@ class BackupMixin:
                             source_date = file_info.get('source_date', '')
                             target_date = file_info.get('target_date', '')
                             reason_text = f" (daha yeni - kaynak: {source_date}, hedef: {target_date})"
+                        elif reason == 'içerik değişti':
+                            reason_text = " (içerik değişti)"
+                        elif reason == 'boyut farklı':
+                            reason_text = " (boyut farklı)"
+                        elif reason == 'sona eklendi':
+                            reason_text = f" (sona eklendi - önceki boyut: {BackupEngine.format_size(file_info.get('target_size', 0))})"
                         
                         file_size = file_info.get('size', 0)
                         self._log_write(
@@ -474,21 +830,27 @@ class BackupMixin:
                     self._log_write(f"\n... ve {total_deleted_count - max_files_to_show} dosya daha", "#FFAE35")
         
         # Analiz süresini hesapla ve kaydet
-        analysis_duration = time.time() - analysis_start_time
+        analysis_duration = time.time() - options['start_time']
         self.analysis_duration = analysis_duration  # Yedekleme için sakla
         
         # Analiz başarıyla tamamlandı - seçimleri kaydet
-        self.db.set_analysis_selections(
-            self.current_project_id, 
-            selected_mapping_ids,
-            show_backup_files=show_backup_files,
-            show_user_excluded_files=show_user_excluded_files,
-            show_hidden_excluded_files=show_hidden_excluded_files,
-            show_skipped_files=show_skipped_files,
-            show_revision_files=show_revision_files,
-            show_deleted_files=show_deleted_files,
-            max_files_to_show=max_files_to_show if max_files_to_show != 999999 else -1
-        )
+        if not cancelled:
+            self.db.set_analysis_selections(
+                self.current_project_id, 
+                options['selected_mapping_ids'],
+                show_backup_files=show_backup_files,
+                show_user_excluded_files=show_user_excluded_files,
+                show_hidden_excluded_files=show_hidden_excluded_files,
+                show_skipped_files=show_skipped_files,
+                show_revision_files=show_revision_files,
+                show_deleted_files=show_deleted_files,
+                calculate_excluded_stats=options['calculate_excluded_stats'],
+                trust_catalog=options['trust_catalog'],
+                parallel_analysis=options['parallel_analysis'],
+                per_device_limit=options['per_device_limit'],
+                compare_content=options['compare_content'],
+                max_files_to_show=max_files_to_show if max_files_to_show != 999999 else -1
+            )
         
         # Analiz süresini log'a yaz
         self._log_write(f"\nAnaliz Süresi: {analysis_duration:.2f} saniye", "#A9E4FF")
@@ -596,6 +958,14 @@ class BackupMixin:
         # Progress dialog aç
         progress_dialog = ProgressDialog(self, "Yedekleme İşlemi")
         
+        # Hedef disk başına eşzamanlı kopyalama sayısı
+        self.backup_engine.copy_workers_per_device = self.settings.get_copy_workers_per_device()
+        # Büyük değişmiş dosyalarda sadece değişen bloklar yazılır
+        self.backup_engine.delta_min_size = self.settings.get_delta_min_size()
+        self.backup_engine.dedup_revisions = self.settings.get_dedup_revisions()
+        self.backup_engine.revision_folders.clear()
+        revision_compression = self.settings.get_revision_compression()
+        
         # Thread'de yedekleme yap
         def backup_thread():
             self.backup_engine.reset_cancel()
@@ -620,9 +990,20 @@ class BackupMixin:
             size_skipped = 0
             size_deleted = 0
             size_excluded = 0  # Hariç tutulan dosyaların boyutu
+            total_cloned = 0   # Kopyalananlardan reflink ile klonlananlar
+            size_cloned = 0
+            total_delta = 0    # Kopyalananlardan sadece değişen blokları yazılanlar
+            total_appended = 0 # Kopyalananlardan sadece sona eklenen kısmı yazılanlar
+            total_deduplicated = 0  # Arşivde aynı içerik bulunduğundan yer kaplamayan sürümler
+            size_deduplicated = 0
+            size_delta = 0
+            bytes_written = 0  # Hedef disklere fiilen yazılan byte
             
             # Her eşleşme için istatistikleri sakla
             mapping_stats = []
+            # Arşiv indeksine yazılacak sürümler: (mapping_id, [kayıtlar])
+            archived_revisions = []
+            self.backup_engine.pop_archived_revisions()
             
             mapping_count = len(selected_mappings)  # Seçili mapping sayısı
             
@@ -685,6 +1066,9 @@ class BackupMixin:
                     total_excluded += excluded_count_from_analysis
                     size_excluded += excluded_size_from_analysis
                     
+                    # Hedefle eşit bulunan dosyaları kataloğa yaz
+                    self._update_file_catalog(mapping_id, analysis_result, [])
+                    
                     # Sadece skipped dosyalar varsa bunları da istatistiklere ekle
                     if skipped_count_from_analysis > 0:
                         total_skipped += skipped_count_from_analysis
@@ -713,6 +1097,8 @@ class BackupMixin:
                 ))
                 
                 # İlerlemeyi güncelle
+                current_mapping['index'] = idx
+                current_mapping['count'] = mapping_count
                 progress = idx / mapping_count
                 progress_dialog.update_progress(progress)
                 progress_dialog.update_status(
@@ -725,8 +1111,18 @@ class BackupMixin:
                     mapping['target_path'],
                     files_to_backup,
                     mirror_deletions,
-                    deleted_files
+                    deleted_files,
+                    # Kopyalamadan önceki kontrol analizdeki yöntemle yapılır
+                    analysis_result.get('compare_policy', COMPARE_MTIME),
+                    analysis_result.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE)
                 )
+                archived_revisions.append((mapping_id, self.backup_engine.pop_archived_revisions()))
+                
+                # Dosya kataloğunu güncelle - sadece hedefe fiilen yazılan dosyalar eklenir
+                # (atlanan, kaynakta bulunamayan, iptal edilen ve hata veren dosyalar
+                # bir sonraki analizde yeniden kontrol edilir)
+                copied_entries = BackupEngine.get_catalog_entries(stats['copied_files'])
+                self._update_file_catalog(mapping_id, analysis_result, copied_entries)
                 
                 # Analizdeki skipped sayısını ekle (backup_from_analysis bu dosyalara bakmadı)
                 stats['files_skipped'] += skipped_count_from_analysis
@@ -747,9 +1143,25 @@ class BackupMixin:
                 size_skipped += stats['size_skipped']
                 size_deleted += stats.get('size_deleted', 0)
                 size_excluded += excluded_size_from_analysis
+                total_cloned += stats.get('files_cloned', 0)
+                size_cloned += stats.get('size_cloned', 0)
+                total_delta += stats.get('files_delta', 0)
+                total_appended += stats.get('files_appended', 0)
+                total_deduplicated += stats.get('files_deduplicated', 0)
+                size_deduplicated += stats.get('size_deduplicated', 0)
+                size_delta += stats.get('size_delta', 0)
+                bytes_written += stats.get('bytes_written', 0)
                 
                 # Eşleşme özeti log'a yaz
                 log_msg = f"  → Kopyalanan: {stats['files_copied']}, Arşivlenen: {stats['files_moved_to_revisions']}, Atlanan: {stats['files_skipped']}"
+                if stats.get('files_cloned', 0) > 0:
+                    log_msg += f", Klonlanan (reflink): {stats['files_cloned']} ({BackupEngine.format_size(stats['size_cloned'])})"
+                if stats.get('files_delta', 0) > 0:
+                    log_msg += f", Blok farkı: {stats['files_delta']} ({BackupEngine.format_size(stats['size_delta'])})"
+                if stats.get('files_appended', 0) > 0:
+                    log_msg += f", Sonuna eklenen: {stats['files_appended']}"
+                if stats.get('files_deduplicated', 0) > 0:
+                    log_msg += f", Arşivde zaten olan: {stats['files_deduplicated']} ({BackupEngine.format_size(stats['size_deduplicated'])})"
                 if mirror_deletions and stats.get('files_deleted', 0) > 0:
                     log_msg += f", Silinen: {stats['files_deleted']}"
                 self.after(0, lambda msg=log_msg: self._log_write(msg, "#ADADAD"))
@@ -762,6 +1174,14 @@ class BackupMixin:
                     'excluded_size': excluded_size_from_analysis
                 })
             
+            # Arşivlenen sürümleri sıkıştır (kopyalama bittikten sonra)
+            compress_stats = None
+            if revision_compression != 'none' and not self.backup_engine.cancelled:
+                compress_stats = self.backup_engine.compress_revisions(revision_compression)
+                if compress_stats['files_compressed'] > 0:
+                    archived_revisions = [(mid, BackupEngine.refresh_disk_sizes(records))
+                                          for mid, records in archived_revisions]
+            
             # Tamamlandı
             progress_dialog.update_progress(1.0)
             
@@ -789,6 +1209,18 @@ class BackupMixin:
                 status
             )
             
+            # Arşivlenen sürümleri indekse ekle (saklama politikası bu indeksten çalışır)
+            self.db.add_revision_entries([
+                (target_path, revision_folder, stored_path, rel_path, file_size, disk_size, mid, backup_id, archived_date)
+                for mid, records in archived_revisions
+                for target_path, revision_folder, stored_path, rel_path, file_size, disk_size, archived_date in records
+            ])
+            # Sürüm taşınan klasörler - indeks klasörden yeniden oluşturulsa da sürüm
+            # bu yedeklemeyle eşleştirilebilir
+            self.db.add_backup_revision_folders(backup_id, sorted({
+                (mid, record[1]) for mid, records in archived_revisions for record in records
+            }))
+            
             # DEBUG: Veritabanına kaydedilen değerleri kontrol et
             
             # print(f"DEBUG: Veritabanına kaydedilen değerler:")
@@ -829,7 +1261,19 @@ class BackupMixin:
             self.after(0, lambda: self._log_write(f"Durum: {status}", "#01F001" if status == "Tamamlandı" else "#FF0000"))
             self.after(0, lambda: self._log_write(f"Süre: {duration:.2f} saniye"))
             self.after(0, lambda: self._log_write(f"Yedeklenen Dosyalar: {total_copied} dosya ({BackupEngine.format_size(size_copied)})", "#65FE65"))
+            if total_cloned > 0:
+                self.after(0, lambda: self._log_write(f"  Reflink ile Klonlanan: {total_cloned} dosya ({BackupEngine.format_size(size_cloned)}) - veri kopyalanmadı", "#65FE65"))
+            if total_delta > 0:
+                self.after(0, lambda: self._log_write(f"  Blok Farkı ile Güncellenen: {total_delta} dosya ({BackupEngine.format_size(size_delta)}) - sadece değişen bloklar yazıldı", "#65FE65"))
+            if total_appended > 0:
+                self.after(0, lambda: self._log_write(f"  Sonuna Ekleme ile Güncellenen: {total_appended} dosya - sadece eklenen kısım yazıldı", "#65FE65"))
+            if size_copied > 0 and bytes_written != size_copied:
+                self.after(0, lambda: self._log_write(f"  Diske Yazılan: {BackupEngine.format_size(bytes_written)} (dosya boyutu toplamı: {BackupEngine.format_size(size_copied)})", "#65FE65"))
             self.after(0, lambda: self._log_write(f"Arşivlenen Dosyalar: {total_moved} dosya ({BackupEngine.format_size(size_moved)})", "#FFA500"))
+            if total_deduplicated > 0:
+                self.after(0, lambda: self._log_write(f"  Tekilleştirilen: {total_deduplicated} dosya ({BackupEngine.format_size(size_deduplicated)}) - aynı içerik arşivde vardı, yer kaplamadı", "#FFA500"))
+            if compress_stats and compress_stats['files_compressed'] > 0:
+                self.after(0, lambda: self._log_write(f"  Sıkıştırılan: {compress_stats['files_compressed']} dosya ({BackupEngine.format_size(compress_stats['size_original'])} → {BackupEngine.format_size(compress_stats['size_compressed'])})", "#FFA500"))
             self.after(0, lambda: self._log_write(f"Atlanan Dosyalar: {total_skipped} dosya ({BackupEngine.format_size(size_skipped)})", "#B5B4B4"))
             if mirror_deletions and total_deleted > 0:
                 self.after(0, lambda: self._log_write(f"Silinen Dosyalar: {total_deleted} dosya ({BackupEngine.format_size(size_deleted)})", "#FF6B6B"))
@@ -868,6 +1312,21 @@ class BackupMixin:
         
         self.backup_engine.set_status_callback(status_callback)
         
+        # Byte ilerlemesi - eşleşme içindeki kopyalama ilerlemesini de gösterir
+        current_mapping = {'index': 0, 'count': 1}
+        
+        def progress_callback(copied_bytes, total_bytes):
+            idx = current_mapping['index']
+            count = current_mapping['count']
+            fraction = copied_bytes / total_bytes if total_bytes else 1.0
+            progress_dialog.update_progress((idx + fraction) / count)
+            progress_dialog.update_status(
+                f"Eşleşme {idx + 1}/{count} işleniyor... "
+                f"({BackupEngine.format_size(copied_bytes)} / {BackupEngine.format_size(total_bytes)})"
+            )
+        
+        self.backup_engine.set_progress_callback(progress_callback)
+        
         # Thread'i başlat
         thread = threading.Thread(target=backup_thread, daemon=True)
         thread.start()
@@ -879,6 +1338,27 @@ class BackupMixin:
         if progress_dialog.cancelled:
             self.backup_engine.cancel()
     
+    def _update_file_catalog(self, mapping_id: int, analysis_result: dict, copied_entries: list):
+        """Eşleşmenin dosya/klasör kataloğunu analiz ve yedekleme sonucuna göre güncelle
+        (yedekleme thread'inden çağrılır)
+        
+        Args:
+            mapping_id: Eşleşme ID'si
+            analysis_result: analyze_mapping_detailed sonucu
+            copied_entries: Başarıyla kopyalanan dosyaların katalog kayıtları
+        """
+        try:
+            self.db.update_file_catalog(
+                mapping_id, analysis_result.get('catalog_synced_entries', []) + copied_entries
+            )
+            self.db.remove_from_file_catalog(mapping_id, analysis_result.get('catalog_stale', []))
+            self.db.replace_dir_catalog(mapping_id, analysis_result.get('dir_catalog_entries', []))
+        except Exception as e:
+            # Katalog sadece hızlandırma içindir, hata yedeklemeyi durdurmamalı
+            self.after(0, lambda err=e: self._log_write(
+                f"  ⚠️ Dosya kataloğu güncellenemedi (eşleşme {mapping_id}): {err}", "#FFAE35"
+            ))
+    
     def _show_save_details_button(self, backup_id: int):
         """Detayları Kaydet butonunu göster"""
         self.last_backup_id = backup_id
@@ -894,19 +1374,13 @@ class BackupMixin:
         except:
             pass  # Buton henüz oluşturulmamış olabilir
     
-    def _save_backup_file_details(self):
-        """Yedeklenen dosyaların detaylarını veritabanına kaydet"""
-        if not self.last_backup_id:
-            ConfirmDialog.show_warning(self, "Uyarı", "Kaydedilecek yedekleme bilgisi bulunamadı!")
-            return
+    def _collect_backup_file_details(self, analysis_results: dict, backup_id: int) -> list:
+        """Analiz sonuçlarından yedeklenen dosyaların detaylarını hazırla
         
-        if not self.analysis_results:
-            ConfirmDialog.show_warning(self, "Uyarı", "Analiz sonuçları bulunamadı!")
-            return
-        
-        # Tüm yedeklenen dosyaları topla
+        Önceki yedeklemelerdeki boyutlar tüm dosyalar için tek sorguda bulunur.
+        """
         file_details = []
-        for mapping_id, result in self.analysis_results.items():
+        for mapping_id, result in analysis_results.items():
             files_to_backup = result.get('files_to_backup', [])
             for file_info in files_to_backup:
                 if isinstance(file_info, dict):
@@ -919,93 +1393,99 @@ class BackupMixin:
                     file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
                     reason = 'bilinmiyor'
                 
-                # Dosya adını yoldan ayır
-                file_name = os.path.basename(file_path)
-                file_dir = os.path.dirname(file_path)
-                
-                # Önceki yedeklerdeki boyutu bul
-                previous_size = self.db.get_previous_file_size(file_dir, file_name, self.last_backup_id)
-                
                 file_details.append({
                     'mapping_id': mapping_id,
-                    'file_path': file_dir,
-                    'file_name': file_name,
+                    'file_path': os.path.dirname(file_path),
+                    'file_name': os.path.basename(file_path),
                     'file_size': file_size,
-                    'previous_size': previous_size,
+                    'previous_size': None,
                     'backup_reason': reason
                 })
         
-        if not file_details:
-            ConfirmDialog.show_warning(self, "Uyarı", "Kaydedilecek dosya detayı bulunamadı!")
+        # Önceki yedeklerdeki boyutları bul
+        previous_sizes = self.db.get_previous_file_sizes(
+            [(detail['file_path'], detail['file_name']) for detail in file_details], backup_id
+        )
+        for detail in file_details:
+            detail['previous_size'] = previous_sizes.get((detail['file_path'], detail['file_name']))
+        return file_details
+    
+    def _save_backup_file_details(self):
+        """Yedeklenen dosyaların detaylarını veritabanına kaydet (arka planda)"""
+        if not self.last_backup_id:
+            ConfirmDialog.show_warning(self, "Uyarı", "Kaydedilecek yedekleme bilgisi bulunamadı!")
             return
         
-        try:
-            # Veritabanına kaydet
-            self.db.add_backup_file_details(self.last_backup_id, file_details)
-            
+        if not self.analysis_results:
+            ConfirmDialog.show_warning(self, "Uyarı", "Analiz sonuçları bulunamadı!")
+            return
+        
+        backup_id = self.last_backup_id
+        analysis_results = dict(self.analysis_results)
+        # Kayıt bitene kadar tekrar basılmasın
+        self.save_details_btn.configure(state="disabled")
+        
+        def on_done(count: int):
+            self.save_details_btn.configure(state="normal")
+            if count == 0:
+                ConfirmDialog.show_warning(self, "Uyarı", "Kaydedilecek dosya detayı bulunamadı!")
+                return
             # Butonu gizle (detaylar kaydedildi)
             self._hide_save_details_button()
-            
             ConfirmDialog.show_info(self, "Başarılı", 
-                                   f"{len(file_details)} dosyanın detayları başarıyla kaydedildi.")
-        except Exception as e:
-            ConfirmDialog.show_error(self, "Hata", f"Detaylar kaydedilemedi: {str(e)}")
+                                   f"{count} dosyanın detayları başarıyla kaydedildi.")
+        
+        def on_error(error: str):
+            self.save_details_btn.configure(state="normal")
+            ConfirmDialog.show_error(self, "Hata", f"Detaylar kaydedilemedi: {error}")
+        
+        def save_thread():
+            try:
+                file_details = self._collect_backup_file_details(analysis_results, backup_id)
+                if file_details:
+                    # Veritabanına kaydet
+                    self.db.add_backup_file_details(backup_id, file_details)
+            except Exception as e:
+                self.after(0, lambda error=str(e): on_error(error))
+                return
+            self.after(0, lambda: on_done(len(file_details)))
+        
+        threading.Thread(target=save_thread, daemon=True).start()
     
     def _auto_save_backup_details(self, backup_id: int):
-        """Yedekleme tamamlandığında dosya detaylarını otomatik kaydet"""
+        """Yedekleme tamamlandığında dosya detaylarını otomatik kaydet (arka planda)"""
         self.last_backup_id = backup_id
         
         if not self.analysis_results:
             self._log_write("⚠️ Otomatik detay kaydetme: Analiz sonuçları bulunamadı!", "#FFA500")
             return
         
-        # Tüm yedeklenen dosyaları topla
-        file_details = []
-        for mapping_id, result in self.analysis_results.items():
-            files_to_backup = result.get('files_to_backup', [])
-            for file_info in files_to_backup:
-                if isinstance(file_info, dict):
-                    file_path = file_info.get('path', '')
-                    file_size = file_info.get('size', 0)
-                    reason = file_info.get('reason', 'bilinmiyor')
-                else:
-                    # Eski format uyumluluğu
-                    file_path = file_info
-                    file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-                    reason = 'bilinmiyor'
-                
-                # Dosya adını yoldan ayır
-                file_name = os.path.basename(file_path)
-                file_dir = os.path.dirname(file_path)
-                
-                # Önceki yedeklerdeki boyutu bul
-                previous_size = self.db.get_previous_file_size(file_dir, file_name, backup_id)
-                
-                file_details.append({
-                    'mapping_id': mapping_id,
-                    'file_path': file_dir,
-                    'file_name': file_name,
-                    'file_size': file_size,
-                    'previous_size': previous_size,
-                    'backup_reason': reason
-                })
+        analysis_results = dict(self.analysis_results)
         
-        if not file_details:
-            self._log_write("⚠️ Otomatik detay kaydetme: Kaydedilecek dosya detayı bulunamadı!", "#FFA500")
-            return
-        
-        try:
-            # Veritabanına kaydet
-            self.db.add_backup_file_details(backup_id, file_details)
-            
+        def on_done(count: int):
+            if count == 0:
+                self._log_write("⚠️ Otomatik detay kaydetme: Kaydedilecek dosya detayı bulunamadı!", "#FFA500")
+                return
             # Log'a bilgi yaz
-            self._log_write(f"✅ Dosya detayları otomatik olarak kaydedildi ({len(file_details)} dosya)", "#65FE65")
+            self._log_write(f"✅ Dosya detayları otomatik olarak kaydedildi ({count} dosya)", "#65FE65")
             
             # Butonu göstermeye gerek yok (zaten kaydedildi)
-            self.last_backup_id = None
-            self.last_backup_files = None
-        except Exception as e:
-            self._log_write(f"❌ Otomatik detay kaydetme hatası: {str(e)}", "#FF0000")
+            if self.last_backup_id == backup_id:
+                self.last_backup_id = None
+                self.last_backup_files = None
+        
+        def save_thread():
+            try:
+                file_details = self._collect_backup_file_details(analysis_results, backup_id)
+                if file_details:
+                    # Veritabanına kaydet
+                    self.db.add_backup_file_details(backup_id, file_details)
+            except Exception as e:
+                self.after(0, lambda error=str(e): self._log_write(f"❌ Otomatik detay kaydetme hatası: {error}", "#FF0000"))
+                return
+            self.after(0, lambda: on_done(len(file_details)))
+        
+        threading.Thread(target=save_thread, daemon=True).start()
     
     def _show_history(self):
         """Geçmiş penceresini göster"""
@@ -4,37 +4,158 @@ Tarih: 19 Kasım 2025
 Yazar: Dr. Mustafa Afyonluoğlu
 
 Gerekli Kütüphaneler:
-    - sqlite3  (standart kütüphane)
-    - os       (standart kütüphane)
-    - datetime (standart kütüphane)
+    - sqlite3   (standart kütüphane)
+    - os        (standart kütüphane)
+    - threading (standart kütüphane)
+    - datetime  (standart kütüphane)
 """
 
 import sqlite3
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+
+
+# Bağlantı havuzu ayarları
+BUSY_TIMEOUT = 30        # Yazma kilidi için en fazla bekleme (saniye)
+CACHE_SIZE_KB = 16384    # Bağlantı başına sayfa önbelleği (KB)
+IDLE_POOL_SIZE = 4       # Biten thread'lerden devralınmak üzere açık tutulan bağlantı sayısı
 
 
 class DatabaseManager:
-    """Veritabanı işlemlerini yöneten sınıf"""
+    """Veritabanı işlemlerini yöneten sınıf
+    
+    Her thread kendi bağlantısını ve cursor'ını kullanır (self.conn / self.cursor
+    çağıran thread'in bağlantısını döndürür). Veritabanı WAL modunda açıldığından
+    okumalar yazmaları, yazmalar okumaları beklemez; eş zamanlı yazmalar SQLite
+    tarafından sıraya konur. Biten thread'lerin bağlantıları havuza alınıp yeni
+    thread'lere verilir.
+    """
     
     def __init__(self):
         """Veritabanı bağlantısını başlatır"""
         # Veritabanı dosyasını py dosyasının bulunduğu dizinde oluştur
         self.db_path = os.path.join(os.path.dirname(__file__), 'smartbackup.db')
-        self.conn = None
-        self.cursor = None
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._connections = {}  # thread -> bağlantı (kullanımdaki bağlantılar)
+        self._idle = []         # Biten thread'lerden kalan, yeniden kullanılacak bağlantılar
+        self._fts_enabled = None  # Dosya arama için FTS5 trigram indeksi var mı (ilk kullanımda belirlenir)
         self._connect()
-        self._create_tables()
+        self._migrate_schema()
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Çağıran thread'in bağlantısı (yoksa havuzdan alınır)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._acquire_connection()
+        return conn
+    
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        """Çağıran thread'in cursor'ı"""
+        if getattr(self._local, 'conn', None) is None:
+            self._acquire_connection()
+        return self._local.cursor
     
     def _connect(self):
         """Veritabanına bağlan"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Dictionary-like access
-        self.cursor = self.conn.cursor()
+        self._acquire_connection()
+    
+    @property
+    def fts_enabled(self) -> bool:
+        """Dosya arama için FTS5 trigram indeksi var mı"""
+        if self._fts_enabled is None:
+            self.cursor.execute("SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'file_name_fts')")
+            self._fts_enabled = bool(self.cursor.fetchone()[0])
+        return self._fts_enabled
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Yeni bağlantı aç ve bağlantı ayarlarını uygula"""
+        # check_same_thread=False: biten thread'in bağlantısı havuzdan başka thread'e verilebilir
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Dictionary-like access
+        # WAL modunda NORMAL güvenlidir (sadece elektrik kesintisinde son işlem kaybolabilir)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KB}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+    
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """Çağıran thread'e bağlantı ver (havuzdan ya da yeni)"""
+        current = threading.current_thread()
+        with self._pool_lock:
+            # Biten thread'lerin bağlantılarını havuza al
+            for thread in [t for t in self._connections if not t.is_alive()]:
+                conn = self._connections.pop(thread)
+                if len(self._idle) < IDLE_POOL_SIZE:
+                    self._idle.append(conn)
+                else:
+                    conn.close()
+            conn = self._idle.pop() if self._idle else None
+            if conn is not None:
+                conn.rollback()  # Önceki thread'den kalmış açık işlem varsa geri al
+            else:
+                conn = self._open_connection()
+            self._connections[current] = conn
+        self._local.conn = conn
+        self._local.cursor = conn.cursor()
+        return conn
+    
+    def _migrate_schema(self):
+        """Veritabanı şemasını güncel sürüme getir
+        
+        Şema sürümü PRAGMA user_version'da tutulur. Güncel veritabanında açılışta
+        sadece bu değer okunur; eksik geçişler sırayla ve her biri (sürüm
+        numarasıyla birlikte) tek işlemde uygulanır.
+        """
+        migrations = self._migrations()
+        version = self.cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version >= len(migrations):
+            return
+        
+        # WAL modu kalıcıdır (dosyaya yazılır), işlem dışında bir kez ayarlanır
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        for number, migration in enumerate(migrations, start=1):
+            if number <= version:
+                continue
+            self.cursor.execute('BEGIN IMMEDIATE')
+            try:
+                # Aynı anda açılan başka bir pencere geçişi uygulamış olabilir
+                if self.cursor.execute('PRAGMA user_version').fetchone()[0] >= number:
+                    self.conn.rollback()
+                    continue
+                migration()
+                self.cursor.execute(f'PRAGMA user_version = {number}')
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+    
+    def _migrations(self) -> List[Callable[[], None]]:
+        """Şema geçişleri - listedeki sıra (1'den başlayarak) şema sürümüdür
+        
+        Uygulanmış geçişler değiştirilmez; yeni şema değişiklikleri listenin
+        sonuna yeni geçiş olarak eklenir.
+        """
+        return [
+            self._migration_base_schema,
+            self._migration_history_indexes,
+            self._migration_file_search_index,
+            self._migration_backup_revision_folders,
+        ]
     
-    def _create_tables(self):
-        """Gerekli tabloları oluştur"""
+    def _add_missing_columns(self, table: str, columns: List[Tuple[str, str]]):
+        """Eski veritabanlarında tabloda olmayan kolonları ekle"""
+        existing = {row['name'] for row in self.cursor.execute(f'PRAGMA table_info({table})').fetchall()}
+        for name, definition in columns:
+            if name not in existing:
+                self.cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+    
+    def _migration_base_schema(self):
+        """Sürüm 1: Tüm tablolar; sürüm numarası öncesi veritabanlarının eksik kolonları"""
         # Projeler tablosu
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS projects (
@@ -58,23 +179,22 @@ class DatabaseManager:
                 include_subdirs INTEGER DEFAULT 1,
                 target_path TEXT NOT NULL,
                 created_date TEXT NOT NULL,
+                compare_policy TEXT DEFAULT 'mtime',
+                mtime_tolerance REAL DEFAULT 2,
+                append_only INTEGER DEFAULT 0,
                 FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
             )
         ''')
-        
-        # Eski veritabanlarına exclude_filter kolonu ekle
-        try:
-            self.cursor.execute("SELECT exclude_filter FROM mappings LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE mappings ADD COLUMN exclude_filter TEXT DEFAULT ''")
-        
-        # Eski veritabanlarına mapping_name kolonu ekle
-        try:
-            self.cursor.execute("SELECT mapping_name FROM mappings LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE mappings ADD COLUMN mapping_name TEXT DEFAULT ''")
+        self._add_missing_columns('mappings', [
+            ('exclude_filter', "TEXT DEFAULT ''"),
+            ('mapping_name', "TEXT DEFAULT ''"),
+            ('compare_policy', "TEXT DEFAULT 'mtime'"),
+            ('mtime_tolerance', 'REAL DEFAULT 2'),
+            ('append_only', 'INTEGER DEFAULT 0'),
+        ])
         
         # Yedekleme geçmişi tablosu
+        # backup_ts: Sıralanabilir tamsayı tarih (YYYYMMDDHHMMSS) - listeler TEXT tarih yerine bununla sıralanır
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS backup_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -86,41 +206,25 @@ class DatabaseManager:
                 total_files_moved_to_revisions INTEGER DEFAULT 0,
                 total_files_skipped INTEGER DEFAULT 0,
                 total_files_deleted_to_revisions INTEGER DEFAULT 0,
+                total_files_excluded INTEGER DEFAULT 0,
                 total_size_copied INTEGER DEFAULT 0,
                 total_size_moved INTEGER DEFAULT 0,
                 total_size_skipped INTEGER DEFAULT 0,
                 total_size_deleted INTEGER DEFAULT 0,
+                total_size_excluded INTEGER DEFAULT 0,
                 status TEXT NOT NULL,
+                backup_ts INTEGER,
                 FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
             )
         ''')
-        
-        # Eski veritabanlarına analysis_duration_seconds kolonu ekle
-        try:
-            self.cursor.execute("SELECT analysis_duration_seconds FROM backup_history LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_history ADD COLUMN analysis_duration_seconds REAL DEFAULT 0")
-        
-        try:
-            self.cursor.execute("SELECT total_files_deleted_to_revisions FROM backup_history LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_history ADD COLUMN total_files_deleted_to_revisions INTEGER DEFAULT 0")
-        
-        try:
-            self.cursor.execute("SELECT total_size_deleted FROM backup_history LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_history ADD COLUMN total_size_deleted INTEGER DEFAULT 0")
-        
-        # Hariç tutulan dosyalar için kolonlar ekle
-        try:
-            self.cursor.execute("SELECT total_files_excluded FROM backup_history LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_history ADD COLUMN total_files_excluded INTEGER DEFAULT 0")
-        
-        try:
-            self.cursor.execute("SELECT total_size_excluded FROM backup_history LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_history ADD COLUMN total_size_excluded INTEGER DEFAULT 0")
+        self._add_missing_columns('backup_history', [
+            ('analysis_duration_seconds', 'REAL DEFAULT 0'),
+            ('total_files_deleted_to_revisions', 'INTEGER DEFAULT 0'),
+            ('total_size_deleted', 'INTEGER DEFAULT 0'),
+            ('total_files_excluded', 'INTEGER DEFAULT 0'),
+            ('total_size_excluded', 'INTEGER DEFAULT 0'),
+            ('backup_ts', 'INTEGER'),
+        ])
         
         # Yedekleme detayları tablosu
         self.cursor.execute('''
@@ -132,38 +236,25 @@ class DatabaseManager:
                 files_moved INTEGER DEFAULT 0,
                 files_skipped INTEGER DEFAULT 0,
                 files_deleted INTEGER DEFAULT 0,
+                files_excluded INTEGER DEFAULT 0,
                 size_copied INTEGER DEFAULT 0,
                 size_moved INTEGER DEFAULT 0,
                 size_skipped INTEGER DEFAULT 0,
                 size_deleted INTEGER DEFAULT 0,
+                size_excluded INTEGER DEFAULT 0,
                 FOREIGN KEY (backup_id) REFERENCES backup_history(id) ON DELETE CASCADE,
                 FOREIGN KEY (mapping_id) REFERENCES mappings(id) ON DELETE CASCADE
             )
         ''')
-        
-        # Eski veritabanlarına yeni kolonları ekle
-        try:
-            self.cursor.execute("SELECT files_deleted FROM backup_details LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_details ADD COLUMN files_deleted INTEGER DEFAULT 0")
-        
-        try:
-            self.cursor.execute("SELECT size_deleted FROM backup_details LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_details ADD COLUMN size_deleted INTEGER DEFAULT 0")
-        
-        # Hariç tutulan dosyalar için kolonlar ekle (backup_details)
-        try:
-            self.cursor.execute("SELECT files_excluded FROM backup_details LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_details ADD COLUMN files_excluded INTEGER DEFAULT 0")
-        
-        try:
-            self.cursor.execute("SELECT size_excluded FROM backup_details LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE backup_details ADD COLUMN size_excluded INTEGER DEFAULT 0")
+        self._add_missing_columns('backup_details', [
+            ('files_deleted', 'INTEGER DEFAULT 0'),
+            ('size_deleted', 'INTEGER DEFAULT 0'),
+            ('files_excluded', 'INTEGER DEFAULT 0'),
+            ('size_excluded', 'INTEGER DEFAULT 0'),
+        ])
         
         # Yedekleme dosya detayları tablosu (her dosyanın detayı)
+        # revision_pruned: Arşivdeki eski sürümü temizlenen kayıtlar (geçmiş pencerelerinde gösterilir)
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS backup_file_details (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -174,29 +265,93 @@ class DatabaseManager:
                 file_size INTEGER DEFAULT 0,
                 previous_size INTEGER DEFAULT NULL,
                 backup_reason TEXT NOT NULL,
+                revision_pruned INTEGER DEFAULT 0,
                 FOREIGN KEY (backup_id) REFERENCES backup_history(id) ON DELETE CASCADE
             )
         ''')
+        self._add_missing_columns('backup_file_details', [
+            ('previous_size', 'INTEGER DEFAULT NULL'),
+            ('mapping_id', 'INTEGER'),
+            ('revision_pruned', 'INTEGER DEFAULT 0'),
+        ])
         
-        # Eski veritabanlarına previous_size kolonunu ekle
-        try:
-            self.cursor.execute("SELECT previous_size FROM backup_file_details LIMIT 1")
-            # print("DEBUG: previous_size kolonu mevcut")
-        except sqlite3.OperationalError:
-            # print("DEBUG: previous_size kolonu ekleniyor...")
-            self.cursor.execute("ALTER TABLE backup_file_details ADD COLUMN previous_size INTEGER DEFAULT NULL")
-            self.conn.commit()
-            # print("DEBUG: previous_size kolonu eklendi")
+        # Dosya kataloğu tablosu - her eşleşme için son yedeklemede hedefle eşit olan
+        # kaynak dosyaların stat bilgisi (artımlı analiz için)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS file_catalog (
+                mapping_id INTEGER NOT NULL,
+                rel_path TEXT NOT NULL,
+                file_size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                inode INTEGER DEFAULT 0,
+                last_synced TEXT NOT NULL,
+                PRIMARY KEY (mapping_id, rel_path)
+            ) WITHOUT ROWID
+        ''')
         
-        # Eski veritabanlarına mapping_id kolonunu ekle
-        try:
-            self.cursor.execute("SELECT mapping_id FROM backup_file_details LIMIT 1")
-            # print("DEBUG: mapping_id kolonu mevcut")
-        except sqlite3.OperationalError:
-            #print("DEBUG: mapping_id kolonu ekleniyor...")
-            self.cursor.execute("ALTER TABLE backup_file_details ADD COLUMN mapping_id INTEGER")
-            self.conn.commit()
-            # print("DEBUG: mapping_id kolonu eklendi")
+        # Klasör kataloğu tablosu - her eşleşme için taranan klasörlerin tarihi ve
+        # içerdiği kayıt sayısı (değişmeyen klasörler yeniden listelenmez)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dir_catalog (
+                mapping_id INTEGER NOT NULL,
+                rel_dir TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                child_count INTEGER NOT NULL,
+                PRIMARY KEY (mapping_id, rel_dir)
+            ) WITHOUT ROWID
+        ''')
+        
+        # İçerik özeti önbelleği - (disk, inode) anahtarlı; boyut ve tarih aynıysa
+        # dosya yeniden okunmadan kayıtlı özet kullanılır (içerik karşılaştırma modu)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS hash_cache (
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                file_size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (device, inode)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Arşiv indeksi - _REVISIONS'a taşınan her sürüm (klasör taranmadan
+        # istatistik, listeleme ve temizleme için)
+        # disk_size: Diskte kaplanan alan - tekilleştirilen sürümlerde 0, sıkıştırılanlarda sıkıştırılmış boyut
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS revision_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                target_path TEXT NOT NULL,
+                revision_folder TEXT NOT NULL,
+                stored_path TEXT NOT NULL,
+                rel_path TEXT NOT NULL,
+                file_size INTEGER DEFAULT 0,
+                disk_size INTEGER,
+                mapping_id INTEGER,
+                backup_id INTEGER,
+                archived_date TEXT NOT NULL,
+                UNIQUE (target_path, revision_folder, stored_path)
+            )
+        ''')
+        self._add_missing_columns('revision_index', [
+            ('disk_size', 'INTEGER'),
+        ])
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_revision_index_file
+            ON revision_index (target_path, rel_path)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_revision_index_date
+            ON revision_index (target_path, archived_date)
+        ''')
+        
+        # Arşiv indeksi klasörden oluşturulmuş hedefler - bu hedeflerde analiz
+        # _REVISIONS klasörünü taramaz, istatistikleri indeksten okur
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS revision_index_state (
+                target_path TEXT PRIMARY KEY,
+                reconciled_date TEXT NOT NULL
+            )
+        ''')
         
         # Ayarlar tablosu
         self.cursor.execute('''
@@ -217,49 +372,112 @@ class DatabaseManager:
                 show_skipped_files INTEGER DEFAULT 1,
                 show_revision_files INTEGER DEFAULT 1,
                 show_deleted_files INTEGER DEFAULT 1,
+                calculate_excluded_stats INTEGER DEFAULT 1,
+                trust_catalog INTEGER DEFAULT 0,
+                parallel_analysis INTEGER DEFAULT 0,
+                per_device_limit INTEGER DEFAULT 1,
+                compare_content INTEGER DEFAULT 0,
                 max_files_to_show INTEGER DEFAULT 50,
                 last_updated TEXT NOT NULL,
                 FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
             )
         ''')
+        self._add_missing_columns('analysis_selections', [
+            ('show_backup_files', 'INTEGER DEFAULT 1'),
+            ('show_user_excluded_files', 'INTEGER DEFAULT 1'),
+            ('show_hidden_excluded_files', 'INTEGER DEFAULT 1'),
+            ('show_skipped_files', 'INTEGER DEFAULT 1'),
+            ('show_revision_files', 'INTEGER DEFAULT 1'),
+            ('max_files_to_show', 'INTEGER DEFAULT 50'),
+            ('show_deleted_files', 'INTEGER DEFAULT 1'),
+            ('calculate_excluded_stats', 'INTEGER DEFAULT 1'),
+            ('trust_catalog', 'INTEGER DEFAULT 0'),
+            ('parallel_analysis', 'INTEGER DEFAULT 0'),
+            ('per_device_limit', 'INTEGER DEFAULT 1'),
+            ('compare_content', 'INTEGER DEFAULT 0'),
+        ])
+    
+    def _migration_history_indexes(self):
+        """Sürüm 2: Geçmiş sıralama tarihi ve geçmiş / dosya detayı indeksleri"""
+        self.cursor.execute('''
+            UPDATE backup_history
+            SET backup_ts = CAST(strftime('%Y%m%d%H%M%S', backup_date) AS INTEGER)
+            WHERE backup_ts IS NULL
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_backup_history_project_date
+            ON backup_history (project_id, backup_ts)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_backup_history_date
+            ON backup_history (backup_ts)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_backup_details_backup
+            ON backup_details (backup_id)
+        ''')
         
-        # Eski veritabanlarına yeni kolonları ekle
-        try:
-            self.cursor.execute("SELECT show_backup_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_backup_files INTEGER DEFAULT 1")
-        
-        try:
-            self.cursor.execute("SELECT show_user_excluded_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_user_excluded_files INTEGER DEFAULT 1")
-        
-        try:
-            self.cursor.execute("SELECT show_hidden_excluded_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_hidden_excluded_files INTEGER DEFAULT 1")
-        
-        try:
-            self.cursor.execute("SELECT show_skipped_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_skipped_files INTEGER DEFAULT 1")
-        
-        try:
-            self.cursor.execute("SELECT show_revision_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_revision_files INTEGER DEFAULT 1")
+        # Dosya geçmişi / önceki boyut aramaları ve yedekleme bazlı listeler için indeksler
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_backup_file_details_file
+            ON backup_file_details (file_path, file_name, backup_id)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_backup_file_details_backup
+            ON backup_file_details (backup_id, mapping_id)
+        ''')
+    
+    def _migration_file_search_index(self):
+        """Sürüm 3: Dosya arama indeksi
         
+        Yedeklenmiş her dosya (dizin + ad) bir kez tutulur; dosya adları trigram
+        FTS5 indeksiyle aranır (alt dize ve wildcard aramaları tüm geçmiş
+        taranmadan yapılır).
+        """
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS file_name_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                UNIQUE (file_path, file_name)
+            )
+        ''')
         try:
-            self.cursor.execute("SELECT max_files_to_show FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN max_files_to_show INTEGER DEFAULT 50")
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS file_name_fts USING fts5(
+                    file_name, content='file_name_index', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite FTS5 / trigram desteği yok (3.34 öncesi) - arama indeks tablosunda LIKE ile yapılır
+            self._fts_enabled = False
         
-        try:
-            self.cursor.execute("SELECT show_deleted_files FROM analysis_selections LIMIT 1")
-        except:
-            self.cursor.execute("ALTER TABLE analysis_selections ADD COLUMN show_deleted_files INTEGER DEFAULT 1")
+        # Mevcut dosya detaylarından indeksi oluştur (indeks zaten doluysa dokunulmaz)
+        self.cursor.execute('SELECT EXISTS (SELECT 1 FROM file_name_index)')
+        if not self.cursor.fetchone()[0]:
+            self.cursor.execute('''
+                INSERT OR IGNORE INTO file_name_index (file_path, file_name)
+                SELECT DISTINCT file_path, file_name FROM backup_file_details
+            ''')
+            if self._fts_enabled:
+                self.cursor.execute("INSERT INTO file_name_fts (file_name_fts) VALUES ('rebuild')")
+    
+    def _migration_backup_revision_folders(self):
+        """Sürüm 4: Yedeklemelerin eski sürümleri taşıdığı _REVISIONS klasörleri
         
-        self.conn.commit()
+        Arşiv indeksi klasörden yeniden oluşturulduğunda yedekleme ID'si olmayan
+        sürümler, temizlikte dosya detaylarıyla bu klasör adı üzerinden eşleştirilir.
+        """
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS backup_revision_folders (
+                backup_id INTEGER NOT NULL,
+                mapping_id INTEGER NOT NULL,
+                revision_folder TEXT NOT NULL,
+                PRIMARY KEY (mapping_id, revision_folder, backup_id),
+                FOREIGN KEY (backup_id) REFERENCES backup_history(id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        ''')
     
     # ==================== PROJE İŞLEMLERİ ====================
     
@@ -303,15 +521,18 @@ class DatabaseManager:
     
     def add_mapping(self, project_id: int, source_path: str, file_filter: str,
                     exclude_filter: str, include_subdirs: bool, target_path: str,
-                    mapping_name: str = "") -> int:
+                    mapping_name: str = "", compare_policy: str = 'mtime',
+                    mtime_tolerance: float = 2.0, append_only: bool = False) -> int:
         """Yeni eşleşme ekle"""
         now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self.cursor.execute('''
             INSERT INTO mappings (project_id, mapping_name, source_path, file_filter, exclude_filter,
-                                  include_subdirs, target_path, created_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                                  include_subdirs, target_path, created_date, compare_policy, mtime_tolerance,
+                                  append_only)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (project_id, mapping_name, source_path, file_filter, exclude_filter, 
-              1 if include_subdirs else 0, target_path, now))
+              1 if include_subdirs else 0, target_path, now, compare_policy, mtime_tolerance,
+              1 if append_only else 0))
         self.conn.commit()
         return self.cursor.lastrowid
     
@@ -330,19 +551,26 @@ class DatabaseManager:
     
     def update_mapping(self, mapping_id: int, source_path: str, file_filter: str,
                        exclude_filter: str, include_subdirs: bool, target_path: str,
-                       mapping_name: str = ""):
+                       mapping_name: str = "", compare_policy: str = 'mtime',
+                       mtime_tolerance: float = 2.0, append_only: bool = False):
         """Eşleşme güncelle"""
         self.cursor.execute('''
             UPDATE mappings 
-            SET mapping_name = ?, source_path = ?, file_filter = ?, exclude_filter = ?, include_subdirs = ?, target_path = ?
+            SET mapping_name = ?, source_path = ?, file_filter = ?, exclude_filter = ?, include_subdirs = ?, target_path = ?,
+                compare_policy = ?, mtime_tolerance = ?, append_only = ?
             WHERE id = ?
         ''', (mapping_name, source_path, file_filter, exclude_filter, 1 if include_subdirs else 0, 
-              target_path, mapping_id))
+              target_path, compare_policy, mtime_tolerance, 1 if append_only else 0, mapping_id))
+        # Kaynak/hedef değişmiş olabilir - katalog artık geçerli değil
+        self.cursor.execute('DELETE FROM file_catalog WHERE mapping_id = ?', (mapping_id,))
+        self.cursor.execute('DELETE FROM dir_catalog WHERE mapping_id = ?', (mapping_id,))
         self.conn.commit()
     
     def delete_mapping(self, mapping_id: int):
         """Eşleşme sil"""
         self.cursor.execute('DELETE FROM mappings WHERE id = ?', (mapping_id,))
+        self.cursor.execute('DELETE FROM file_catalog WHERE mapping_id = ?', (mapping_id,))
+        self.cursor.execute('DELETE FROM dir_catalog WHERE mapping_id = ?', (mapping_id,))
         self.conn.commit()
     
     # ==================== YEDEKLEMe GEÇMİŞİ İŞLEMLERİ ====================
@@ -357,15 +585,17 @@ class DatabaseManager:
                           total_size_excluded: int,
                           status: str) -> int:
         """Yedekleme geçmişi ekle"""
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        moment = datetime.now()
+        now = moment.strftime('%Y-%m-%d %H:%M:%S')
         self.cursor.execute('''
             INSERT INTO backup_history 
-            (project_id, backup_date, analysis_duration_seconds, duration_seconds, total_files_copied,
+            (project_id, backup_date, backup_ts, analysis_duration_seconds, duration_seconds, total_files_copied,
              total_files_moved_to_revisions, total_files_skipped, total_files_deleted_to_revisions,
              total_files_excluded, total_size_copied, total_size_moved, total_size_skipped, 
              total_size_deleted, total_size_excluded, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (project_id, now, analysis_duration_seconds, duration_seconds, total_files_copied,
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (project_id, now, int(moment.strftime('%Y%m%d%H%M%S')), analysis_duration_seconds,
+              duration_seconds, total_files_copied,
               total_files_moved, total_files_skipped, total_files_deleted, total_files_excluded,
               total_size_copied, total_size_moved, total_size_skipped, total_size_deleted, 
               total_size_excluded, status))
@@ -393,7 +623,7 @@ class DatabaseManager:
             SELECT bh.*, p.name as project_name
             FROM backup_history bh
             JOIN projects p ON bh.project_id = p.id
-            ORDER BY bh.backup_date DESC
+            ORDER BY bh.backup_ts DESC, bh.id DESC
         ''')
         return [dict(row) for row in self.cursor.fetchall()]
     
@@ -402,7 +632,7 @@ class DatabaseManager:
         self.cursor.execute('''
             SELECT * FROM backup_history 
             WHERE project_id = ?
-            ORDER BY backup_date DESC
+            ORDER BY backup_ts DESC, id DESC
         ''', (project_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
@@ -443,6 +673,45 @@ class DatabaseManager:
         row = self.cursor.fetchone()
         return row['file_size'] if row else None
     
+    def get_previous_file_sizes(self, files: List[Tuple[str, str]], current_backup_id: int) -> Dict[Tuple[str, str], int]:
+        """Dosyaların önceki yedeklemelerdeki boyutlarını tek sorguda bul
+        
+        Dosyalar geçici tabloya yazılır ve backup_file_details ile bir kez birleştirilir
+        (dosya başına ayrı sorgu yapılmaz).
+        
+        Args:
+            files: [(dizin yolu, dosya adı), ...]
+            current_backup_id: Mevcut yedekleme ID'si (bu ID'den öncekiler aranır)
+        
+        Returns:
+            {(dizin yolu, dosya adı): önceki boyut} - önceki kaydı olmayan dosyalar yer almaz
+        """
+        if not files:
+            return {}
+        self.cursor.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS previous_size_lookup (
+                file_path TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                PRIMARY KEY (file_path, file_name)
+            ) WITHOUT ROWID
+        ''')
+        self.cursor.execute('DELETE FROM temp.previous_size_lookup')
+        self.cursor.executemany('INSERT OR IGNORE INTO temp.previous_size_lookup (file_path, file_name) VALUES (?, ?)',
+                                files)
+        # SQLite: MAX() ile gruplanan sorguda diğer kolonlar en büyük backup_id'li satırdan gelir
+        self.cursor.execute('''
+            SELECT bfd.file_path, bfd.file_name, bfd.file_size, MAX(bfd.backup_id) AS last_backup_id
+            FROM backup_file_details bfd
+            JOIN temp.previous_size_lookup lookup
+              ON lookup.file_path = bfd.file_path AND lookup.file_name = bfd.file_name
+            WHERE bfd.backup_id < ?
+            GROUP BY bfd.file_path, bfd.file_name
+        ''', (current_backup_id,))
+        sizes = {(row['file_path'], row['file_name']): row['file_size'] for row in self.cursor.fetchall()}
+        self.cursor.execute('DELETE FROM temp.previous_size_lookup')
+        self.conn.commit()
+        return sizes
+    
     def add_backup_file_details(self, backup_id: int, file_details: List[Dict]):
         """Yedekleme dosya detaylarını toplu ekle
         
@@ -456,49 +725,42 @@ class DatabaseManager:
                 - previous_size: Önceki yedekleme boyutu (opsiyonel)
                 - backup_reason: Yedekleme sebebi
         """
-        for detail in file_details:
-            mapping_id = detail.get('mapping_id')
-            previous_size = detail.get('previous_size')
+        self.cursor.executemany('''
+            INSERT INTO backup_file_details
+            (backup_id, mapping_id, file_path, file_name, file_size, previous_size, backup_reason)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [(backup_id, detail.get('mapping_id'), detail['file_path'], detail['file_name'],
+               detail['file_size'], detail.get('previous_size'), detail['backup_reason'])
+              for detail in file_details])
+        
+        # Arama indeksine sadece ilk kez yedeklenen dosyalar eklenir
+        self.cursor.execute('SELECT COALESCE(MAX(id), 0) FROM file_name_index')
+        last_id = self.cursor.fetchone()[0]
+        self.cursor.executemany('''
+            INSERT OR IGNORE INTO file_name_index (file_path, file_name) VALUES (?, ?)
+        ''', [(detail['file_path'], detail['file_name']) for detail in file_details])
+        if self.fts_enabled:
             self.cursor.execute('''
-                INSERT INTO backup_file_details
-                (backup_id, mapping_id, file_path, file_name, file_size, previous_size, backup_reason)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (backup_id, mapping_id, detail['file_path'], detail['file_name'], 
-                  detail['file_size'], previous_size, detail['backup_reason']))
+                INSERT INTO file_name_fts (rowid, file_name)
+                SELECT id, file_name FROM file_name_index WHERE id > ?
+            ''', (last_id,))
         self.conn.commit()
     
-    def _has_mapping_id_column(self) -> bool:
-        """mapping_id kolonu var mı kontrol et"""
-        try:
-            self.cursor.execute("SELECT mapping_id FROM backup_file_details LIMIT 1")
-            return True
-        except sqlite3.OperationalError:
-            return False
-    
     def get_backup_file_details(self, backup_id: int) -> List[Dict]:
         """Yedekleme dosya detaylarını getir"""
-        # mapping_id kolonu var mı kontrol et
-        if self._has_mapping_id_column():
-            self.cursor.execute('''
-                SELECT * FROM backup_file_details
-                WHERE backup_id = ?
-                ORDER BY COALESCE(mapping_id, 0), file_path
-            ''', (backup_id,))
-        else:
-            # Eski veritabanları için - mapping_id olmadan
-            self.cursor.execute('''
-                SELECT * FROM backup_file_details
-                WHERE backup_id = ?
-                ORDER BY file_path
-            ''', (backup_id,))
+        self.cursor.execute('''
+            SELECT * FROM backup_file_details
+            WHERE backup_id = ?
+            ORDER BY COALESCE(mapping_id, 0), file_path
+        ''', (backup_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
     def has_backup_file_details(self, backup_id: int) -> bool:
         """Yedeklemenin dosya detayları var mı kontrol et"""
         self.cursor.execute('''
-            SELECT COUNT(*) FROM backup_file_details WHERE backup_id = ?
+            SELECT EXISTS (SELECT 1 FROM backup_file_details WHERE backup_id = ?)
         ''', (backup_id,))
-        return self.cursor.fetchone()[0] > 0
+        return bool(self.cursor.fetchone()[0])
     
     def get_file_revision_history(self, file_path: str, file_name: str) -> List[Dict]:
         """Bir dosyanın tüm yedeklemelerdeki geçmişini getir
@@ -513,19 +775,285 @@ class DatabaseManager:
                 - backup_date: Yedekleme tarihi
                 - file_size: Dosya boyutu
                 - backup_reason: Yedekleme sebebi
+                - revision_pruned: Arşivdeki sürüm temizlendiyse 1
                 - target_path: Hedef klasör yolu
         """
         self.cursor.execute('''
             SELECT bfd.backup_id, bfd.file_size, bfd.backup_reason, bfd.mapping_id,
-                   bh.backup_date, m.source_path, m.target_path
+                   bfd.revision_pruned, bh.backup_date, m.source_path, m.target_path
             FROM backup_file_details bfd
             JOIN backup_history bh ON bfd.backup_id = bh.id
             LEFT JOIN mappings m ON bfd.mapping_id = m.id
             WHERE bfd.file_path = ? AND bfd.file_name = ?
-            ORDER BY bh.backup_date DESC
+            ORDER BY bh.backup_ts DESC, bfd.backup_id DESC
         ''', (file_path, file_name))
         return [dict(row) for row in self.cursor.fetchall()]
     
+    # ==================== DOSYA KATALOĞU İŞLEMLERİ ====================
+    
+    def get_file_catalog(self, mapping_id: int) -> Dict[str, Tuple[int, float, int]]:
+        """Eşleşmenin dosya kataloğunu getir
+        
+        Args:
+            mapping_id: Eşleşme ID'si
+        
+        Returns:
+            {rel_path: (file_size, mtime, inode)} - son yedeklemede hedefle eşit olan dosyalar
+        """
+        self.cursor.execute('''
+            SELECT rel_path, file_size, mtime, inode FROM file_catalog WHERE mapping_id = ?
+        ''', (mapping_id,))
+        return {row[0]: (row[1], row[2], row[3]) for row in self.cursor.fetchall()}
+    
+    def update_file_catalog(self, mapping_id: int, entries: List[Tuple[str, int, float, int]]):
+        """Dosya kataloğuna kayıt ekle / güncelle (tek transaction)
+        
+        Args:
+            mapping_id: Eşleşme ID'si
+            entries: [(rel_path, file_size, mtime, inode), ...]
+        """
+        if not entries:
+            return
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.cursor.executemany('''
+            INSERT OR REPLACE INTO file_catalog
+            (mapping_id, rel_path, file_size, mtime, inode, last_synced)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(mapping_id, rel_path, size, mtime, inode or 0, now)
+              for rel_path, size, mtime, inode in entries])
+        self.conn.commit()
+    
+    def remove_from_file_catalog(self, mapping_id: int, rel_paths: List[str]):
+        """Kaynakta artık olmayan dosyaları katalogdan sil"""
+        if not rel_paths:
+            return
+        self.cursor.executemany('''
+            DELETE FROM file_catalog WHERE mapping_id = ? AND rel_path = ?
+        ''', [(mapping_id, rel_path) for rel_path in rel_paths])
+        self.conn.commit()
+    
+    def clear_file_catalog(self, mapping_id: int):
+        """Eşleşmenin dosya ve klasör kataloğunu temizle"""
+        self.cursor.execute('DELETE FROM file_catalog WHERE mapping_id = ?', (mapping_id,))
+        self.cursor.execute('DELETE FROM dir_catalog WHERE mapping_id = ?', (mapping_id,))
+        self.conn.commit()
+    
+    def get_dir_catalog(self, mapping_id: int) -> Dict[str, Tuple[float, int]]:
+        """Eşleşmenin klasör kataloğunu getir
+        
+        Args:
+            mapping_id: Eşleşme ID'si
+        
+        Returns:
+            {rel_dir: (mtime, child_count)} - kaynak klasörün kendisi için rel_dir ''
+        """
+        self.cursor.execute('''
+            SELECT rel_dir, mtime, child_count FROM dir_catalog WHERE mapping_id = ?
+        ''', (mapping_id,))
+        return {row[0]: (row[1], row[2]) for row in self.cursor.fetchall()}
+    
+    def replace_dir_catalog(self, mapping_id: int, entries: List[Tuple[str, float, int]]):
+        """Eşleşmenin klasör kataloğunu son taramanın sonucuyla değiştir (tek transaction)
+        
+        Args:
+            mapping_id: Eşleşme ID'si
+            entries: [(rel_dir, mtime, child_count), ...]
+        """
+        self.cursor.execute('DELETE FROM dir_catalog WHERE mapping_id = ?', (mapping_id,))
+        self.cursor.executemany('''
+            INSERT INTO dir_catalog (mapping_id, rel_dir, mtime, child_count)
+            VALUES (?, ?, ?, ?)
+        ''', [(mapping_id, rel_dir, mtime, child_count) for rel_dir, mtime, child_count in entries])
+        self.conn.commit()
+    
+    # ==================== İÇERİK ÖZETİ ÖNBELLEĞİ İŞLEMLERİ ====================
+    
+    def get_hash_cache(self) -> Dict[Tuple[int, int], Tuple[int, float, str]]:
+        """İçerik özeti önbelleğini getir
+        
+        Returns:
+            {(device, inode): (file_size, mtime, hash)}
+        """
+        self.cursor.execute('SELECT device, inode, file_size, mtime, hash FROM hash_cache')
+        return {(row[0], row[1]): (row[2], row[3], row[4]) for row in self.cursor.fetchall()}
+    
+    def update_hash_cache(self, entries: List[Tuple[int, int, int, float, str]]):
+        """İçerik özeti önbelleğine kayıt ekle / güncelle (tek transaction)
+        
+        Args:
+            entries: [(device, inode, file_size, mtime, hash), ...]
+        """
+        if not entries:
+            return
+        self.cursor.executemany('''
+            INSERT OR REPLACE INTO hash_cache (device, inode, file_size, mtime, hash)
+            VALUES (?, ?, ?, ?, ?)
+        ''', entries)
+        self.conn.commit()
+    
+    def clear_hash_cache(self):
+        """İçerik özeti önbelleğini temizle"""
+        self.cursor.execute('DELETE FROM hash_cache')
+        self.conn.commit()
+    
+    # ==================== ARŞİV İNDEKSİ İŞLEMLERİ ====================
+    
+    def add_revision_entries(self, entries: List[Tuple[str, str, str, str, int, int, Optional[int], Optional[int], str]]):
+        """Arşive taşınan sürümleri indekse ekle (tek transaction)
+        
+        Args:
+            entries: [(target_path, revision_folder, stored_path, rel_path, file_size, disk_size,
+                       mapping_id, backup_id, archived_date), ...]
+        """
+        if not entries:
+            return
+        self.cursor.executemany('''
+            INSERT OR REPLACE INTO revision_index
+            (target_path, revision_folder, stored_path, rel_path, file_size, disk_size,
+             mapping_id, backup_id, archived_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', entries)
+        self.conn.commit()
+    
+    def add_backup_revision_folders(self, backup_id: int, folders: List[Tuple[int, str]]):
+        """Yedeklemenin sürüm taşıdığı _REVISIONS klasörlerini kaydet
+        
+        Args:
+            folders: [(mapping_id, revision_folder), ...]
+        """
+        if not folders:
+            return
+        self.cursor.executemany('''
+            INSERT OR IGNORE INTO backup_revision_folders (backup_id, mapping_id, revision_folder)
+            VALUES (?, ?, ?)
+        ''', [(backup_id, mapping_id, revision_folder) for mapping_id, revision_folder in folders])
+        self.conn.commit()
+    
+    def get_revision_summary(self, target_path: str, max_files: int) -> Optional[Dict]:
+        """Hedefin _REVISIONS özetini arşiv indeksinden getir
+        
+        Returns:
+            BackupEngine.summarize_revisions biçiminde özet,
+            indeks bu hedef için henüz klasörden oluşturulmadıysa None
+        """
+        target_path = os.path.normpath(target_path)
+        if self.get_revision_index_date(target_path) is None:
+            return None
+        
+        self.cursor.execute('''
+            SELECT COUNT(*) AS count,
+                   COALESCE(SUM(file_size), 0) AS size,
+                   COALESCE(SUM(COALESCE(disk_size, file_size)), 0) AS disk_size
+            FROM revision_index WHERE target_path = ?
+        ''', (target_path,))
+        row = self.cursor.fetchone()
+        
+        self.cursor.execute('''
+            SELECT revision_folder, stored_path, file_size FROM revision_index
+            WHERE target_path = ?
+            ORDER BY archived_date DESC, id DESC
+            LIMIT ?
+        ''', (target_path, max_files))
+        revisions_path = os.path.join(target_path, '_REVISIONS')
+        files = [{
+            'path': os.path.join(revisions_path, r['revision_folder'], r['stored_path']),
+            'size': r['file_size'],
+            'timestamp_folder': r['revision_folder']
+        } for r in self.cursor.fetchall()]
+        
+        return {'count': row['count'], 'size': row['size'], 'disk_size': row['disk_size'], 'files': files}
+    
+    def get_revision_index_date(self, target_path: str) -> Optional[str]:
+        """Hedefin arşiv indeksinin klasörden en son oluşturulduğu tarih (hiç oluşturulmadıysa None)"""
+        self.cursor.execute('SELECT reconciled_date FROM revision_index_state WHERE target_path = ?',
+                            (os.path.normpath(target_path),))
+        row = self.cursor.fetchone()
+        return row['reconciled_date'] if row else None
+    
+    def reconcile_revision_entries(self, target_path: str, entries: List[Dict],
+                                   mapping_id: Optional[int] = None) -> Tuple[int, int]:
+        """Hedefin arşiv indeksini klasör taramasıyla eşitle (tek transaction)
+        
+        Diskte bulunan ve indekste olan sürümlerin yedekleme bilgileri korunur, boyutları
+        güncellenir; diskte olmayanlar silinir, indekste olmayanlar eklenir.
+        
+        Args:
+            target_path: Hedef klasör
+            entries: BackupEngine.scan_revisions sonucu
+            mapping_id: Yeni eklenen kayıtlara yazılacak eşleştirme ID'si
+            
+        Returns:
+            (eklenen, silinen) kayıt sayısı
+        """
+        target_path = os.path.normpath(target_path)
+        self.cursor.execute('SELECT id, revision_folder, stored_path FROM revision_index WHERE target_path = ?',
+                            (target_path,))
+        existing = {(row['revision_folder'], row['stored_path']): row['id'] for row in self.cursor.fetchall()}
+        
+        updates = []
+        inserts = []
+        for entry in entries:
+            entry_id = existing.pop((entry['revision_folder'], entry['stored_path']), None)
+            if entry_id is not None:
+                updates.append((entry['file_size'], entry['disk_size'], entry_id))
+            else:
+                inserts.append((target_path, entry['revision_folder'], entry['stored_path'], entry['rel_path'],
+                                entry['file_size'], entry['disk_size'], mapping_id, None, entry['archived_date']))
+        
+        self.cursor.executemany('UPDATE revision_index SET file_size = ?, disk_size = ? WHERE id = ?', updates)
+        self.cursor.executemany('DELETE FROM revision_index WHERE id = ?',
+                                [(entry_id,) for entry_id in existing.values()])
+        self.cursor.executemany('''
+            INSERT INTO revision_index
+            (target_path, revision_folder, stored_path, rel_path, file_size, disk_size,
+             mapping_id, backup_id, archived_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', inserts)
+        self.cursor.execute('''
+            INSERT OR REPLACE INTO revision_index_state (target_path, reconciled_date)
+            VALUES (?, ?)
+        ''', (target_path, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        self.conn.commit()
+        return len(inserts), len(existing)
+    
+    def get_revision_entries(self, target_path: str) -> List[Dict]:
+        """Hedef klasörün arşiv indeksini getir (en yeni sürüm önce)"""
+        self.cursor.execute('''
+            SELECT * FROM revision_index
+            WHERE target_path = ?
+            ORDER BY archived_date DESC, id DESC
+        ''', (os.path.normpath(target_path),))
+        return [dict(row) for row in self.cursor.fetchall()]
+    
+    def delete_revision_entries(self, entry_ids: List[int]):
+        """Temizlenen sürümleri indeksten sil"""
+        if not entry_ids:
+            return
+        self.cursor.executemany('DELETE FROM revision_index WHERE id = ?',
+                                [(entry_id,) for entry_id in entry_ids])
+        self.conn.commit()
+    
+    def mark_revisions_pruned(self, entries: List[Tuple[int, str, str, Optional[int], str]]):
+        """Sürümü temizlenen dosyaların yedekleme detaylarını işaretle
+        
+        Kayıt, yedekleme ID'si ile; indekste ID yoksa (klasörden yeniden oluşturulan
+        kayıtlar) sürümün arşiv klasörüne sürüm taşıdığı kayıtlı yedeklemeyle
+        eşleştirilir. Klasörü kayıtlı olmayan eski sürümler işaretlenmez.
+        
+        Args:
+            entries: [(mapping_id, file_path (dizin), file_name, backup_id, revision_folder), ...]
+        """
+        if not entries:
+            return
+        self.cursor.executemany('''
+            UPDATE backup_file_details SET revision_pruned = 1
+            WHERE mapping_id = ?1 AND file_path = ?2 AND file_name = ?3
+              AND (backup_id = ?4
+                   OR (?4 IS NULL AND backup_id IN (SELECT backup_id FROM backup_revision_folders
+                                                    WHERE mapping_id = ?1 AND revision_folder = ?5)))
+        ''', entries)
+        self.conn.commit()
+    
     # ==================== AYARLAR İŞLEMLERİ ====================
     
     def get_setting(self, key: str, default: str = "") -> str:
@@ -559,13 +1087,20 @@ class DatabaseManager:
                 'show_hidden_excluded_files': bool,
                 'show_skipped_files': bool,
                 'show_revision_files': bool,
+                'calculate_excluded_stats': bool,
+                'trust_catalog': bool,
+                'parallel_analysis': bool,
+                'per_device_limit': int,
+                'compare_content': bool,
                 'max_files_to_show': int
             }
         """
         self.cursor.execute(
             '''SELECT mapping_ids, show_backup_files, show_user_excluded_files,
                       show_hidden_excluded_files, show_skipped_files, 
-                      show_revision_files, show_deleted_files, max_files_to_show 
+                      show_revision_files, show_deleted_files, calculate_excluded_stats,
+                      trust_catalog, parallel_analysis, per_device_limit, compare_content,
+                      max_files_to_show 
                FROM analysis_selections WHERE project_id = ?''',
             (project_id,)
         )
@@ -584,6 +1119,11 @@ class DatabaseManager:
                 'show_skipped_files': bool(row['show_skipped_files']),
                 'show_revision_files': bool(row['show_revision_files']),
                 'show_deleted_files': bool(row['show_deleted_files']),
+                'calculate_excluded_stats': bool(row['calculate_excluded_stats']),
+                'trust_catalog': bool(row['trust_catalog']),
+                'parallel_analysis': bool(row['parallel_analysis']),
+                'per_device_limit': row['per_device_limit'] or 1,
+                'compare_content': bool(row['compare_content']),
                 'max_files_to_show': row['max_files_to_show'] or 50
             }
         
@@ -596,6 +1136,11 @@ class DatabaseManager:
             'show_skipped_files': True,
             'show_revision_files': True,
             'show_deleted_files': True,
+            'calculate_excluded_stats': True,
+            'trust_catalog': False,
+            'parallel_analysis': False,
+            'per_device_limit': 1,
+            'compare_content': False,
             'max_files_to_show': 50
         }
     
@@ -606,6 +1151,11 @@ class DatabaseManager:
                                show_skipped_files: bool = True,
                                show_revision_files: bool = True,
                                show_deleted_files: bool = True,
+                               calculate_excluded_stats: bool = True,
+                               trust_catalog: bool = False,
+                               parallel_analysis: bool = False,
+                               per_device_limit: int = 1,
+                               compare_content: bool = False,
                                max_files_to_show: int = 50):
         """Proje için analiz seçimlerini kaydet"""
         now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -615,22 +1165,31 @@ class DatabaseManager:
             INSERT OR REPLACE INTO analysis_selections 
             (project_id, mapping_ids, show_backup_files, show_user_excluded_files,
              show_hidden_excluded_files, show_skipped_files, show_revision_files, 
-             show_deleted_files, max_files_to_show, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             show_deleted_files, calculate_excluded_stats, trust_catalog, parallel_analysis, per_device_limit,
+             compare_content, max_files_to_show, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (project_id, mapping_ids_str, int(show_backup_files), int(show_user_excluded_files),
               int(show_hidden_excluded_files), int(show_skipped_files), 
-              int(show_revision_files), int(show_deleted_files), max_files_to_show, now))
+              int(show_revision_files), int(show_deleted_files), int(calculate_excluded_stats),
+              int(trust_catalog), int(parallel_analysis), per_device_limit, int(compare_content),
+              max_files_to_show, now))
         self.conn.commit()
     
     # ==================== DOSYA ARAMA İŞLEMLERİ ====================
     
-    def search_files_in_backup(self, search_term: str, use_wildcard: bool = False) -> List[Dict]:
-        """Yedekleme veritabanında dosya ara
+    def search_files_in_backup(self, search_term: str, use_wildcard: bool = False,
+                               limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Yedekleme veritabanında dosya ara (en yeni yedekleme önce)
+        
+        Dosya adları arama indeksinde (trigram FTS5) aranır, eşleşen dosyaların
+        yedekleme kayıtları indeksli olarak getirilir - tüm geçmiş taranmaz.
         
         Args:
             search_term: Aranacak kelime veya wildcard pattern
             use_wildcard: True ise fnmatch wildcard kullanılır, 
-                         False ise LIKE ile içerik araması yapılır
+                         False ise dosya adı içinde geçen kelime aranır
+            limit: Getirilecek en fazla kayıt (None: tümü)
+            offset: Atlanacak kayıt sayısı (sayfalama için)
         
         Returns:
             List of dict: Her kayıt şunları içerir:
@@ -643,39 +1202,68 @@ class DatabaseManager:
                 - source_path: Kaynak klasör yolu (mapping'den)
                 - target_path: Hedef klasör yolu (mapping'den)
         """
+        matched_sql, pattern = self._file_name_match(search_term, use_wildcard)
+        # Önce sayfadaki kayıtlar sadece indeks kolonlarıyla seçilir, tam satırlar
+        # sadece bu kayıtlar için okunur
+        self.cursor.execute(f'''
+            SELECT bfd.backup_id, bfd.file_path, bfd.file_name, bfd.file_size,
+                   bfd.backup_reason, bfd.mapping_id, bh.backup_date,
+                   m.source_path, m.target_path
+            FROM backup_file_details bfd
+            JOIN backup_history bh ON bfd.backup_id = bh.id
+            LEFT JOIN mappings m ON bfd.mapping_id = m.id
+            WHERE bfd.id IN (
+                SELECT page.id
+                FROM ({matched_sql}) matched
+                JOIN backup_file_details page
+                  ON page.file_path = matched.file_path AND page.file_name = matched.file_name
+                JOIN backup_history page_bh ON page.backup_id = page_bh.id
+                ORDER BY page_bh.backup_ts DESC, page.backup_id DESC, page.id
+                LIMIT ? OFFSET ?
+            )
+            ORDER BY bh.backup_ts DESC, bfd.backup_id DESC, bfd.id
+        ''', (pattern, -1 if limit is None else limit, offset))
+        return [dict(row) for row in self.cursor.fetchall()]
+    
+    def count_files_in_backup(self, search_term: str, use_wildcard: bool = False) -> int:
+        """Aramayla eşleşen yedekleme kaydı sayısı (search_files_in_backup ile aynı koşul)"""
+        matched_sql, pattern = self._file_name_match(search_term, use_wildcard)
+        self.cursor.execute(f'''
+            SELECT COUNT(*)
+            FROM ({matched_sql}) matched
+            JOIN backup_file_details bfd
+              ON bfd.file_path = matched.file_path AND bfd.file_name = matched.file_name
+            JOIN backup_history bh ON bfd.backup_id = bh.id
+        ''', (pattern,))
+        return self.cursor.fetchone()[0]
+    
+    def _file_name_match(self, search_term: str, use_wildcard: bool) -> Tuple[str, str]:
+        """Arama terimiyle eşleşen dosyaları (dizin, ad) seçen alt sorgu ve LIKE pattern'i"""
         if use_wildcard:
             # Wildcard pattern - SQLite LIKE'a çevir
             # fnmatch: * -> %, ? -> _
-            sql_pattern = search_term.replace('*', '%').replace('?', '_')
-            
-            self.cursor.execute('''
-                SELECT bfd.backup_id, bfd.file_path, bfd.file_name, bfd.file_size,
-                       bfd.backup_reason, bfd.mapping_id, bh.backup_date, 
-                       m.source_path, m.target_path
-                FROM backup_file_details bfd
-                JOIN backup_history bh ON bfd.backup_id = bh.id
-                LEFT JOIN mappings m ON bfd.mapping_id = m.id
-                WHERE bfd.file_name LIKE ?
-                ORDER BY bh.backup_date DESC
-            ''', (sql_pattern,))
+            pattern = search_term.replace('*', '%').replace('?', '_')
         else:
             # Normal arama - dosya adı içinde kelime geçiyor mu
-            search_pattern = f'%{search_term}%'
-            
-            self.cursor.execute('''
-                SELECT bfd.backup_id, bfd.file_path, bfd.file_name, bfd.file_size,
-                       bfd.backup_reason, bfd.mapping_id, bh.backup_date,
-                       m.source_path, m.target_path
-                FROM backup_file_details bfd
-                JOIN backup_history bh ON bfd.backup_id = bh.id
-                LEFT JOIN mappings m ON bfd.mapping_id = m.id
-                WHERE bfd.file_name LIKE ?
-                ORDER BY bh.backup_date DESC
-            ''', (search_pattern,))
+            pattern = f'%{search_term}%'
         
-        return [dict(row) for row in self.cursor.fetchall()]
+        if self.fts_enabled:
+            # Trigram indeksi LIKE aramalarını (büyük/küçük harf duyarsız) indeksten yapar
+            return '''
+                SELECT file_path, file_name FROM file_name_index
+                WHERE id IN (SELECT rowid FROM file_name_fts WHERE file_name LIKE ?)
+            ''', pattern
+        return '''
+            SELECT file_path, file_name FROM file_name_index
+            WHERE file_name LIKE ?
+        ''', pattern
     
     def close(self):
-        """Veritabanı bağlantısını kapat"""
-        if self.conn:
-            self.conn.close()
+        """Tüm thread'lerin veritabanı bağlantılarını kapat"""
+        with self._pool_lock:
+            connections = list(self._connections.values()) + self._idle
+            self._connections.clear()
+            self._idle.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
@@ -0,0 +1,334 @@
+"""
+Smart Backup - Parça Parça Dosya Kopyalama
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+shutil.copy2 yerine kullanılan kopyalama fonksiyonu. Veri, destekleniyorsa
+çekirdek içinde (os.copy_file_range / os.sendfile), desteklenmiyorsa tampon
+ile parça parça kopyalanır. Her parçadan sonra iptal kontrol edilir ve
+kopyalanan byte sayısı bildirilir; böylece GB'larca büyüklükteki dosyalarda
+da iptal anında gerçekleşir ve ilerleme görülebilir.
+
+Dosya önce hedefin yanına geçici bir isimle yazılır, tamamlanınca tek
+adımda (os.replace) yerine konur. İptal ya da hata durumunda hedefte yarım
+dosya kalmaz, mevcut hedef dosyaya dokunulmaz.
+
+Kaynak ve hedef aynı dosya sistemindeyse (btrfs, XFS vb.) önce FICLONE ile
+reflink denenir: veri kopyalanmaz, iki dosya aynı blokları paylaşır
+(copy-on-write). Desteklenmezse normal kopyalamaya geçilir.
+
+Büyük ve az değişen dosyalar (PST, sanal disk, SQLite) için blok farkı
+kopyalaması: hedefteki eski sürüm reflink ile klonlanır, kaynakla aynı
+konumdaki bloklar karşılaştırılır ve sadece değişen bloklar yazılır. Eski
+sürüm _REVISIONS'a olduğu gibi taşınır; iki dosya değişmeyen blokları paylaşır.
+
+Sadece büyüyen dosyalar (log, journal) için sona ekleme: hedef, kaynağın
+başıyla aynıysa sadece eklenen kısım hedefin sonuna yazılır.
+
+Gerekli Kütüphaneler:
+    - os     (standart kütüphane)
+    - sys    (standart kütüphane)
+    - errno  (standart kütüphane)
+    - shutil (standart kütüphane)
+    - fcntl  (standart kütüphane, sadece Linux/Unix - reflink için)
+"""
+
+import os
+import sys
+import errno
+import shutil
+from typing import Callable, NamedTuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Çekirdek kopyalamasında tek çağrıda kopyalanan en fazla byte
+KERNEL_CHUNK_SIZE = 8 * 1024 * 1024
+# Tamponlu kopyalamada okunan parça boyutu
+BUFFER_SIZE = 1024 * 1024
+# Kopyalama sürerken hedefin yanında oluşturulan geçici dosyanın eki
+TEMP_SUFFIX = '.sbtmp'
+# Blok farkı kopyalamasında karşılaştırılan blok boyutu
+DELTA_BLOCK_SIZE = 1024 * 1024
+# Sona ekleme tespitinde karşılaştırılan son blok boyutu
+APPEND_CHECK_SIZE = 64 * 1024
+# Linux FICLONE ioctl kodu (_IOW(0x94, 9, int)) - tüm dosyayı reflink olarak kopyalar
+FICLONE = 0x40049409
+
+# Bu hatalar çekirdek kopyalamasının bu dosya sistemi/platform için
+# desteklenmediğini gösterir - bir sonraki yönteme geçilir
+_UNSUPPORTED_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF,
+                       errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM}
+
+
+class CopyCancelled(Exception):
+    """Kopyalama kullanıcı tarafından iptal edildi"""
+
+
+class CopyResult(NamedTuple):
+    """Kopyalama sonucu"""
+    written: int = 0      # Diske fiilen yazılan byte
+    cloned: int = 0       # Reflink ile klonlanan (yazılmayan) byte
+    delta: bool = False   # Blok farkı kopyalaması yapıldı
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    # sendfile hedefin mevcut konumuna yazar - konum her çağrıda ilerler
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _kernel_methods():
+    """Bu platformda kullanılabilecek çekirdek kopyalama yöntemleri"""
+    methods = []
+    if hasattr(os, 'copy_file_range'):
+        methods.append(_copy_file_range)
+    # macOS'ta sendfile sadece soket hedefi destekler
+    if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+        methods.append(_sendfile)
+    return methods
+
+
+def _try_clone(fsrc, fdst) -> bool:
+    """Aynı dosya sistemindeki dosyayı reflink ile kopyalamayı dene
+
+    Returns:
+        True: klonlandı, False: desteklenmiyor (normal kopyalamaya geçilmeli)
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    if os.fstat(src_fd).st_dev != os.fstat(dst_fd).st_dev:
+        return False  # Farklı dosya sistemi - reflink mümkün değil
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _UNSUPPORTED_ERRNOS or e.errno == errno.ENOTTY:
+            return False
+        raise
+
+
+def _check_cancel(cancel_check: Optional[Callable[[], bool]]):
+    if cancel_check and cancel_check():
+        raise CopyCancelled()
+
+
+def _copy_data(fsrc, fdst, cancel_check: Optional[Callable[[], bool]],
+               progress: Optional[Callable[[int], None]], offset: int = 0):
+    """Açık dosyalar arasında veriyi parça parça kopyala (offset'ten itibaren)"""
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    size = os.fstat(src_fd).st_size
+    fdst.seek(offset)  # sendfile hedefin mevcut konumuna yazar
+    start = offset
+
+    for method in _kernel_methods():
+        try:
+            while True:
+                _check_cancel(cancel_check)
+                copied = method(src_fd, dst_fd, offset, KERNEL_CHUNK_SIZE)
+                if not copied:
+                    break
+                offset += copied
+                if progress:
+                    progress(copied)
+        except OSError as e:
+            if offset == start and e.errno in _UNSUPPORTED_ERRNOS:
+                continue  # Hiç byte kopyalanmadı - sonraki yöntemi dene
+            raise
+        if offset >= size:
+            return
+        break  # Kısa kaldıysa kalan kısım tamponla kopyalanır
+
+    # Tamponlu kopyalama (çekirdek yöntemi yoksa ya da yarıda kaldıysa kaldığı yerden)
+    fsrc.seek(offset)
+    fdst.seek(offset)
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    while True:
+        _check_cancel(cancel_check)
+        read = fsrc.readinto(buffer)
+        if not read:
+            break
+        fdst.write(view[:read])
+        if progress:
+            progress(read)
+
+
+def copy_file(source_file: str, target_file: str,
+              cancel_check: Optional[Callable[[], bool]] = None,
+              progress: Optional[Callable[[int], None]] = None,
+              before_replace: Optional[Callable[[], None]] = None,
+              allow_clone: bool = True) -> CopyResult:
+    """Dosyayı tarih ve izinleriyle birlikte kopyala (shutil.copy2 karşılığı)
+
+    Args:
+        source_file: Kaynak dosya
+        target_file: Hedef dosya (varsa üzerine yazılır)
+        cancel_check: True döndürürse kopyalama durdurulur (opsiyonel)
+        progress: Her parçadan sonra kopyalanan byte sayısıyla çağrılır (opsiyonel)
+        before_replace: Veri kopyalandıktan sonra, hedef yerine konmadan hemen önce
+            çağrılır - örn: mevcut hedefi _REVISIONS'a taşımak için (opsiyonel)
+        allow_clone: Aynı dosya sistemindeyse reflink dene
+
+    Returns:
+        CopyResult - klonlandıysa cloned, normal kopyalandıysa written dolu
+
+    Raises:
+        CopyCancelled: İptal edildi (hedef değişmedi, geçici dosya silindi)
+        OSError: Kopyalama hatası (hedef değişmedi, geçici dosya silindi)
+    """
+    temp_file = target_file + TEMP_SUFFIX
+    try:
+        with open(source_file, 'rb') as fsrc, open(temp_file, 'wb') as fdst:
+            _check_cancel(cancel_check)
+            size = os.fstat(fsrc.fileno()).st_size
+            if allow_clone and _try_clone(fsrc, fdst):
+                result = CopyResult(cloned=size)
+                if progress:
+                    progress(size)
+            else:
+                _copy_data(fsrc, fdst, cancel_check, progress)
+                result = CopyResult(written=size)
+        shutil.copystat(source_file, temp_file)
+        if before_replace:
+            before_replace()
+        os.replace(temp_file, target_file)
+        return result
+    except BaseException:
+        _remove_quietly(temp_file)
+        raise
+
+
+def delta_copy_file(source_file: str, target_file: str,
+                    cancel_check: Optional[Callable[[], bool]] = None,
+                    progress: Optional[Callable[[int], None]] = None,
+                    before_replace: Optional[Callable[[], None]] = None) -> Optional[CopyResult]:
+    """Mevcut hedefi kaynağa göre sadece değişen blokları yazarak güncelle
+
+    Hedef reflink ile geçici dosyaya klonlanır (aynı dosya sistemi olduğundan veri
+    kopyalanmaz), kaynakla aynı konumdaki bloklar karşılaştırılır ve farklı olanlar
+    geçici dosyaya yazılır. Sonra before_replace çağrılır (eski hedef _REVISIONS'a
+    taşınır) ve geçici dosya hedefin yerine konur. Eski hedef hiç değiştirilmez.
+
+    Yerinde değişen dosyalar içindir (PST, sanal disk, veritabanı); araya veri
+    eklenip kayan dosyalarda çoğu blok farklı görünür.
+
+    Returns:
+        CopyResult (written: yazılan byte, delta=True); hedefin dosya sistemi
+        reflink desteklemiyorsa None - normal kopyalama yapılmalı
+
+    Raises:
+        CopyCancelled: İptal edildi (hedef değişmedi, geçici dosya silindi)
+        OSError: Kopyalama hatası (hedef değişmedi, geçici dosya silindi)
+    """
+    temp_file = target_file + TEMP_SUFFIX
+    try:
+        with open(target_file, 'rb') as fold, open(temp_file, 'wb') as ftmp:
+            if not _try_clone(fold, ftmp):
+                raise _CloneUnsupported()
+
+        written = 0
+        block = bytearray(DELTA_BLOCK_SIZE)
+        old_block = bytearray(DELTA_BLOCK_SIZE)
+        view = memoryview(block)
+        old_view = memoryview(old_block)
+        with open(source_file, 'rb') as fsrc, open(temp_file, 'r+b') as ftmp:
+            offset = 0
+            while True:
+                _check_cancel(cancel_check)
+                read = fsrc.readinto(block)
+                if not read:
+                    break
+                old_read = ftmp.readinto(old_block)
+                if old_read != read or view[:read] != old_view[:read]:
+                    ftmp.seek(offset)
+                    ftmp.write(view[:read])
+                    written += read
+                offset += read
+                ftmp.seek(offset)
+                if progress:
+                    progress(read)
+            # Kaynak kısaldıysa hedefin fazlası kesilir
+            ftmp.truncate(offset)
+        shutil.copystat(source_file, temp_file)
+        if before_replace:
+            before_replace()
+        os.replace(temp_file, target_file)
+        return CopyResult(written=written, delta=True)
+    except _CloneUnsupported:
+        _remove_quietly(temp_file)
+        return None
+    except BaseException:
+        _remove_quietly(temp_file)
+        raise
+
+
+class _CloneUnsupported(Exception):
+    """Hedefin dosya sistemi reflink desteklemiyor"""
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def is_appended(source_file: str, target_file: str, old_size: int) -> bool:
+    """Hedef, kaynağın başıyla aynı mı (kaynak sadece sonuna ekleme yapılarak büyümüş mü)
+
+    Tüm dosya okunmaz: eski boyutun son bloğu (APPEND_CHECK_SIZE) karşılaştırılır.
+    Log ve journal dosyaları için yeterli bir kontroldür.
+    """
+    if old_size <= 0:
+        return False
+    start = max(0, old_size - APPEND_CHECK_SIZE)
+    try:
+        with open(source_file, 'rb') as fsrc, open(target_file, 'rb') as fdst:
+            if os.fstat(fsrc.fileno()).st_size <= old_size or os.fstat(fdst.fileno()).st_size != old_size:
+                return False
+            fsrc.seek(start)
+            fdst.seek(start)
+            return fsrc.read(old_size - start) == fdst.read(old_size - start)
+    except OSError:
+        return False
+
+
+def append_tail(source_file: str, target_file: str, old_size: int,
+                cancel_check: Optional[Callable[[], bool]] = None,
+                progress: Optional[Callable[[int], None]] = None) -> CopyResult:
+    """Kaynağın old_size'dan sonraki kısmını hedefin sonuna ekle
+
+    Hedef yerinde güncellenir. İptal ya da hata durumunda hedef eski boyutuna
+    kesilir ve tarihi geri yüklenir - bir sonraki yedeklemede yine eklenir.
+
+    Returns:
+        CopyResult (written: eklenen byte)
+
+    Raises:
+        CopyCancelled: İptal edildi (hedef eski haline döndü)
+        OSError: Kopyalama hatası (hedef eski haline döndü)
+    """
+    old_stat = os.stat(target_file)
+    try:
+        with open(source_file, 'rb') as fsrc, open(target_file, 'r+b') as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            _copy_data(fsrc, fdst, cancel_check, progress, old_size)
+        shutil.copystat(source_file, target_file)
+        return CopyResult(written=size - old_size)
+    except BaseException:
+        try:
+            os.truncate(target_file, old_size)
+            os.utime(target_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,260 @@
+"""
+Smart Backup - Derlenmiş Dosya Filtresi
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Eşleşmenin dosya filtresi (file_filter) ve hariç tutma filtresi (exclude_filter)
+bir kez regex'e derlenir. Böylece her dosya için "dahil / hariç / eşleşmiyor" ve
+her klasör için "bu klasöre girmeye gerek var mı" sorusu, pattern sayısından
+bağımsız olarak tek bir regex eşleştirmesiyle cevaplanır.
+
+Gerekli Kütüphaneler:
+    - os        (standart kütüphane)
+    - re        (standart kütüphane)
+    - functools (standart kütüphane)
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+
+# classify_file() sonuçları
+MATCH_INCLUDED = 'included'   # Yedeklemeye dahil
+MATCH_EXCLUDED = 'excluded'   # Hariç tutma filtresine takıldı
+MATCH_NONE = None             # Dosya filtresine uymuyor (hiçbir gruba girmez)
+
+# Regex içinde klasör ayırıcı ve "ayırıcı olmayan karakter"
+_SEP = re.escape(os.sep)
+_NOT_SEP = '[^' + re.escape(os.sep) + ']'
+
+# Windows'ta dosya adları büyük/küçük harf duyarsız (glob/fnmatch ile aynı davranış)
+_REGEX_FLAGS = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+
+
+def split_patterns(filter_text: str) -> List[str]:
+    """Virgülle ayrılmış filtre metnini pattern listesine çevir"""
+    if not filter_text:
+        return []
+    return [p.strip() for p in filter_text.split(',') if p.strip()]
+
+
+def split_pattern_parts(pattern: str) -> List[str]:
+    """Pattern'i klasör parçalarına ayır (hem \\ hem / ayırıcı desteklenir)"""
+    normalized = pattern.replace('/', os.sep).replace('\\', os.sep)
+    return [p for p in normalized.split(os.sep) if p]
+
+
+def _translate_segment(segment: str) -> str:
+    """Tek bir yol parçasındaki glob ifadesini regex'e çevir
+
+    "*" ve "?" klasör ayırıcısını geçmez (glob ile aynı).
+    """
+    result = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == '*':
+            # Ardışık yıldızları tek yıldız say
+            while i < n and segment[i] == '*':
+                i += 1
+            result.append(_NOT_SEP + '*')
+        elif c == '?':
+            result.append(_NOT_SEP)
+        elif c == '[':
+            j = i
+            if j < n and segment[j] == '!':
+                j += 1
+            if j < n and segment[j] == ']':
+                j += 1
+            while j < n and segment[j] != ']':
+                j += 1
+            if j >= n:
+                # Kapanmayan köşeli parantez - düz karakter
+                result.append('\\[')
+            else:
+                stuff = segment[i:j].replace('\\', '\\\\')
+                i = j + 1
+                if stuff.startswith('!'):
+                    stuff = '^' + stuff[1:]
+                elif stuff.startswith('^'):
+                    stuff = '\\' + stuff
+                result.append('[' + stuff + ']')
+        else:
+            result.append(re.escape(c))
+    return ''.join(result)
+
+
+def _translate_parts(parts: List[str]) -> str:
+    """Yol parçası listesini ("**" destekli) regex'e çevir"""
+    regex = ''
+    for idx, part in enumerate(parts):
+        is_last = idx == len(parts) - 1
+        if part == '**':
+            if is_last:
+                # Sonda "**" -> kalan her şey
+                regex += '.*'
+            else:
+                # "**" -> sıfır veya daha fazla klasör
+                regex += '(?:' + _NOT_SEP + '+' + _SEP + ')*'
+        else:
+            regex += _translate_segment(part)
+            if not is_last:
+                regex += _SEP
+    return regex
+
+
+def _compile_alternation(regexes: List[str]) -> Optional['re.Pattern']:
+    """Regex listesini tek bir alternation regex'ine derle (boşsa None)"""
+    if not regexes:
+        return None
+    return re.compile('(?:' + '|'.join('(?:' + r + ')' for r in regexes) + r')\Z', _REGEX_FLAGS)
+
+
+def _covers(exclude_file_part: str, include_pattern: str) -> bool:
+    """Exclude pattern'inin dosya kısmı, include pattern'inin eşleştiği her adı kapsıyor mu"""
+    if exclude_file_part == '*':
+        return True
+    if os.path.normcase(exclude_file_part) == os.path.normcase(include_pattern):
+        return True
+    # "*.*" nokta içeren her adı kapsar; "*.py" gibi sabit nokta içeren pattern'ler hep noktalı ad üretir
+    if exclude_file_part == '*.*' and '.' in include_pattern and '[' not in include_pattern:
+        return True
+    return False
+
+
+class FilterMatcher:
+    """file_filter / exclude_filter ifadelerinin derlenmiş hali
+
+    Filtrelerin anlamı:
+        - "*.zip" -> tüm zip dosyaları
+        - "__pycache__\\*.*" -> her seviyedeki __pycache__ klasörü (recursive modda)
+        - "temp\\*.*" -> temp klasöründeki (ve alt klasörlerindeki) tüm dosyalar
+        - "**\\*.log" -> tüm alt klasörlerdeki log dosyaları (explicit)
+        - "SmartBackup\\TEST_MAIN\\*.*" -> belirli klasördeki dosyalar
+        - "C:\\Temp\\*.*" -> tam yol (kaynak klasörden bağımsız)
+
+    Nesne oluşturmak yerine get_filter_matcher() kullanılmalıdır; aynı filtreler
+    için derlenmiş nesne tekrar kullanılır.
+    """
+
+    def __init__(self, file_filter: str, exclude_filter: str, include_subdirs: bool):
+        self.include_subdirs = include_subdirs
+        self.include_patterns = split_patterns(file_filter) or ['*.*']
+
+        # ---- Include ----
+        # Nokta ile başlayan dosya adları sadece dosya kısmı nokta ile başlayan
+        # pattern'lerle eşleşir (".env", ".*" gibi) - glob ile aynı davranış
+        name_regexes = []
+        path_regexes = []
+        dot_name_regexes = []
+        dot_path_regexes = []
+        for pattern in self.include_patterns:
+            parts = split_pattern_parts(pattern)
+            if len(parts) == 1:
+                name_regexes.append(_translate_segment(parts[0]))
+                if parts[0].startswith('.'):
+                    dot_name_regexes.append(name_regexes[-1])
+            elif parts:
+                # Klasör içeren pattern (örn: "docs\*.txt")
+                if include_subdirs:
+                    parts = ['**'] + parts
+                path_regexes.append(_translate_parts(parts))
+                if parts[-1].startswith('.'):
+                    dot_path_regexes.append(path_regexes[-1])
+
+        self._include_all = name_regexes == [_NOT_SEP + '*']
+        self._include_name_re = _compile_alternation(name_regexes)
+        self._include_path_re = _compile_alternation(path_regexes)
+        self._include_dot_name_re = _compile_alternation(dot_name_regexes)
+        self._include_dot_path_re = _compile_alternation(dot_path_regexes)
+
+        # ---- Exclude ----
+        rel_rules = []   # Relative yol ile karşılaştırılacak parça listeleri
+        abs_rules = []   # Tam yol ile karşılaştırılacak parça listeleri
+        for pattern in split_patterns(exclude_filter):
+            parts = split_pattern_parts(pattern)
+            if not parts:
+                continue
+            if os.path.isabs(pattern) or ':' in pattern:
+                abs_rules.append(parts)
+            elif '**' in parts or not include_subdirs:
+                rel_rules.append(parts)
+            else:
+                # Örnek: "__pycache__\*.*" -> "**\__pycache__\*.*"
+                rel_rules.append(['**'] + parts)
+                if len(parts) >= 2 and '*' in parts[-1]:
+                    # "build\*.*" -> build klasörünün alt klasörleri de dahil: "**\build\**\*.*"
+                    rel_rules.append(['**'] + parts[:-1] + ['**', parts[-1]])
+
+        self.has_excludes = bool(rel_rules or abs_rules)
+        self._exclude_rel_re = _compile_alternation([_translate_parts(p) for p in rel_rules])
+        self._exclude_abs_re = _compile_alternation([_translate_parts(p) for p in abs_rules])
+
+        # ---- Klasör budama ----
+        # "<önek>\**\<dosya>" biçimindeki kurallar, <dosya> kısmı dahil edilebilecek
+        # her dosyayı kapsıyorsa, <önek> ile eşleşen klasörün tüm alt ağacı hariçtir.
+        prune_regexes = []
+        name_only_includes = self._include_path_re is None
+        for parts in rel_rules:
+            if len(parts) >= 3 and parts[-2] == '**' and '**' not in parts[-1]:
+                file_part = parts[-1]
+                if name_only_includes and all(_covers(file_part, inc) for inc in self.include_patterns):
+                    prune_regexes.append(_translate_parts(parts[:-2]))
+        self._prune_re = _compile_alternation(prune_regexes)
+
+    def classify_file(self, rel_path: str, full_path: Optional[str] = None):
+        """Dosyayı sınıflandır
+
+        Args:
+            rel_path: Kaynak klasöre göre relative yol (os.sep ile ayrılmış)
+            full_path: Tam yol (tam yol içeren exclude pattern'leri için)
+
+        Returns:
+            MATCH_INCLUDED, MATCH_EXCLUDED veya MATCH_NONE
+        """
+        name = rel_path.rsplit(os.sep, 1)[-1]
+        if name.startswith('.'):
+            included = ((self._include_dot_name_re is not None and self._include_dot_name_re.match(name)) or
+                        (self._include_dot_path_re is not None and self._include_dot_path_re.match(rel_path)))
+            if not included:
+                return MATCH_NONE
+        elif not self._include_all:
+            included = ((self._include_name_re is not None and self._include_name_re.match(name)) or
+                        (self._include_path_re is not None and self._include_path_re.match(rel_path)))
+            if not included:
+                return MATCH_NONE
+
+        if self._exclude_rel_re is not None and self._exclude_rel_re.match(rel_path):
+            return MATCH_EXCLUDED
+        if self._exclude_abs_re is not None and full_path and self._exclude_abs_re.match(full_path):
+            return MATCH_EXCLUDED
+        return MATCH_INCLUDED
+
+    def matches_include_name(self, name: str) -> bool:
+        """Dosya adı include filtresine uyuyor mu (sadece ad içeren pattern'ler için)"""
+        if name.startswith('.'):
+            return self._include_dot_name_re is not None and self._include_dot_name_re.match(name) is not None
+        if self._include_all:
+            return True
+        return self._include_name_re is not None and self._include_name_re.match(name) is not None
+
+    def should_prune_dir(self, rel_dir: str) -> bool:
+        """Klasörün tüm alt ağacı hariç tutma filtresiyle kapsanıyor mu
+
+        Args:
+            rel_dir: Klasörün kaynak klasöre göre relative yolu
+
+        Returns:
+            True ise klasöre girmeden tüm içeriği "hariç (filtre)" sayılabilir
+        """
+        return self._prune_re is not None and self._prune_re.match(rel_dir) is not None
+
+
+@lru_cache(maxsize=64)
+def get_filter_matcher(file_filter: str, exclude_filter: str, include_subdirs: bool) -> FilterMatcher:
+    """Derlenmiş filtreyi getir (aynı filtreler için önbellekten)"""
+    return FilterMatcher(file_filter or '', exclude_filter or '', bool(include_subdirs))
@@ -0,0 +1,119 @@
+"""
+Smart Backup - İçerik Özeti (Hash) Hesaplama
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+İçerik karşılaştırma modunda kaynak ve hedef dosyaların içerik özetini
+(BLAKE2b) hesaplar. Özetler (disk, inode, boyut, tarih) anahtarıyla
+önbelleğe alınır; stat bilgisi değişmeyen dosya bir daha okunmaz.
+Önbellek veritabanında saklanır (hash_cache tablosu).
+
+Dosyalar thread havuzunda okunur - hash hesaplaması sırasında GIL
+bırakıldığından birden fazla dosya aynı anda işlenebilir.
+
+Gerekli Kütüphaneler:
+    - os                 (standart kütüphane)
+    - hashlib            (standart kütüphane)
+    - threading          (standart kütüphane)
+    - concurrent.futures (standart kütüphane)
+"""
+
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Aynı anda okunan dosya sayısı
+HASH_WORKERS = 4
+# Dosya okuma parça boyutu
+HASH_BUFFER_SIZE = 1024 * 1024
+# BLAKE2b özet uzunluğu (byte) - 128 bit karşılaştırma için yeterli
+HASH_DIGEST_SIZE = 16
+
+
+def compute_file_hash(path: str, cancel_check: Optional[Callable[[], bool]] = None) -> Optional[str]:
+    """Dosyanın içerik özetini hesapla
+
+    Returns:
+        Hex özet, iptal edildiyse None
+    """
+    digest = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb') as f:
+        while True:
+            if cancel_check and cancel_check():
+                return None
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class FileHasher:
+    """Önbellekli, thread havuzlu dosya özeti hesaplayıcı
+
+    Önbellek {(disk, inode): (boyut, tarih, özet)} biçimindedir. Yeni
+    hesaplanan özetler new_entries listesinde toplanır, analiz sonunda
+    veritabanına yazılır.
+    """
+
+    def __init__(self, cache: Optional[Dict[Tuple[int, int], Tuple[int, float, str]]] = None,
+                 max_workers: int = HASH_WORKERS):
+        self.cache = cache if cache is not None else {}
+        self.max_workers = max(1, max_workers)
+        self.new_entries: List[Tuple[int, int, int, float, str]] = []
+        self.hashed_count = 0   # Okunarak hesaplanan dosya sayısı
+        self.cached_count = 0   # Önbellekten gelen dosya sayısı
+        self._lock = threading.Lock()
+
+    def hash_file(self, path: str, cancel_check: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """Tek dosyanın özetini getir (önbellekte yoksa hesapla)
+
+        Returns:
+            Hex özet; dosya okunamadıysa ya da iptal edildiyse None
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        # inode 0 ise (bazı ağ/FAT diskleri) dosya kimliği belirsizdir - önbellek kullanılmaz
+        key = (st.st_dev, st.st_ino) if st.st_ino else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime:
+                with self._lock:
+                    self.cached_count += 1
+                return cached[2]
+
+        try:
+            file_hash = compute_file_hash(path, cancel_check)
+        except OSError:
+            return None
+        if file_hash is None:
+            return None
+
+        with self._lock:
+            self.hashed_count += 1
+            if key is not None:
+                self.cache[key] = (st.st_size, st.st_mtime, file_hash)
+                self.new_entries.append((st.st_dev, st.st_ino, st.st_size, st.st_mtime, file_hash))
+        return file_hash
+
+    def hash_files(self, paths: Iterable[str],
+                   cancel_check: Optional[Callable[[], bool]] = None) -> Dict[str, Optional[str]]:
+        """Dosyaların özetlerini thread havuzunda hesapla
+
+        Returns:
+            {yol: özet} - okunamayan dosyalar için None
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            hashes = executor.map(lambda p: self.hash_file(p, cancel_check), paths)
+            return dict(zip(paths, hashes))
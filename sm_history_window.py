@@ -9,7 +9,7 @@ Gerekli Kütüphaneler:
 """
 
 import customtkinter as ctk
-from tkinter import ttk, Menu
+from tkinter import ttk, Menu, filedialog
 from typing import List, Dict
 from datetime import datetime
 import os
@@ -17,6 +17,8 @@ import subprocess
 import fnmatch
 from sm_database import DatabaseManager
 from sm_backup_engine import BackupEngine
+from sm_revision_store import RevisionStore
+from sm_revision_compress import find_revision_file, is_compressed_revision, restore_revision
 from sm_ui_components import ConfirmDialog
 
 
@@ -830,6 +832,10 @@ class DetailWindow(ctk.CTkToplevel):
                     previous_size_str = BackupEngine.format_size(previous_size) if previous_size is not None else "-"
                     
                     backup_reason = file_detail['backup_reason']
+                    # Arşivdeki eski sürümü saklama politikasıyla silinmiş
+                    shown_reason = backup_reason
+                    if file_detail.get('revision_pruned'):
+                        shown_reason += " (arşiv temizlendi)"
                     
                     # Satırı ekle
                     item_id = self.file_tree.insert("", "end", values=(
@@ -837,7 +843,7 @@ class DetailWindow(ctk.CTkToplevel):
                         file_detail['file_name'],
                         BackupEngine.format_size(file_detail['file_size']),
                         previous_size_str,
-                        backup_reason
+                        shown_reason
                     ), tags=(tag_name,))
                     
                     # "daha yeni" ise özel renklendirme yap
@@ -1055,6 +1061,9 @@ class FileHistoryWindow(ctk.CTkToplevel):
         ctk.CTkButton(button_frame, text="📂 Göster",
                      command=self._show_in_explorer, width=100).pack(side="left", padx=(0, 5))
         
+        ctk.CTkButton(button_frame, text="💾 Geri Yükle...",
+                     command=self._restore_revision, width=120).pack(side="left", padx=(0, 5))
+        
         ctk.CTkButton(button_frame, text="Kapat (ESC)",
                      command=self.destroy, width=100).pack(side="right")
     
@@ -1069,6 +1078,7 @@ class FileHistoryWindow(ctk.CTkToplevel):
                                  font=list_font)
         
         self.context_menu.add_command(label="📂 Göster", command=self._show_in_explorer)
+        self.context_menu.add_command(label="💾 Geri Yükle...", command=self._restore_revision)
     
     def _show_context_menu(self, event):
         """Context menüyü göster"""
@@ -1092,6 +1102,10 @@ class FileHistoryWindow(ctk.CTkToplevel):
         # Tag'leri yapılandır
         self.tree.tag_configure('missing', background='#FF6B6B', foreground='white')
         self.tree.tag_configure('exists', background='', foreground='')
+        self.tree.tag_configure('pruned', background='', foreground='gray')
+        
+        # Tekilleştirme deposu manifestleri (hedef başına bir kez okunur)
+        revision_stores = {}
         
         for record in history:
             # Tarihi formatla
@@ -1131,13 +1145,31 @@ class FileHistoryWindow(ctk.CTkToplevel):
             else:
                 expected_path = os.path.join(revisions_base, date_folder, self.file_name)
             
-            # Dosyanın fiziksel olarak var olup olmadığını kontrol et
-            file_exists = os.path.exists(expected_path)
+            # Dosyanın fiziksel olarak var olup olmadığını kontrol et (sıkıştırılmış olabilir)
+            found_path = find_revision_file(expected_path)
+            file_exists = found_path is not None
+            if file_exists:
+                expected_path = found_path
+            
+            # Arşiv yolu silinmişse içerik tekilleştirme deposunda kalmış olabilir
+            store_path = None
+            if not file_exists:
+                if revisions_base not in revision_stores:
+                    revision_stores[revisions_base] = RevisionStore(revisions_base)
+                store_path = revision_stores[revisions_base].resolve(expected_path)
             
             # Durum ve tag belirleme
             if file_exists:
-                status = "✓ Mevcut"
+                status = "✓ Mevcut (sıkıştırılmış)" if is_compressed_revision(expected_path) else "✓ Mevcut"
+                tag = 'exists'
+            elif store_path:
+                status = "✓ Depoda"
                 tag = 'exists'
+                expected_path = store_path
+            elif record.get('revision_pruned'):
+                # Saklama politikasıyla bilerek silinmiş
+                status = "🗑 Temizlendi"
+                tag = 'pruned'
             else:
                 status = "✗ Bulunamadı"
                 tag = 'missing'
@@ -1167,18 +1199,46 @@ class FileHistoryWindow(ctk.CTkToplevel):
             subprocess.run(['explorer', '/select,', os.path.normpath(full_path)])
         else:
             ConfirmDialog.show_warning(self, "Uyarı", "Dosya bulunamadı!")
+    
+    def _restore_revision(self):
+        """Seçili revision'u seçilen konuma kaydet (sıkıştırılmışsa açılarak)"""
+        selection = self.tree.selection()
+        if not selection:
+            ConfirmDialog.show_warning(self, "Uyarı", "Lütfen bir revision seçin!")
+            return
+        
+        item = self.tree.item(selection[0])
+        full_path = item['values'][4]
+        if not full_path or not os.path.exists(full_path):
+            ConfirmDialog.show_warning(self, "Uyarı", "Dosya bulunamadı!")
+            return
+        
+        destination = filedialog.asksaveasfilename(parent=self, title="Revision'u Kaydet",
+                                                   initialfile=self.file_name)
+        if not destination:
+            return
+        
+        try:
+            restore_revision(full_path, destination)
+        except OSError as e:
+            ConfirmDialog.show_error(self, "Hata", f"Dosya geri yüklenemedi:\n{str(e)}")
+            return
+        ConfirmDialog.show_info(self, "Bilgi", f"Dosya geri yüklendi:\n{destination}")
 
 
 class FileSearchWindow(ctk.CTkToplevel):
     """Yedekleme veritabanında dosya arama penceresi"""
     
-    MAX_DISPLAY_RESULTS = 200  # Maksimum gösterilecek satır sayısı
+    MAX_DISPLAY_RESULTS = 200  # Sayfa başına gösterilecek satır sayısı
     
     def __init__(self, parent, db_manager: DatabaseManager):
         super().__init__(parent)
         
         self.db = db_manager
-        self.search_results = []  # Arama sonuçlarını sakla
+        self.search_results = []  # Gösterilen sayfanın arama sonuçları
+        self.search_query = None  # (arama terimi, wildcard mı) - sayfa değiştirirken kullanılır
+        self.total_count = 0      # Aramayla eşleşen toplam kayıt
+        self.page = 0
         
         self.title("Dosya Arama")
         self.geometry("1150x700+150+50")
@@ -1238,6 +1298,16 @@ class FileSearchWindow(ctk.CTkToplevel):
                                          font=("", 11), text_color="#FF9060")
         self.result_label.pack(side="left")
         
+        # Sayfalama
+        self.next_page_btn = ctk.CTkButton(info_frame, text="▶", width=30, state="disabled",
+                                           command=lambda: self._show_page(self.page + 1))
+        self.next_page_btn.pack(side="right", padx=(5, 0))
+        self.page_label = ctk.CTkLabel(info_frame, text="", font=("", 11))
+        self.page_label.pack(side="right", padx=(5, 0))
+        self.prev_page_btn = ctk.CTkButton(info_frame, text="◀", width=30, state="disabled",
+                                           command=lambda: self._show_page(self.page - 1))
+        self.prev_page_btn.pack(side="right", padx=(15, 0))
+        
         # Bilgi etiketi
         info_text = "💡 İpucu: Wildcard kullanmak için * veya ? kullanın. Örn: *.py, test*.txt, dosya?.doc"
         self.info_label = ctk.CTkLabel(info_frame, text=info_text,
@@ -1339,52 +1409,51 @@ class FileSearchWindow(ctk.CTkToplevel):
                 self.context_menu.grab_release()
     
     def _perform_search(self):
-        """Arama işlemini gerçekleştir"""
+        """Arama işlemini gerçekleştir (toplam sayı + ilk sayfa)"""
         search_term = self.search_entry.get().strip()
         
         if not search_term:
             ConfirmDialog.show_warning(self, "Uyarı", "Lütfen aranacak bir kelime girin!")
             return
         
+        # Wildcard kontrolü
+        has_wildcard = '*' in search_term or '?' in search_term
+        
+        # Veritabanından arama yap - sadece gösterilen sayfa getirilir
+        self.search_query = (search_term, has_wildcard)
+        self.total_count = self.db.count_files_in_backup(search_term, has_wildcard)
+        self._show_page(0)
+    
+    def _show_page(self, page: int):
+        """Arama sonuçlarının istenen sayfasını göster"""
+        if self.search_query is None:
+            return
+        
+        page_count = max(1, -(-self.total_count // self.MAX_DISPLAY_RESULTS))
+        self.page = min(max(page, 0), page_count - 1)
+        
         # Mevcut sonuçları temizle
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Wildcard kontrolü
-        has_wildcard = '*' in search_term or '?' in search_term
-        
-        # Veritabanından arama yap
-        self.search_results = self.db.search_files_in_backup(search_term, has_wildcard)
+        search_term, has_wildcard = self.search_query
+        self.search_results = self.db.search_files_in_backup(
+            search_term, has_wildcard,
+            limit=self.MAX_DISPLAY_RESULTS, offset=self.page * self.MAX_DISPLAY_RESULTS
+        )
         
         # Her sonuç için revision klasör yolunu hesapla
         for result in self.search_results:
             result['display_path'] = self._calculate_revision_path(result)
         
-        total_count = len(self.search_results)
-        display_count = min(total_count, self.MAX_DISPLAY_RESULTS)
-        
-        # Sonuç etiketini güncelle
-        if total_count == 0:
-            self.result_label.configure(text="Sonuç bulunamadı.", text_color="#FF6B6B")
-        elif total_count > self.MAX_DISPLAY_RESULTS:
-            self.result_label.configure(
-                text=f"Toplam {total_count:,} dosya bulundu. İlk {self.MAX_DISPLAY_RESULTS} sonuç gösteriliyor.",
-                text_color="#FF8D2F"
-            )
-        else:
-            print(f"DEBUG: Toplam {total_count:,} dosya bulundu.")
-            self.result_label.configure(
-                text=f"  Toplam {total_count:,} dosya bulundu.",
-                text_color="#BC5500"
-            )
+        # Sonuç etiketini ve sayfa düğmelerini güncelle
+        self._restore_result_label()
+        self.page_label.configure(text=f"Sayfa {self.page + 1} / {page_count}" if self.total_count else "")
+        self.prev_page_btn.configure(state="normal" if self.page > 0 else "disabled")
+        self.next_page_btn.configure(state="normal" if self.page < page_count - 1 else "disabled")
         
         # Sonuçları tabloya ekle
-        for i, result in enumerate(self.search_results[:display_count]):
-            # DEBUG: İlk 5 sonuç için bilgileri yazdır
-            if i < 5:
-                print(f"DEBUG Sonuç {i+1}: {result['file_name']} ({result['backup_date']})")
-                print(f"  display_path: {result.get('display_path')}")
-            
+        for result in self.search_results:
             # Tarihi formatla
             try:
                 dt = datetime.strptime(result['backup_date'], '%Y-%m-%d %H:%M:%S')
@@ -1456,8 +1525,8 @@ class FileSearchWindow(ctk.CTkToplevel):
         # Hedef klasördeki dosya yolu
         target_file_path = os.path.join(target_file_dir, file_name)
         
-        # Önce _REVISIONS'da ara, sonra hedef klasörde
-        if os.path.exists(revision_file_path):
+        # Önce _REVISIONS'da ara (sıkıştırılmış olabilir), sonra hedef klasörde
+        if find_revision_file(revision_file_path):
             # Dosya _REVISIONS klasöründe - dizin yolunu döndür
             return os.path.dirname(revision_file_path)
         elif os.path.exists(target_file_path):
@@ -1511,6 +1580,12 @@ class FileSearchWindow(ctk.CTkToplevel):
             self.tree.delete(item)
         self.result_label.configure(text="")
         self.search_results = []
+        self.search_query = None
+        self.total_count = 0
+        self.page = 0
+        self.page_label.configure(text="")
+        self.prev_page_btn.configure(state="disabled")
+        self.next_page_btn.configure(state="disabled")
         self.search_entry.focus_set()
     
     def _sort_column(self, col):
@@ -1606,8 +1681,9 @@ class FileSearchWindow(ctk.CTkToplevel):
         display_path = file_data['display_path']
         file_name = file_data['file_name']
         
-        # Tam dosya yolu
+        # Tam dosya yolu (arşivde sıkıştırılmış olabilir)
         full_path = os.path.join(display_path, file_name)
+        full_path = find_revision_file(full_path) or full_path
         print(f">>> DEBUG: Açılacak dosya yolu: {full_path}")
         print(f">>> DEBUG: Dosya var mı: {os.path.exists(full_path)}")
         
@@ -1654,13 +1730,17 @@ class FileSearchWindow(ctk.CTkToplevel):
     
     def _restore_result_label(self):
         """Sonuç etiketini eski haline döndür"""
-        total_count = len(self.search_results)
-        if total_count == 0:
+        total_count = self.total_count
+        if self.search_query is None:
             self.result_label.configure(text="", text_color="#4138E5")
+        elif total_count == 0:
+            self.result_label.configure(text="Sonuç bulunamadı.", text_color="#FF6B6B")
         elif total_count > self.MAX_DISPLAY_RESULTS:
+            first = self.page * self.MAX_DISPLAY_RESULTS + 1
+            last = first + len(self.search_results) - 1
             self.result_label.configure(
-                text=f"Toplam {total_count:,} dosya bulundu. İlk {self.MAX_DISPLAY_RESULTS} sonuç gösteriliyor.",
-                text_color="#5B0900"
+                text=f"Toplam {total_count:,} dosya bulundu. {first:,}-{last:,} arası gösteriliyor.",
+                text_color="#FF8D2F"
             )
         else:
             self.result_label.configure(
@@ -302,6 +302,8 @@ class SmartBackupApp(ctk.CTk, ProjectMixin, MappingMixin, BackupMixin):
         self.mapping_context_menu.add_command(label="Kaynak Klasörü Aç", command=self._open_source_folder)
         self.mapping_context_menu.add_command(label="Hedef Klasörü Aç", command=self._open_target_folder)
         self.mapping_context_menu.add_command(label="Revision'ları Aç", command=self._open_revisions_folder)
+        self.mapping_context_menu.add_command(label="Arşivi Temizle...", command=self._prune_revisions)
+        self.mapping_context_menu.add_command(label="Arşiv İndeksini Yenile", command=self._reconcile_revision_index)
         self.mapping_context_menu.config(font=list_font)   
 
         # Sağ tık için binding
@@ -7,7 +7,10 @@ Bu modül SmartBackupApp sınıfı için eşleştirme işlemlerini içerir.
 """
 
 import os
-from sm_ui_components import MappingDialog, ConfirmDialog, SourceSearchDialog
+import threading
+from sm_ui_components import MappingDialog, ConfirmDialog, SourceSearchDialog, RetentionDialog
+from sm_backup_engine import BackupEngine, COMPARE_MTIME, DEFAULT_MTIME_TOLERANCE
+from sm_retention import RetentionPolicy, plan_retention
 
 
 class MappingMixin:
@@ -94,9 +97,11 @@ class MappingMixin:
         self.wait_window(dialog)
         
         if dialog.result:
-            mapping_name, source, filter_str, exclude_str, subdirs, target = dialog.result
+            (mapping_name, source, filter_str, exclude_str, subdirs, target,
+             compare_policy, mtime_tolerance, append_only) = dialog.result
             self.db.add_mapping(self.current_project_id, source, filter_str, 
-                              exclude_str, subdirs, target, mapping_name)
+                              exclude_str, subdirs, target, mapping_name,
+                              compare_policy, mtime_tolerance, append_only)
             # Hedef sürücü kontrolünü güncelle
             self._check_all_target_drives()
             self._load_mappings()
@@ -121,13 +126,18 @@ class MappingMixin:
                               mapping.get('exclude_filter', ''),
                               bool(mapping['include_subdirs']),
                               mapping['target_path'],
-                              mapping.get('mapping_name', ''))
+                              mapping.get('mapping_name', ''),
+                              mapping.get('compare_policy') or COMPARE_MTIME,
+                              mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+                              bool(mapping.get('append_only')))
         self.wait_window(dialog)
         
         if dialog.result:
-            mapping_name, source, filter_str, exclude_str, subdirs, target = dialog.result
+            (mapping_name, source, filter_str, exclude_str, subdirs, target,
+             compare_policy, mtime_tolerance, append_only) = dialog.result
             self.db.update_mapping(mapping_id, source, filter_str, exclude_str, 
-                                 subdirs, target, mapping_name)
+                                 subdirs, target, mapping_name,
+                                 compare_policy, mtime_tolerance, append_only)
             # Hedef sürücü kontrolünü güncelle
             self._check_all_target_drives()
             self._load_mappings()
@@ -182,7 +192,10 @@ class MappingMixin:
                 mapping.get('exclude_filter', ''),
                 bool(mapping['include_subdirs']),
                 mapping['target_path'],
-                mapping_name
+                mapping_name,
+                mapping.get('compare_policy') or COMPARE_MTIME,
+                mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+                bool(mapping.get('append_only'))
             )
             # Hedef sürücü kontrolünü güncelle
             self._check_all_target_drives()
@@ -216,7 +229,10 @@ class MappingMixin:
             'file_filter': mapping['file_filter'],
             'exclude_filter': mapping.get('exclude_filter', ''),
             'include_subdirs': bool(mapping['include_subdirs']),
-            'target_path': mapping['target_path']
+            'target_path': mapping['target_path'],
+            'compare_policy': mapping.get('compare_policy') or COMPARE_MTIME,
+            'mtime_tolerance': mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+            'append_only': bool(mapping.get('append_only'))
         }
         
         # Yapıştır butonunu göster
@@ -242,7 +258,10 @@ class MappingMixin:
                 self.clipboard_mapping['exclude_filter'],
                 self.clipboard_mapping['include_subdirs'],
                 self.clipboard_mapping['target_path'],
-                self.clipboard_mapping.get('mapping_name', '')
+                self.clipboard_mapping.get('mapping_name', ''),
+                self.clipboard_mapping.get('compare_policy', COMPARE_MTIME),
+                self.clipboard_mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+                self.clipboard_mapping.get('append_only', False)
             )
             # Hedef sürücü kontrolünü güncelle
             self._check_all_target_drives()
@@ -410,6 +429,156 @@ class MappingMixin:
                 f"Klasör açılamadı:\n\n{str(e)}"
             )
     
+    def _prune_revisions(self):
+        """Seçili eşleştirmenin _REVISIONS klasörünü saklama politikasına göre temizle
+        
+        Sürümler klasör taranmadan arşiv indeksinden okunur. Önizlemede hiçbir dosya
+        silinmez; temizlemede silinen sürümler indeksten çıkarılır ve yedekleme
+        detaylarında "arşiv temizlendi" olarak işaretlenir.
+        """
+        selection = self.mapping_tree.selection()
+        if not selection:
+            return
+        
+        item = self.mapping_tree.item(selection[0])
+        mapping_id = item['values'][0]
+        
+        mappings = self.db.get_mappings_by_project(self.current_project_id)
+        mapping = next((m for m in mappings if m['id'] == mapping_id), None)
+        if not mapping:
+            return
+        
+        target_path = mapping['target_path']
+        if self.db.get_revision_index_date(target_path) is None:
+            ConfirmDialog.show_info(
+                self,
+                "Arşivi Temizle",
+                f"Bu hedefin arşiv indeksi henüz oluşturulmamış:\n\n{target_path}\n\n"
+                f"Önce analiz yapın ya da \"Arşiv İndeksini Yenile\" komutunu çalıştırın."
+            )
+            return
+        entries = self.db.get_revision_entries(target_path)
+        if not entries:
+            ConfirmDialog.show_info(
+                self,
+                "Arşivi Temizle",
+                f"Arşiv indeksinde bu hedef için kayıtlı sürüm yok:\n\n{target_path}"
+            )
+            return
+        
+        dialog = RetentionDialog(self, target_path, self.settings.get_retention_policy(), len(entries))
+        self.wait_window(dialog)
+        if not dialog.result:
+            return
+        
+        values, dry_run = dialog.result
+        self.settings.set_retention_policy(**values)
+        policy = RetentionPolicy(
+            keep_last=values['keep_last'],
+            keep_daily=values['keep_daily'],
+            keep_weekly=values['keep_weekly'],
+            keep_monthly=values['keep_monthly'],
+            max_bytes=values['max_mb'] * 1024 * 1024
+        )
+        
+        if not dry_run:
+            _, prune = plan_retention(entries, policy)
+            if not prune:
+                ConfirmDialog.show_info(self, "Arşivi Temizle", "Politikaya göre silinecek sürüm yok.")
+                return
+            prune_size = sum(e.get('file_size') or 0 for e in prune)
+            if not ConfirmDialog.ask(
+                self,
+                "Arşivi Temizle",
+                f"{len(prune)} arşiv sürümü ({BackupEngine.format_size(prune_size)}) kalıcı olarak silinecek.\n\n"
+                f"Devam etmek istiyor musunuz?"
+            ):
+                return
+        
+        # Sürümün kaynak dosyası: yedekleme detayları kaynak yoluyla tutulur
+        source_paths = {m['id']: m['source_path'] for m in mappings}
+        
+        def prune_thread():
+            self.backup_engine.reset_cancel()
+            result = self.backup_engine.prune_revisions(target_path, entries, policy, dry_run)
+            if not dry_run:
+                pruned = result['pruned']
+                self.db.delete_revision_entries([e['id'] for e in pruned])
+                marks = []
+                for entry in pruned:
+                    source_path = source_paths.get(entry.get('mapping_id'))
+                    if source_path is None:
+                        continue
+                    source_file = os.path.join(source_path, entry['rel_path'])
+                    marks.append((entry['mapping_id'], os.path.dirname(source_file),
+                                  os.path.basename(source_file), entry.get('backup_id'),
+                                  entry['revision_folder']))
+                self.db.mark_revisions_pruned(marks)
+            self.after(0, lambda: self._log_prune_result(target_path, result, dry_run))
+        
+        self._log_write(f"\nArşiv temizliği {'önizleniyor' if dry_run else 'yapılıyor'}: {target_path}", "#FFAE35")
+        threading.Thread(target=prune_thread, daemon=True).start()
+    
+    def _reconcile_revision_index(self):
+        """Seçili eşleştirmenin arşiv indeksini _REVISIONS klasöründen yeniden oluştur
+        
+        _REVISIONS'ta elle yapılan değişikliklerden (silme, taşıma) sonra analiz
+        istatistiklerinin ve arşiv temizliğinin doğru çalışması için kullanılır.
+        """
+        selection = self.mapping_tree.selection()
+        if not selection:
+            return
+        
+        item = self.mapping_tree.item(selection[0])
+        mapping_id = item['values'][0]
+        
+        mappings = self.db.get_mappings_by_project(self.current_project_id)
+        mapping = next((m for m in mappings if m['id'] == mapping_id), None)
+        if not mapping:
+            return
+        
+        target_path = mapping['target_path']
+        
+        def reconcile_thread():
+            self.backup_engine.reset_cancel()
+            entries = self.backup_engine.scan_revisions(target_path)
+            added, removed = self.db.reconcile_revision_entries(target_path, entries, mapping_id)
+            summary = BackupEngine.summarize_revisions(target_path, entries, 0)
+            self.after(0, lambda: self._log_write(
+                f"  → Arşiv indeksi yenilendi: {summary['count']:,} sürüm "
+                f"({BackupEngine.format_size(summary['size'])}, diskte {BackupEngine.format_size(summary['disk_size'])}) - "
+                f"eklenen: {added}, çıkarılan: {removed}", "#65FE65"
+            ))
+        
+        self._log_write(f"\nArşiv indeksi yenileniyor: {os.path.join(target_path, '_REVISIONS')}", "#FFAE35")
+        threading.Thread(target=reconcile_thread, daemon=True).start()
+    
+    def _log_prune_result(self, target_path: str, result: dict, dry_run: bool, preview_limit: int = 50):
+        """Arşiv temizliği sonucunu log'a yaz"""
+        title = "ARŞİV TEMİZLİĞİ ÖNİZLEMESİ" if dry_run else "ARŞİV TEMİZLİĞİ TAMAMLANDI"
+        self._log_write("=" * 80, "#00A0E9")
+        self._log_write(title, "#A9E4FF")
+        self._log_write("=" * 80, "#00A0E9")
+        self._log_write(f"Hedef: {target_path}")
+        
+        pruned = result['pruned']
+        for entry in pruned[:preview_limit]:
+            self._log_write(
+                f"  🗑 {entry['revision_folder']}{os.sep}{entry['stored_path']} "
+                f"({BackupEngine.format_size(entry.get('file_size') or 0)})", "#FF6B6B"
+            )
+        if len(pruned) > preview_limit:
+            self._log_write(f"  ... ve {len(pruned) - preview_limit} sürüm daha", "#FF6B6B")
+        
+        label = "Silinecek" if dry_run else "Silinen"
+        self._log_write(f"Saklanan: {len(result['kept'])} sürüm ({BackupEngine.format_size(result['kept_size'])})", "#65FE65")
+        self._log_write(f"{label}: {len(pruned)} sürüm ({BackupEngine.format_size(result['pruned_size'])})", "#FFA500")
+        if result['missing'] > 0:
+            self._log_write(f"Diskte bulunamayan (indeksten çıkarıldı): {result['missing']} sürüm", "#B5B4B4")
+        if result['errors'] > 0:
+            self._log_write(f"Silinemeyen: {result['errors']} sürüm", "#FF0000")
+        self._log_write("=" * 80, "#00A0E9")
+    
     def _show_mapping_context_menu(self, event):
         """Eşleştirme context menüsünü göster"""
         # Tıklanan öğeyi seç
@@ -453,3 +622,5 @@ class MappingMixin:
         if not has_inaccessible:
             self.mapping_context_menu.add_command(label="Hedef Klasörü Aç", command=self._open_target_folder)
             self.mapping_context_menu.add_command(label="Revision'ları Aç", command=self._open_revisions_folder)
+            self.mapping_context_menu.add_command(label="Arşivi Temizle...", command=self._prune_revisions)
+            self.mapping_context_menu.add_command(label="Arşiv İndeksini Yenile", command=self._reconcile_revision_index)
@@ -0,0 +1,125 @@
+"""
+Smart Backup - Disk Bazlı Paralel Çalıştırıcı
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Birbirinden bağımsız eşleşmelerin (analiz, hesaplama) aynı anda çalıştırılması
+için yardımcılar. Her iş, dokunduğu disklerin (st_dev) listesiyle birlikte
+verilir; aynı diskte aynı anda en fazla "disk başına limit" kadar iş çalışır.
+Böylece farklı disklerdeki eşleşmeler paralel taranırken aynı diskteki iki
+tarama birbirini yavaşlatmaz.
+
+Gerekli Kütüphaneler:
+    - os                 (standart kütüphane)
+    - concurrent.futures (standart kütüphane)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Varsayılan eşzamanlılık ayarları
+DEFAULT_MAX_WORKERS = 4        # Toplam aynı anda çalışan iş sayısı
+DEFAULT_PER_DEVICE_LIMIT = 1   # Aynı diskte aynı anda çalışan iş sayısı
+
+
+def get_device_id(path: str) -> Hashable:
+    """Yolun bulunduğu diskin kimliğini getir (st_dev)
+
+    Yol henüz yoksa (örn: ilk yedeklemede hedef klasör) var olan ilk üst
+    klasörün diski kullanılır. Hiç erişilemiyorsa sürücü adı döndürülür.
+    """
+    current = os.path.abspath(path)
+    while True:
+        try:
+            return os.stat(current).st_dev
+        except OSError:
+            parent = os.path.dirname(current)
+            if parent == current:
+                return os.path.splitdrive(current)[0] or current
+            current = parent
+
+
+def get_mapping_devices(mapping: dict) -> Tuple[Hashable, ...]:
+    """Eşleşmenin kaynak ve hedef disklerini getir (tekrarsız)"""
+    devices = [get_device_id(mapping['source_path'])]
+    if mapping.get('target_path'):
+        target_device = get_device_id(mapping['target_path'])
+        if target_device not in devices:
+            devices.append(target_device)
+    return tuple(devices)
+
+
+def run_by_device(items: Sequence[Any], devices: Sequence[Tuple[Hashable, ...]],
+                  func: Callable[[Any], Any],
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  per_device_limit: int = DEFAULT_PER_DEVICE_LIMIT,
+                  cancel_check: Optional[Callable[[], bool]] = None,
+                  on_start: Optional[Callable[[int, Any], None]] = None
+                  ) -> Iterator[Tuple[int, Any, Any, Optional[Exception]]]:
+    """İşleri disk limitine uyarak paralel çalıştır, sonuçları giriş sırasıyla döndür
+
+    Args:
+        items: İş listesi (örn: eşleşmeler)
+        devices: Her iş için dokunduğu disklerin listesi (items ile aynı sırada)
+        func: Her iş için çağrılacak fonksiyon - func(item) -> sonuç
+        max_workers: Toplam eşzamanlı iş sayısı
+        per_device_limit: Bir diskte aynı anda çalışabilecek iş sayısı
+        cancel_check: True döndürürse bekleyen işler başlatılmaz (opsiyonel)
+        on_start: İş başlarken çağrılır - on_start(index, item) (opsiyonel)
+
+    Yields:
+        (index, item, sonuç, hata) - index sırasıyla; hata varsa sonuç None olur.
+        İptal edildiğinde başlatılmamış işler döndürülmez.
+    """
+    max_workers = max(1, max_workers)
+    per_device_limit = max(1, per_device_limit)
+
+    pending = list(range(len(items)))  # Başlatılmayı bekleyen işler (sıralı)
+    running = {}                       # future -> index
+    device_load = {}                   # disk -> çalışan iş sayısı
+    finished = {}                      # index -> (sonuç, hata)
+    next_index = 0                     # Sıradaki döndürülecek iş
+
+    def can_start(index: int) -> bool:
+        return all(device_load.get(dev, 0) < per_device_limit for dev in devices[index])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            # Limitlere uyan bekleyen işleri sırayla başlat
+            if not (cancel_check and cancel_check()):
+                for index in list(pending):
+                    if len(running) >= max_workers:
+                        break
+                    if can_start(index):
+                        pending.remove(index)
+                        for dev in devices[index]:
+                            device_load[dev] = device_load.get(dev, 0) + 1
+                        if on_start:
+                            on_start(index, items[index])
+                        running[executor.submit(func, items[index])] = index
+            else:
+                pending.clear()
+
+            if not running:
+                break
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                for dev in devices[index]:
+                    device_load[dev] -= 1
+                error = future.exception()
+                finished[index] = (None if error else future.result(), error)
+
+            # Tamamlanan işleri giriş sırasıyla döndür
+            while next_index in finished:
+                result, error = finished.pop(next_index)
+                yield next_index, items[next_index], result, error
+                next_index += 1
+
+    # İptal nedeniyle araya boşluk girmişse kalan tamamlanmış işler
+    for index in sorted(finished):
+        result, error = finished[index]
+        yield index, items[index], result, error
@@ -8,6 +8,7 @@ Bu modül SmartBackupApp sınıfı için proje işlemlerini içerir.
 
 import customtkinter as ctk
 from sm_ui_components import ProjectDialog, ConfirmDialog
+from sm_backup_engine import COMPARE_MTIME, DEFAULT_MTIME_TOLERANCE
 
 
 class ProjectMixin:
@@ -205,7 +206,10 @@ class ProjectMixin:
                         mapping['file_filter'],
                         mapping.get('exclude_filter', ''),
                         bool(mapping['include_subdirs']),
-                        mapping['target_path']
+                        mapping['target_path'],
+                        compare_policy=mapping.get('compare_policy') or COMPARE_MTIME,
+                        mtime_tolerance=mapping.get('mtime_tolerance', DEFAULT_MTIME_TOLERANCE),
+                        append_only=bool(mapping.get('append_only'))
                     )
                 
                 self._load_projects()
@@ -0,0 +1,128 @@
+"""
+Smart Backup - Arşiv (_REVISIONS) Saklama Politikası
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Arşiv indeksindeki sürümlerden hangilerinin saklanıp hangilerinin
+silineceğini belirler. Klasör taranmaz, sadece indeks kayıtları kullanılır.
+
+Kurallar:
+    - Son N sürüm: Her dosyanın en yeni N sürümü saklanır
+    - Günlük / haftalık / aylık (GFS): Her dosya için son D günün, W haftanın,
+      M ayın her birinden en yeni sürüm saklanır
+    - En fazla boyut: Saklanan sürümlerin toplamı bu sınırı aşarsa en eski
+      sürümlerden başlanarak silinir (diğer kurallardan önceliklidir)
+
+Bir sürüm, saklama kurallarından herhangi biri seçiyorsa saklanır. Hiçbir
+saklama kuralı verilmemişse sadece boyut sınırı uygulanır.
+
+Gerekli Kütüphaneler:
+    - datetime (standart kütüphane)
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+
+class RetentionPolicy(NamedTuple):
+    """Arşiv saklama kuralları (0: kural kullanılmaz)"""
+    keep_last: int = 0      # Dosya başına en yeni N sürüm
+    keep_daily: int = 0     # Son D günün her birinden bir sürüm
+    keep_weekly: int = 0    # Son W haftanın her birinden bir sürüm
+    keep_monthly: int = 0   # Son M ayın her birinden bir sürüm
+    max_bytes: int = 0      # Saklanan sürümlerin toplam boyut sınırı
+
+    def has_keep_rules(self) -> bool:
+        """Dosya başına saklama kuralı var mı"""
+        return any((self.keep_last, self.keep_daily, self.keep_weekly, self.keep_monthly))
+
+    def is_empty(self) -> bool:
+        """Hiçbir kural verilmemiş mi (hiçbir sürüm silinmez)"""
+        return not self.has_keep_rules() and not self.max_bytes
+
+
+def _archived_time(entry: Dict) -> datetime:
+    """Kaydın arşivlenme zamanı"""
+    try:
+        return datetime.strptime(entry['archived_date'], '%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return datetime.min
+
+
+def _day(moment: datetime):
+    """Günlük dönem anahtarı"""
+    return moment.date()
+
+
+def _week(moment: datetime):
+    """Haftalık dönem anahtarı (ISO yıl, hafta)"""
+    return moment.isocalendar()[:2]
+
+
+def _month(moment: datetime):
+    """Aylık dönem anahtarı"""
+    return moment.year, moment.month
+
+
+def _select_periods(versions: List[Tuple[datetime, Dict]], period_of: Callable, count: int) -> List[Dict]:
+    """Son 'count' dönemin her birinden en yeni sürümü seç (sürümler yeniden eskiye sıralı)"""
+    selected = []
+    last_period = None
+    for moment, entry in versions:
+        if len(selected) >= count:
+            break
+        period = period_of(moment)
+        if period != last_period:
+            selected.append(entry)
+            last_period = period
+    return selected
+
+
+def plan_retention(entries: List[Dict], policy: RetentionPolicy) -> Tuple[List[Dict], List[Dict]]:
+    """Saklanacak ve silinecek sürümleri belirle
+
+    Args:
+        entries: Arşiv indeksi kayıtları (rel_path, archived_date, file_size içermeli)
+        policy: Saklama kuralları
+
+    Returns:
+        (saklanacaklar, silinecekler) - ikisi de en yeni sürüm önce sıralı
+    """
+    if policy.is_empty():
+        return list(entries), []
+
+    # Dosya başına sürümler, yeniden eskiye
+    by_file: Dict[str, List[Tuple[datetime, Dict]]] = {}
+    for entry in entries:
+        by_file.setdefault(entry['rel_path'], []).append((_archived_time(entry), entry))
+
+    keep_ids = set()
+    for versions in by_file.values():
+        versions.sort(key=lambda v: (v[0], v[1].get('id') or 0), reverse=True)
+        if not policy.has_keep_rules():
+            keep_ids.update(id(entry) for _, entry in versions)
+            continue
+        selected = [entry for _, entry in versions[:policy.keep_last]]
+        if policy.keep_daily:
+            selected += _select_periods(versions, _day, policy.keep_daily)
+        if policy.keep_weekly:
+            selected += _select_periods(versions, _week, policy.keep_weekly)
+        if policy.keep_monthly:
+            selected += _select_periods(versions, _month, policy.keep_monthly)
+        keep_ids.update(id(entry) for entry in selected)
+
+    # Boyut sınırı: en eski saklananlardan başlayarak sil
+    if policy.max_bytes:
+        kept = sorted((entry for entry in entries if id(entry) in keep_ids),
+                      key=lambda e: (_archived_time(e), e.get('id') or 0))
+        total = sum(entry.get('file_size') or 0 for entry in kept)
+        for entry in kept:
+            if total <= policy.max_bytes:
+                break
+            keep_ids.discard(id(entry))
+            total -= entry.get('file_size') or 0
+
+    order = sorted(entries, key=lambda e: (_archived_time(e), e.get('id') or 0), reverse=True)
+    keep = [entry for entry in order if id(entry) in keep_ids]
+    prune = [entry for entry in order if id(entry) not in keep_ids]
+    return keep, prune
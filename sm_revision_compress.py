@@ -0,0 +1,278 @@
+"""
+Smart Backup - Arşiv (_REVISIONS) Sıkıştırma
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Yedekleme bittikten sonra, o yedeklemede _REVISIONS'a taşınan eski sürümler
+thread havuzunda sıkıştırılır (zstd ya da standart kütüphanedeki gzip).
+Sıkıştırılmış sürüm, dosya adının sonuna '.rev.gz' / '.rev.zst' eklenerek
+saklanır ve orijinal dosyanın tarihini korur. Zaten sıkıştırılmış biçimler
+(zip, jpg, mp4, docx...), çok küçük dosyalar ve sıkıştırınca yeterince
+küçülmeyen dosyalar olduğu gibi bırakılır.
+
+Geçmiş ve arama pencereleri arşiv yolunu find_revision_file ile bulur;
+restore_revision sıkıştırılmış sürümü açarak geri yükler.
+
+Gerekli Kütüphaneler:
+    - os                 (standart kütüphane)
+    - gzip               (standart kütüphane)
+    - shutil             (standart kütüphane)
+    - concurrent.futures (standart kütüphane)
+    - zstandard          (opsiyonel - yoksa gzip kullanılır)
+"""
+
+import os
+import gzip
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Sıkıştırma yöntemleri
+COMPRESS_NONE = 'none'
+COMPRESS_GZIP = 'gzip'
+COMPRESS_ZSTD = 'zstd'
+COMPRESS_METHODS = (COMPRESS_NONE, COMPRESS_GZIP, COMPRESS_ZSTD)
+
+# Sıkıştırılmış sürümlerin dosya adı eki (kullanıcının kendi .gz dosyalarıyla karışmaz)
+GZIP_SUFFIX = '.rev.gz'
+ZSTD_SUFFIX = '.rev.zst'
+COMPRESSED_SUFFIXES = (GZIP_SUFFIX, ZSTD_SUFFIX)
+
+# Zaten sıkıştırılmış biçimler - tekrar sıkıştırmak yer kazandırmaz
+SKIP_EXTENSIONS = frozenset({
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar', '.cab', '.lz', '.lzma',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.avif',
+    '.mp3', '.aac', '.ogg', '.flac', '.m4a', '.opus',
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.webm', '.m4v',
+    '.docx', '.xlsx', '.pptx', '.odt', '.ods', '.odp', '.jar', '.apk', '.epub',
+    '.pdf',
+})
+
+COMPRESS_WORKERS = 4
+COMPRESS_BUFFER_SIZE = 1024 * 1024
+# Bundan küçük dosyalarda kazanç, ek dosya başlığına değmez
+MIN_COMPRESS_SIZE = 4096
+# Sıkıştırılmış boyut bu oranın altına inmiyorsa orijinal dosya bırakılır
+MAX_COMPRESS_RATIO = 0.9
+# gzip orijinal boyutu 32 bit saklar - daha büyük dosyalar gzip ile sıkıştırılmaz
+MAX_GZIP_SIZE = 0xFFFFFFFF
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Yarım kalan sıkıştırma dosyası (iptal/hata durumunda silinir)
+TEMP_SUFFIX = '.sbtmp'
+
+
+def get_available_method(method: str) -> str:
+    """Kullanılabilir sıkıştırma yöntemini getir (zstandard kurulu değilse gzip)"""
+    if method == COMPRESS_ZSTD and zstandard is None:
+        return COMPRESS_GZIP
+    return method if method in COMPRESS_METHODS else COMPRESS_NONE
+
+
+def is_compressed_revision(path: str) -> bool:
+    """Dosya sıkıştırılmış bir arşiv sürümü mü"""
+    return path.endswith(COMPRESSED_SUFFIXES)
+
+
+def strip_compressed_suffix(path: str) -> str:
+    """Sıkıştırılmış sürümün ekini kaldırarak arşivlendiği yolu getir"""
+    for suffix in COMPRESSED_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def find_revision_file(revision_file: str) -> Optional[str]:
+    """Arşiv sürümünün diskteki yolunu bul (sıkıştırılmamış ya da sıkıştırılmış)
+
+    Returns:
+        Var olan dosya yolu, hiçbiri yoksa None
+    """
+    for path in (revision_file, revision_file + ZSTD_SUFFIX, revision_file + GZIP_SUFFIX):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def get_logical_size(path: str, disk_size: Optional[int] = None) -> int:
+    """Arşiv sürümünün açılmış (orijinal) boyutu
+
+    Boyut sıkıştırılmış dosyanın başlığından/sonundan okunur - dosya açılmaz.
+    Okunamazsa diskteki boyut döner.
+    """
+    if disk_size is None:
+        disk_size = os.path.getsize(path)
+    try:
+        if path.endswith(GZIP_SUFFIX) and disk_size >= 4:
+            # gzip son 4 byte: orijinal boyut (little endian)
+            with open(path, 'rb') as f:
+                f.seek(-4, os.SEEK_END)
+                return int.from_bytes(f.read(4), 'little')
+        if path.endswith(ZSTD_SUFFIX) and zstandard is not None:
+            with open(path, 'rb') as f:
+                size = zstandard.frame_content_size(f.read(18))
+            if size >= 0:
+                return size
+    except Exception:
+        # Bozuk/yarım dosya - diskteki boyut kullanılır
+        pass
+    return disk_size
+
+
+def open_revision(path: str) -> BinaryIO:
+    """Arşiv sürümünü okumak için aç (sıkıştırılmışsa açılarak okunur)
+
+    Raises:
+        OSError: Dosya açılamadı ya da zstd dosyası için zstandard kurulu değil
+    """
+    if path.endswith(GZIP_SUFFIX):
+        return gzip.open(path, 'rb')
+    if path.endswith(ZSTD_SUFFIX):
+        if zstandard is None:
+            raise OSError(f"zstd arşivini açmak için 'zstandard' paketi gerekli: {path}")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+def restore_revision(path: str, destination: str):
+    """Arşiv sürümünü açarak hedef dosyaya yaz (tarihi korunur)
+
+    Önce geçici dosyaya yazılır - hata durumunda hedefteki dosya bozulmaz.
+    """
+    temp_file = destination + TEMP_SUFFIX
+    try:
+        with open_revision(path) as fsrc, open(temp_file, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, COMPRESS_BUFFER_SIZE)
+        st = os.stat(path)
+        os.utime(temp_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(temp_file, destination)
+    except BaseException:
+        _remove_quietly(temp_file)
+        raise
+
+
+def compress_file(path: str, method: str,
+                  cancel_check: Optional[Callable[[], bool]] = None) -> Optional[Tuple[int, int]]:
+    """Arşiv sürümünü sıkıştır, orijinali sil
+
+    Returns:
+        (orijinal_boyut, sıkıştırılmış_boyut) - dosya sıkıştırılmadıysa None
+    """
+    if method == COMPRESS_NONE or is_compressed_revision(path):
+        return None
+    if os.path.splitext(path)[1].lower() in SKIP_EXTENSIONS:
+        return None
+    st = os.stat(path)
+    # Hard link'li dosya (tekilleştirme deposu) sıkıştırılırsa paylaşım bozulur
+    if st.st_nlink > 1 or st.st_size < MIN_COMPRESS_SIZE:
+        return None
+    if method == COMPRESS_GZIP and st.st_size > MAX_GZIP_SIZE:
+        return None
+
+    compressed_file = path + (ZSTD_SUFFIX if method == COMPRESS_ZSTD else GZIP_SUFFIX)
+    temp_file = compressed_file + TEMP_SUFFIX
+    try:
+        with open(path, 'rb') as fsrc, open(temp_file, 'wb') as fdst:
+            if method == COMPRESS_ZSTD:
+                # Orijinal boyut frame başlığına yazılır (get_logical_size için)
+                compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, write_content_size=True)
+                with compressor.stream_writer(fdst, size=st.st_size, closefd=False) as writer:
+                    _copy_chunks(fsrc, writer, cancel_check)
+            else:
+                with gzip.GzipFile(filename=os.path.basename(path), mode='wb',
+                                   compresslevel=GZIP_LEVEL, fileobj=fdst, mtime=int(st.st_mtime)) as writer:
+                    _copy_chunks(fsrc, writer, cancel_check)
+        if cancel_check and cancel_check():
+            _remove_quietly(temp_file)
+            return None
+
+        compressed_size = os.path.getsize(temp_file)
+        if compressed_size > st.st_size * MAX_COMPRESS_RATIO:
+            _remove_quietly(temp_file)
+            return None
+
+        os.utime(temp_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(temp_file, compressed_file)
+        os.remove(path)
+        return st.st_size, compressed_size
+    except Exception:
+        _remove_quietly(temp_file)
+        # İptal edilince yarım kalan zstd akışı kapatılırken hata verebilir
+        if cancel_check and cancel_check():
+            return None
+        raise
+
+
+def _copy_chunks(fsrc, writer, cancel_check: Optional[Callable[[], bool]]):
+    """Kaynağı parça parça sıkıştırıcıya yaz (parçalar arasında iptal kontrol edilir)"""
+    while True:
+        if cancel_check and cancel_check():
+            return
+        chunk = fsrc.read(COMPRESS_BUFFER_SIZE)
+        if not chunk:
+            return
+        writer.write(chunk)
+
+
+def _remove_quietly(path: str):
+    """Dosyayı sil, yoksa ya da silinemiyorsa hata verme"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class RevisionCompressor:
+    """Arşiv klasörlerindeki sürümleri thread havuzunda sıkıştırır"""
+
+    def __init__(self, method: str, max_workers: int = COMPRESS_WORKERS):
+        self.method = get_available_method(method)
+        self.max_workers = max(1, max_workers)
+
+    def compress_folders(self, folders: Iterable[str],
+                         cancel_check: Optional[Callable[[], bool]] = None) -> dict:
+        """Klasörlerdeki (alt klasörler dahil) sürümleri sıkıştır
+
+        Returns:
+            {
+                'files_compressed': int,
+                'size_original': int,    # Sıkıştırılan dosyaların orijinal boyutu
+                'size_compressed': int,  # Diskte kapladıkları yeni boyut
+                'errors': int
+            }
+        """
+        stats = {'files_compressed': 0, 'size_original': 0, 'size_compressed': 0, 'errors': 0}
+        if self.method == COMPRESS_NONE:
+            return stats
+
+        paths = []
+        for folder in folders:
+            for root, dirs, filenames in os.walk(folder):
+                for filename in filenames:
+                    if not filename.endswith(TEMP_SUFFIX):
+                        paths.append(os.path.join(root, filename))
+
+        def compress(path):
+            if cancel_check and cancel_check():
+                return None
+            try:
+                return compress_file(path, self.method, cancel_check)
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for result in executor.map(compress, paths):
+                if result is False:
+                    stats['errors'] += 1
+                elif result is not None:
+                    stats['files_compressed'] += 1
+                    stats['size_original'] += result[0]
+                    stats['size_compressed'] += result[1]
+        return stats
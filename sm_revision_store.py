@@ -0,0 +1,156 @@
+"""
+Smart Backup - Arşiv (_REVISIONS) Tekilleştirme Deposu
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Aynı içerik _REVISIONS altında tekrar tekrar arşivlendiğinde (sürekli
+değiştirilip geri alınan ayar dosyaları gibi) disk alanı bir kez harcanır.
+İçerik, özetiyle adlandırılmış tek bir dosya (blob) olarak
+_REVISIONS/_STORE altında tutulur; arşivdeki her sürüm bu dosyaya hard link
+olarak eklenir. Arşiv klasör yapısı (_REVISIONS/<tarih>/<yol>) aynı kalır.
+
+Depodaki içerikler manifest dosyasında (özet, boyut, arşiv yolu) listelenir.
+Manifest bir kez okunur, aramalar bellekteki index üzerinden yapılır.
+Hard link desteklemeyen dosya sistemlerinde (FAT32, exFAT) dosya normal
+şekilde taşınır.
+
+Gerekli Kütüphaneler:
+    - os        (standart kütüphane)
+    - shutil    (standart kütüphane)
+    - threading (standart kütüphane)
+    - sm_hasher (proje modülü)
+"""
+
+import os
+import shutil
+import threading
+from typing import Dict, Optional
+
+from sm_hasher import compute_file_hash
+
+
+# _REVISIONS altında içeriklerin tutulduğu klasör (arşiv sürümü olarak sayılmaz)
+STORE_DIR = '_STORE'
+# Depodaki içeriklerin listesi: özet <TAB> boyut <TAB> _REVISIONS'a göre arşiv yolu
+MANIFEST_FILE = 'manifest.tsv'
+
+
+class RevisionStore:
+    """Bir hedef klasörün _REVISIONS deposu
+
+    Aynı yedekleme içinde birden fazla thread tarafından kullanılabilir.
+    """
+
+    def __init__(self, revisions_path: str):
+        """
+        Args:
+            revisions_path: Hedef klasördeki _REVISIONS klasörü
+        """
+        self.revisions_path = revisions_path
+        self.store_path = os.path.join(revisions_path, STORE_DIR)
+        self.manifest_path = os.path.join(self.store_path, MANIFEST_FILE)
+        self.deduplicated_count = 0  # Depodaki içerikle aynı çıkan, yer kaplamayan sürüm sayısı
+        self.deduplicated_size = 0
+        self._index: Optional[Dict[str, int]] = None        # {özet: boyut}
+        self._revisions: Optional[Dict[str, str]] = None    # {arşiv yolu: özet}
+        self._lock = threading.Lock()
+
+    def blob_path(self, file_hash: str) -> str:
+        """Özeti verilen içeriğin depodaki yolu"""
+        return os.path.join(self.store_path, file_hash[:2], file_hash)
+
+    def archive(self, file_path: str, revision_file: str) -> bool:
+        """Dosyayı _REVISIONS'a taşı - aynı içerik depoda varsa ona bağla
+
+        Args:
+            file_path: Arşivlenecek dosya (hedefteki eski sürüm)
+            revision_file: _REVISIONS altındaki yeni yolu
+
+        Returns:
+            Dosya depodaki içerikle aynıysa True (yeni disk alanı kullanılmadı)
+        """
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            shutil.move(file_path, revision_file)
+            return False
+
+        file_hash = compute_file_hash(file_path)
+        blob = self.blob_path(file_hash)
+
+        with self._lock:
+            self._load_manifest()
+            deduplicated = False
+            if self._index.get(file_hash) == file_size and os.path.exists(blob):
+                try:
+                    os.link(blob, revision_file)
+                    deduplicated = True
+                except OSError:
+                    # Hard link desteklenmiyor ya da link sayısı sınırına gelindi
+                    pass
+
+            if deduplicated:
+                os.remove(file_path)
+                self.deduplicated_count += 1
+                self.deduplicated_size += file_size
+            else:
+                shutil.move(file_path, revision_file)
+                if not os.path.exists(blob):
+                    try:
+                        os.makedirs(os.path.dirname(blob), exist_ok=True)
+                        os.link(revision_file, blob)
+                    except OSError:
+                        return False
+
+            self._add_to_manifest(file_hash, file_size, revision_file)
+        return deduplicated
+
+    def resolve(self, revision_file: str) -> Optional[str]:
+        """Arşiv yolu bulunamazsa içeriğin depodaki yolunu getir
+
+        Returns:
+            Depodaki dosya yolu, manifestte yoksa ya da silinmişse None
+        """
+        with self._lock:
+            self._load_manifest()
+            file_hash = self._revisions.get(self._manifest_key(revision_file))
+        if file_hash is None:
+            return None
+        blob = self.blob_path(file_hash)
+        return blob if os.path.exists(blob) else None
+
+    def _manifest_key(self, revision_file: str) -> str:
+        """Arşiv yolunu manifestteki biçime çevir (_REVISIONS'a göre, '/' ayraçlı)"""
+        return os.path.relpath(revision_file, self.revisions_path).replace(os.sep, '/')
+
+    def _load_manifest(self):
+        """Manifesti ilk kullanımda belleğe al (kilit altında çağrılır)"""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._revisions = {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('\t')
+                    if len(parts) != 3:
+                        continue
+                    file_hash, size, rel_path = parts
+                    try:
+                        self._index[file_hash] = int(size)
+                    except ValueError:
+                        continue
+                    self._revisions[rel_path] = file_hash
+        except OSError:
+            pass
+
+    def _add_to_manifest(self, file_hash: str, file_size: int, revision_file: str):
+        """Yeni arşiv kaydını manifeste ekle (kilit altında çağrılır)"""
+        rel_path = self._manifest_key(revision_file)
+        self._index[file_hash] = file_size
+        self._revisions[rel_path] = file_hash
+        try:
+            os.makedirs(self.store_path, exist_ok=True)
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(f"{file_hash}\t{file_size}\t{rel_path}\n")
+        except OSError:
+            pass
@@ -0,0 +1,497 @@
+"""
+Smart Backup - Kaynak Klasör Tarayıcı
+Tarih: 18 Ekim 2026
+Yazar: Dr. Mustafa Afyonluoğlu
+
+Kaynak klasörü os.scandir ile tek geçişte tarar. Her dosya tek seferde
+"dahil", "hariç (filtre)" veya "hariç (gizli)" olarak sınıflandırılır ve
+DirEntry'nin stat bilgisi (boyut, tarih) tekrar diske gidilmeden kullanılır.
+
+Eşleşmenin dosya/klasör kataloğu verilirse, tarihi son yedeklemeden beri
+değişmeyen klasörler yeniden listelenmez; içindeki bilinen dosyalar tek tek
+stat edilir (ya da "kataloğa güven" modunda hiç diske gidilmez).
+
+Hedef klasör de aynı şekilde bir kez listelenir; iki liste relative yola göre
+sıralanıp tek geçişte birleştirilir (merge_listings). Böylece karşı tarafta
+dosya başına os.path.exists / getmtime çağrısı yapılmaz. Kataloğa güvenilen
+ve silinen dosya istenmeyen analizde hedef listelenmez; sadece katalogda
+olmayan/değişen dosyaların hedefi tek tek stat edilir (stat_target_file).
+
+Gerekli Kütüphaneler:
+    - os                (standart kütüphane)
+    - stat              (standart kütüphane)
+    - time              (standart kütüphane)
+    - sm_filter_matcher (proje modülü)
+    - sm_file_copy      (proje modülü)
+"""
+
+import os
+import stat
+import time
+from typing import Dict, Iterator, List, NamedTuple, Callable, Optional, Tuple
+
+from sm_filter_matcher import get_filter_matcher, MATCH_INCLUDED, MATCH_EXCLUDED
+from sm_file_copy import TEMP_SUFFIX as COPY_TEMP_SUFFIX
+
+
+# Hariç tutulan dosyalar için istatistik modu
+EXCLUDED_STATS_FULL = 'full'   # Hariç tutulan her dosya listelenir (klasörler budanmaz)
+EXCLUDED_STATS_SIZE = 'size'   # Budanan klasörler sadece sayı/boyut için hızlıca taranır
+EXCLUDED_STATS_NONE = 'none'   # Budanan klasörlere hiç girilmez, istatistik hesaplanmaz
+
+# Son bu kadar saniye içinde değişen klasörler kataloğa yazılmaz. Aynı tarih
+# çözünürlüğü içinde tekrar değişirlerse (FAT'ta 2 sn) fark edilmeyebilirler.
+DIR_MTIME_GRACE = 2.0
+
+# Hedefte arşivlenmiş sürümlerin tutulduğu klasör (hedef taramasına dahil edilmez)
+REVISIONS_DIR = '_REVISIONS'
+
+
+class ScanEntry(NamedTuple):
+    """Taranan bir dosyanın bilgileri"""
+    path: str        # Tam yol
+    rel_path: str    # Kaynak klasöre göre relative yol
+    size: int        # Byte cinsinden boyut
+    mtime: float     # Son değişiklik zamanı
+    inode: int = 0   # Dosya numarası (Windows'ta scandir ile 0 gelir)
+
+
+class ScanResult:
+    """Tarama sonucu - dosyalar üç gruba ayrılmış olarak tutulur"""
+
+    def __init__(self):
+        self.included: List[ScanEntry] = []         # Yedeklemeye dahil dosyalar
+        self.user_excluded: List[ScanEntry] = []    # Kullanıcı filtresi ile hariç tutulanlar
+        self.hidden_excluded: List[ScanEntry] = []  # Gizli klasör/dosya olduğu için hariç tutulanlar
+        self.other_files: List[str] = []            # Dosya filtresine uymayanlar (sadece relative yol)
+        self.listed_dirs = set()                    # İçeriği tam bilinen klasörler (relative yol)
+
+        # Budanan (içine girilmeyen) klasörlerden gelen sayılar - listede yer almazlar
+        self.pruned_dir_count = 0
+        self.pruned_user_excluded_count = 0
+        self.pruned_user_excluded_size = 0
+        self.pruned_hidden_count = 0
+        self.pruned_hidden_size = 0
+
+        # Klasör kataloğu (sadece dosya kataloğu verildiğinde doldurulur)
+        self.dirs: Dict[str, Tuple[float, int]] = {}  # {rel_dir: (tarih, kayıt sayısı)}
+        self.listed_dir_count = 0   # os.scandir ile listelenen klasörler
+        self.reused_dir_count = 0   # Tarihi değişmediği için katalogdan geçilen klasörler
+
+    # ---- Gruplardan türetilen sayı/boyutlar (listeler üzerinden tek geçiş) ----
+
+    @property
+    def included_size(self) -> int:
+        """Yedeklemeye dahil dosyaların toplam boyutu"""
+        return sum(entry.size for entry in self.included)
+
+    @property
+    def user_excluded_count(self) -> int:
+        """Filtre ile hariç tutulan dosya sayısı (budanan klasörlerdekiler dahil)"""
+        return len(self.user_excluded) + self.pruned_user_excluded_count
+
+    @property
+    def user_excluded_size(self) -> int:
+        """Filtre ile hariç tutulan dosyaların toplam boyutu (budanan klasörlerdekiler dahil)"""
+        return sum(entry.size for entry in self.user_excluded) + self.pruned_user_excluded_size
+
+    @property
+    def hidden_excluded_count(self) -> int:
+        """Gizli olduğu için hariç tutulan dosya sayısı (budanan klasörlerdekiler dahil)"""
+        return len(self.hidden_excluded) + self.pruned_hidden_count
+
+    @property
+    def hidden_excluded_size(self) -> int:
+        """Gizli olduğu için hariç tutulan dosyaların toplam boyutu (budanan klasörlerdekiler dahil)"""
+        return sum(entry.size for entry in self.hidden_excluded) + self.pruned_hidden_size
+
+    @property
+    def excluded_count(self) -> int:
+        """Toplam hariç tutulan dosya sayısı (filtre + gizli)"""
+        return self.user_excluded_count + self.hidden_excluded_count
+
+    @property
+    def excluded_size(self) -> int:
+        """Toplam hariç tutulan dosya boyutu (filtre + gizli)"""
+        return self.user_excluded_size + self.hidden_excluded_size
+
+    def non_included_keys(self) -> set:
+        """Kaynakta bulunup yedeklemeye dahil olmayan dosyaların normcase'li relative yolları"""
+        normcase = os.path.normcase
+        keys = set(normcase(entry.rel_path) for entry in self.user_excluded)
+        keys.update(normcase(entry.rel_path) for entry in self.hidden_excluded)
+        keys.update(normcase(rel_path) for rel_path in self.other_files)
+        return keys
+
+
+class SourceScanner:
+    """Kaynak klasörü tek geçişte tarayan sınıf
+
+    Include/exclude filtreleri sm_filter_matcher.FilterMatcher ile bir kez
+    derlenir; filtrelerin anlamı için FilterMatcher docstring'ine bakınız.
+    """
+
+    def __init__(self, source_path: str, file_filter: str, exclude_filter: str,
+                 include_subdirs: bool, excluded_stats: str = EXCLUDED_STATS_FULL,
+                 catalog: Optional[Dict[str, Tuple[int, float, int]]] = None,
+                 dir_catalog: Optional[Dict[str, Tuple[float, int]]] = None,
+                 trust_catalog: bool = False):
+        """
+        Args:
+            source_path: Kaynak klasör
+            file_filter: Dosya filtresi
+            exclude_filter: Hariç tutulacak dosya filtresi
+            include_subdirs: Alt klasörleri dahil et
+            excluded_stats: EXCLUDED_STATS_FULL / EXCLUDED_STATS_SIZE / EXCLUDED_STATS_NONE
+                FULL dışındaki modlarda tamamen hariç tutulan klasörler (node_modules\*.*,
+                __pycache__\*.* gibi) ve gizli klasörler (.git gibi) dosya dosya sınıflandırılmaz.
+            catalog: Dosya kataloğu {rel_path: (boyut, tarih, inode)} (opsiyonel)
+                Verilirse klasör tarihleri ScanResult.dirs içinde toplanır.
+            dir_catalog: Klasör kataloğu {rel_dir: (tarih, kayıt sayısı)} (opsiyonel)
+            trust_catalog: True ise listelenmeyen klasörlerdeki dosyalar stat edilmez,
+                katalogdaki boyut/tarih kullanılır (yerinde değiştirilen dosyalar kaçabilir)
+        """
+        self.source_path = os.path.normpath(source_path)
+        self.include_subdirs = include_subdirs
+        self.excluded_stats = excluded_stats
+        self.catalog = catalog
+        self.dir_catalog = dir_catalog or {}
+        self.trust_catalog = trust_catalog
+        self.matcher = get_filter_matcher(file_filter, exclude_filter, include_subdirs)
+
+    def scan(self, cancel_check: Optional[Callable[[], bool]] = None) -> ScanResult:
+        """Kaynak klasörü tara
+
+        Args:
+            cancel_check: True döndürürse tarama durdurulur (opsiyonel)
+
+        Returns:
+            ScanResult
+        """
+        result = ScanResult()
+        if not os.path.isdir(self.source_path):
+            return result
+
+        matcher = self.matcher
+        prune = self.excluded_stats != EXCLUDED_STATS_FULL
+
+        # Klasör kataloğu sadece alt klasörlü taramada anlamlı
+        track_dirs = self.catalog is not None and self.include_subdirs
+        root_mtime = None
+        if track_dirs:
+            files_by_dir, subdirs_by_dir = self._index_catalog()
+            record_before = time.time() - DIR_MTIME_GRACE
+            try:
+                root_mtime = os.stat(self.source_path).st_mtime
+            except OSError:
+                pass
+
+        # (klasör yolu, relative yol öneki, gizli klasör altında mı, klasör tarihi)
+        stack = [(self.source_path, '', False, root_mtime)]
+
+        while stack:
+            if cancel_check and cancel_check():
+                break
+
+            dir_path, rel_prefix, in_hidden, dir_mtime = stack.pop()
+            tracked = track_dirs and not in_hidden and dir_mtime is not None
+            if tracked and self._reuse_dir(dir_path, rel_prefix, dir_mtime,
+                                           files_by_dir, subdirs_by_dir, stack, result):
+                continue
+
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                # Erişim hatası - klasörü atla
+                continue
+
+            result.listed_dirs.add(rel_prefix[:-1])
+            if tracked:
+                result.listed_dir_count += 1
+                if dir_mtime < record_before:
+                    result.dirs[rel_prefix[:-1]] = (dir_mtime, len(entries))
+
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if self.include_subdirs:
+                        hidden = in_hidden or name.startswith('.')
+                        rel_dir = rel_prefix + name
+                        if prune and (hidden or matcher.should_prune_dir(rel_dir)):
+                            # Alt ağacın tamamı hariç - içine girip sınıflandırmaya gerek yok
+                            result.pruned_dir_count += 1
+                            if self.excluded_stats == EXCLUDED_STATS_SIZE:
+                                self._count_pruned_tree(entry.path, hidden, result, cancel_check)
+                        else:
+                            sub_mtime = None
+                            if track_dirs and not hidden:
+                                try:
+                                    sub_mtime = entry.stat(follow_symlinks=False).st_mtime
+                                except OSError:
+                                    pass
+                            stack.append((entry.path, rel_dir + os.sep, hidden, sub_mtime))
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                rel_path = rel_prefix + name
+                scan_entry = ScanEntry(entry.path, rel_path, st.st_size, st.st_mtime, st.st_ino)
+
+                if in_hidden:
+                    # Gizli klasördeki dosya (glob bunları görmez)
+                    result.hidden_excluded.append(scan_entry)
+                    continue
+
+                # Dosya filtresine uymayanlar (MATCH_NONE) sadece silinen dosya tespiti için tutulur.
+                # Nokta ile başlayan dosyalar da (glob gibi) sadece açıkça yazılmış ".env",
+                # ".*" gibi pattern'lerle dahil olur, gizli sayılmaz.
+                match = matcher.classify_file(rel_path, entry.path)
+                if match == MATCH_INCLUDED:
+                    result.included.append(scan_entry)
+                elif match == MATCH_EXCLUDED:
+                    result.user_excluded.append(scan_entry)
+                else:
+                    result.other_files.append(rel_path)
+
+        return result
+
+    def _index_catalog(self):
+        """Katalogdaki dosya ve klasörleri üst klasörlerine göre grupla
+
+        Returns:
+            ({rel_dir: [dosya adları]}, {rel_dir: [alt klasör adları]})
+        """
+        files_by_dir = {}
+        for rel_path in self.catalog:
+            parent, _, name = rel_path.rpartition(os.sep)
+            files_by_dir.setdefault(parent, []).append(name)
+
+        subdirs_by_dir = {}
+        for rel_dir in self.dir_catalog:
+            if rel_dir:
+                parent, _, name = rel_dir.rpartition(os.sep)
+                subdirs_by_dir.setdefault(parent, []).append(name)
+
+        return files_by_dir, subdirs_by_dir
+
+    def _reuse_dir(self, dir_path: str, rel_prefix: str, dir_mtime: float,
+                   files_by_dir: Dict[str, List[str]], subdirs_by_dir: Dict[str, List[str]],
+                   stack: list, result: ScanResult) -> bool:
+        """Tarihi değişmemiş klasörü listelemeden, katalogdaki içeriğiyle tara
+
+        Dosya eklemek, silmek veya yeniden adlandırmak klasörün tarihini değiştirir.
+        Tarih aynıysa ve klasördeki kayıt sayısı katalogdaki dosya + alt klasör
+        sayısına eşitse, klasörün içeriği katalogdakiyle aynıdır. Hariç tutulan ya da
+        gizli kayıt içeren klasörler bu koşulu sağlamaz ve her zaman listelenir.
+
+        Returns:
+            True ise klasör katalogdan işlendi; False ise normal şekilde listelenmeli
+        """
+        rel_dir = rel_prefix[:-1]
+        cached = self.dir_catalog.get(rel_dir)
+        if cached is None or cached[0] != dir_mtime:
+            return False
+
+        file_names = files_by_dir.get(rel_dir, ())
+        subdir_names = subdirs_by_dir.get(rel_dir, ())
+        if len(file_names) + len(subdir_names) != cached[1]:
+            return False
+
+        # Beklenmeyen bir durumda klasör normal şekilde listelensin diye
+        # sonuçlar önce geçici listelerde toplanır
+        entries = []
+        for name in file_names:
+            rel_path = rel_prefix + name
+            path = os.path.join(dir_path, name)
+            if self.trust_catalog:
+                size, mtime, inode = self.catalog[rel_path]
+            else:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    return False
+                size, mtime, inode = st.st_size, st.st_mtime, st.st_ino
+            if self.matcher.classify_file(rel_path, path) != MATCH_INCLUDED:
+                return False
+            entries.append(ScanEntry(path, rel_path, size, mtime, inode))
+
+        prune = self.excluded_stats != EXCLUDED_STATS_FULL
+        subdirs = []
+        for name in subdir_names:
+            rel_sub = rel_prefix + name
+            if prune and self.matcher.should_prune_dir(rel_sub):
+                return False
+            path = os.path.join(dir_path, name)
+            try:
+                sub_mtime = os.lstat(path).st_mtime
+            except OSError:
+                return False
+            subdirs.append((path, rel_sub + os.sep, False, sub_mtime))
+
+        result.included.extend(entries)
+        stack.extend(subdirs)
+        result.dirs[rel_dir] = cached
+        result.listed_dirs.add(rel_dir)
+        result.reused_dir_count += 1
+        return True
+
+    def _count_pruned_tree(self, dir_path: str, in_hidden: bool, result: ScanResult,
+                           cancel_check: Optional[Callable[[], bool]] = None):
+        """Budanan klasördeki dosyaları sadece sayı/boyut olarak say (liste tutulmaz)
+
+        Args:
+            dir_path: Budanan klasörün tam yolu
+            in_hidden: Klasör gizli mi (ya da gizli bir klasörün altında mı)
+            result: Sayıların ekleneceği ScanResult
+            cancel_check: True döndürürse sayım durdurulur (opsiyonel)
+        """
+        matcher = self.matcher
+        stack = [(dir_path, in_hidden)]
+
+        while stack:
+            if cancel_check and cancel_check():
+                break
+
+            current, hidden = stack.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, hidden or name.startswith('.')))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+
+                if hidden:
+                    result.pruned_hidden_count += 1
+                    result.pruned_hidden_size += size
+                elif matcher.matches_include_name(name):
+                    result.pruned_user_excluded_count += 1
+                    result.pruned_user_excluded_size += size
+
+
+def scan_target(target_path: str, cancel_check: Optional[Callable[[], bool]] = None) -> List[ScanEntry]:
+    """Hedef klasördeki dosyaları tek geçişte listele (_REVISIONS klasörleri hariç)
+
+    Yarıda kalmış kopyalamalardan kalan geçici dosyalar (*.sbtmp) listelenmez -
+    silinen dosya sayılıp arşive taşınmazlar; dosya yeniden kopyalanınca üzerine
+    yazılıp yerine konurlar.
+
+    Args:
+        target_path: Hedef klasör
+        cancel_check: True döndürürse tarama durdurulur (opsiyonel)
+
+    Returns:
+        ScanEntry listesi (sırasız)
+    """
+    target_path = os.path.normpath(target_path)
+    files = []
+    if not os.path.isdir(target_path):
+        return files
+
+    stack = [(target_path, '')]
+    while stack:
+        if cancel_check and cancel_check():
+            break
+
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != REVISIONS_DIR:
+                        stack.append((entry.path, rel_prefix + entry.name + os.sep))
+                    continue
+                if not entry.is_file() or entry.name.endswith(COPY_TEMP_SUFFIX):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append(ScanEntry(entry.path, rel_prefix + entry.name, st.st_size,
+                                   st.st_mtime, st.st_ino))
+
+    return files
+
+
+def stat_target_file(target_path: str, rel_path: str) -> Optional[ScanEntry]:
+    """Hedefte tek bir dosyayı stat et (hedef klasör listelenmeden)
+
+    Returns:
+        ScanEntry - dosya yoksa ya da normal dosya değilse None
+    """
+    path = os.path.join(target_path, rel_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return ScanEntry(path, rel_path, st.st_size, st.st_mtime, st.st_ino)
+
+
+def has_target_files(target_path: str) -> bool:
+    """Hedef klasör var ve içinde _REVISIONS dışında en az bir kayıt var mı"""
+    try:
+        with os.scandir(target_path) as entries:
+            return any(entry.name != REVISIONS_DIR for entry in entries)
+    except OSError:
+        return False
+
+
+def merge_listings(source_entries: List[ScanEntry],
+                   target_entries: List[ScanEntry]) -> Iterator[Tuple[Optional[ScanEntry], Optional[ScanEntry]]]:
+    """Kaynak ve hedef listelerini relative yola göre sıralayıp tek geçişte birleştir
+
+    Yollar os.path.normcase ile karşılaştırılır (Windows'ta büyük/küçük harf duyarsız).
+
+    Yields:
+        (kaynak, hedef) - sadece kaynakta olanlar için (kaynak, None),
+        sadece hedefte olanlar için (None, hedef)
+    """
+    normcase = os.path.normcase
+    source_sorted = sorted(((normcase(e.rel_path), e) for e in source_entries), key=lambda item: item[0])
+    target_sorted = sorted(((normcase(e.rel_path), e) for e in target_entries), key=lambda item: item[0])
+
+    i = j = 0
+    n_source = len(source_sorted)
+    n_target = len(target_sorted)
+    while i < n_source and j < n_target:
+        source_key, source_entry = source_sorted[i]
+        target_key, target_entry = target_sorted[j]
+        if source_key == target_key:
+            yield source_entry, target_entry
+            i += 1
+            j += 1
+        elif source_key < target_key:
+            yield source_entry, None
+            i += 1
+        else:
+            yield None, target_entry
+            j += 1
+
+    for _, source_entry in source_sorted[i:]:
+        yield source_entry, None
+    for _, target_entry in target_sorted[j:]:
+        yield None, target_entry
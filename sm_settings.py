@@ -29,7 +29,17 @@ class SettingsManager:
             'window_width': '1200',
             'window_height': '950',
             'last_project_id': '0',
-            'splitter_position': '0.4'  # Eşleştirme listesi / Yedekleme detayları splitter konumu (0-1 arası)
+            'splitter_position': '0.4',  # Eşleştirme listesi / Yedekleme detayları splitter konumu (0-1 arası)
+            'copy_workers_per_device': '4',  # Aynı hedef diske eşzamanlı kopyalama sayısı
+            'delta_min_size_mb': '64',  # Bu boyuttan büyük dosyalarda sadece değişen bloklar yazılır (0: kapalı)
+            'dedup_revisions': '0',  # Aynı içerikli arşiv sürümleri _REVISIONS'ta tek kopya tutulur (1: açık)
+            'compress_revisions': 'none',  # Arşiv sürümlerinin sıkıştırılması (none, gzip, zstd)
+            # Arşiv saklama politikası (0: kural kullanılmaz)
+            'retention_keep_last': '0',     # Dosya başına en yeni N sürüm
+            'retention_keep_daily': '0',    # Son D günün her birinden bir sürüm
+            'retention_keep_weekly': '0',   # Son W haftanın her birinden bir sürüm
+            'retention_keep_monthly': '0',  # Son M ayın her birinden bir sürüm
+            'retention_max_mb': '0'         # Saklanan sürümlerin toplam boyut sınırı (MB)
         }
         
         for key, value in defaults.items():
@@ -86,3 +96,82 @@ class SettingsManager:
     def set_splitter_position(self, position: float):
         """Splitter konumunu kaydet"""
         self.db.set_setting('splitter_position', str(position))
+    
+    # ==================== YEDEKLEME AYARLARI ====================
+    
+    def get_copy_workers_per_device(self) -> int:
+        """Aynı hedef diske eşzamanlı kopyalama sayısını getir (en az 1)"""
+        try:
+            return max(1, int(self.db.get_setting('copy_workers_per_device', '4')))
+        except ValueError:
+            return 4
+    
+    def set_copy_workers_per_device(self, count: int):
+        """Aynı hedef diske eşzamanlı kopyalama sayısını kaydet"""
+        self.db.set_setting('copy_workers_per_device', str(max(1, count)))
+    
+    def get_delta_min_size(self) -> int:
+        """Blok farkı kopyalamasının uygulanacağı en küçük dosya boyutunu getir (byte, 0: kapalı)"""
+        try:
+            return max(0, int(self.db.get_setting('delta_min_size_mb', '64'))) * 1024 * 1024
+        except ValueError:
+            return 64 * 1024 * 1024
+    
+    def set_delta_min_size_mb(self, size_mb: int):
+        """Blok farkı kopyalamasının uygulanacağı en küçük dosya boyutunu kaydet (MB, 0: kapalı)"""
+        self.db.set_setting('delta_min_size_mb', str(max(0, size_mb)))
+    
+    # Tekilleştirme ve sıkıştırma birlikte kullanılamaz: depoya bağlı (hard link'li)
+    # sürümler sıkıştırılmaz. Biri açılınca diğeri kapatılır; ikisi de açık kayıtlıysa
+    # tekilleştirme geçerlidir.
+    
+    def get_dedup_revisions(self) -> bool:
+        """Arşiv tekilleştirmesi açık mı (aynı içerik _REVISIONS'ta hard link ile tek kopya)"""
+        return self.db.get_setting('dedup_revisions', '0') == '1'
+    
+    def set_dedup_revisions(self, enabled: bool):
+        """Arşiv tekilleştirmesini aç/kapat (açılınca arşiv sıkıştırması kapatılır)"""
+        self.db.set_setting('dedup_revisions', '1' if enabled else '0')
+        if enabled:
+            self.db.set_setting('compress_revisions', 'none')
+    
+    def get_revision_compression(self) -> str:
+        """Arşiv sürümlerinin sıkıştırma yöntemini getir (none, gzip, zstd)
+        
+        Tekilleştirme açıksa 'none' döner.
+        """
+        if self.get_dedup_revisions():
+            return 'none'
+        method = self.db.get_setting('compress_revisions', 'none')
+        return method if method in ('none', 'gzip', 'zstd') else 'none'
+    
+    def set_revision_compression(self, method: str):
+        """Arşiv sürümlerinin sıkıştırma yöntemini kaydet (none, gzip, zstd)
+        
+        'none' dışında bir yöntem seçilince arşiv tekilleştirmesi kapatılır.
+        """
+        self.db.set_setting('compress_revisions', method)
+        if method != 'none':
+            self.db.set_setting('dedup_revisions', '0')
+    
+    def get_retention_policy(self) -> dict:
+        """Arşiv saklama politikasını getir
+        
+        Returns:
+            {'keep_last', 'keep_daily', 'keep_weekly', 'keep_monthly', 'max_mb'} (0: kural kullanılmaz)
+        """
+        policy = {}
+        for key in ('keep_last', 'keep_daily', 'keep_weekly', 'keep_monthly', 'max_mb'):
+            try:
+                policy[key] = max(0, int(self.db.get_setting(f'retention_{key}', '0')))
+            except ValueError:
+                policy[key] = 0
+        return policy
+    
+    def set_retention_policy(self, keep_last: int, keep_daily: int, keep_weekly: int,
+                             keep_monthly: int, max_mb: int):
+        """Arşiv saklama politikasını kaydet (0: kural kullanılmaz)"""
+        values = {'keep_last': keep_last, 'keep_daily': keep_daily, 'keep_weekly': keep_weekly,
+                  'keep_monthly': keep_monthly, 'max_mb': max_mb}
+        for key, value in values.items():
+            self.db.set_setting(f'retention_{key}', str(max(0, int(value))))
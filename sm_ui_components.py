@@ -11,6 +11,8 @@ Gerekli Kütüphaneler:
 import customtkinter as ctk
 from tkinter import messagebox, filedialog, Menu, Label
 from typing import Callable, Optional
+from sm_backup_engine import (COMPARE_MTIME, COMPARE_MTIME_TOLERANCE, COMPARE_SIZE_MTIME,
+                              COMPARE_HASH, DEFAULT_MTIME_TOLERANCE)
 
 from regex import T
 
@@ -171,15 +173,26 @@ class ProjectDialog(ctk.CTkToplevel):
 class MappingDialog(ctk.CTkToplevel):
     """Eşleşme ekleme/düzenleme dialog'u"""
     
+    # Karşılaştırma yöntemlerinin ekranda görünen isimleri
+    COMPARE_POLICY_LABELS = {
+        COMPARE_MTIME: "Tarih (kaynak daha yeniyse)",
+        COMPARE_MTIME_TOLERANCE: "Tarih, toleranslı (FAT/exFAT, NAS)",
+        COMPARE_SIZE_MTIME: "Boyut + tarih (toleranslı)",
+        COMPARE_HASH: "İçerik (hash - yavaş)"
+    }
+    
     def __init__(self, parent, title: str = "Yeni Eşleşme",
                  source_path: str = "", file_filter: str = "*.*",
                  exclude_filter: str = "", include_subdirs: bool = True, 
-                 target_path: str = "", mapping_name: str = ""):
+                 target_path: str = "", mapping_name: str = "",
+                 compare_policy: str = COMPARE_MTIME,
+                 mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE,
+                 append_only: bool = False):
         super().__init__(parent)
         
         self.result = None
         self.title(title)
-        self.geometry("700x550")
+        self.geometry("700x660")
         # self._center_window()
         
         # Modal yap
@@ -190,7 +203,8 @@ class MappingDialog(ctk.CTkToplevel):
         self.bind('<Escape>', lambda e: self.destroy())
         
         self._create_widgets(source_path, file_filter, exclude_filter, 
-                            include_subdirs, target_path, mapping_name)
+                            include_subdirs, target_path, mapping_name,
+                            compare_policy, mtime_tolerance, append_only)
     
     def _center_window(self):
         """Pencereyi ekranda ortala"""
@@ -203,7 +217,9 @@ class MappingDialog(ctk.CTkToplevel):
     
     def _create_widgets(self, source_path: str, file_filter: str,
                        exclude_filter: str, include_subdirs: bool, target_path: str,
-                       mapping_name: str = ""):
+                       mapping_name: str = "", compare_policy: str = COMPARE_MTIME,
+                       mtime_tolerance: float = DEFAULT_MTIME_TOLERANCE,
+                       append_only: bool = False):
         """Widget'ları oluştur"""
         # Padding frame
         main_frame = ctk.CTkFrame(self)
@@ -269,6 +285,27 @@ class MappingDialog(ctk.CTkToplevel):
         ctk.CTkButton(target_frame, text="Gözat...", command=self._browse_target,
                      width=80).pack(side="right")
         
+        # Karşılaştırma yöntemi - hedefteki dosyanın güncel olup olmadığına nasıl karar verilir
+        ctk.CTkLabel(main_frame, text="Değişiklik Tespiti:", anchor="w").pack(fill="x", pady=(0, 5))
+        compare_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        compare_frame.pack(fill="x", pady=(0, 10))
+        
+        policy_label = self.COMPARE_POLICY_LABELS.get(compare_policy,
+                                                      self.COMPARE_POLICY_LABELS[COMPARE_MTIME])
+        self.compare_policy_var = ctk.StringVar(value=policy_label)
+        ctk.CTkOptionMenu(compare_frame, values=list(self.COMPARE_POLICY_LABELS.values()),
+                          variable=self.compare_policy_var, width=280).pack(side="left")
+        
+        ctk.CTkLabel(compare_frame, text="Tolerans (sn):").pack(side="left", padx=(15, 5))
+        self.tolerance_entry = ctk.CTkEntry(compare_frame, width=60)
+        self.tolerance_entry.pack(side="left")
+        self.tolerance_entry.insert(0, f"{mtime_tolerance:g}")
+        
+        # Sona ekleme - büyüyen log dosyalarında sadece eklenen kısım kopyalanır
+        self.append_only_var = ctk.BooleanVar(value=append_only)
+        ctk.CTkCheckBox(main_frame, text="Büyüyen dosyalarda sadece sona eklenen kısmı kopyala (log dosyaları)",
+                       variable=self.append_only_var).pack(fill="x", pady=(0, 20))
+        
         # Butonlar
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x")
@@ -310,7 +347,109 @@ class MappingDialog(ctk.CTkToplevel):
             messagebox.showwarning("Uyarı", "Dosya filtresi boş olamaz!", parent=self)
             return
         
-        self.result = (mapping_name, source, file_filter, exclude_filter, self.subdirs_var.get(), target)
+        try:
+            mtime_tolerance = float(self.tolerance_entry.get().strip().replace(',', '.'))
+            if mtime_tolerance < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Uyarı", "Tolerans 0 veya daha büyük bir sayı olmalıdır!", parent=self)
+            return
+        
+        compare_policy = next((policy for policy, label in self.COMPARE_POLICY_LABELS.items()
+                               if label == self.compare_policy_var.get()), COMPARE_MTIME)
+        
+        self.result = (mapping_name, source, file_filter, exclude_filter, self.subdirs_var.get(), target,
+                       compare_policy, mtime_tolerance, self.append_only_var.get())
+        self.destroy()
+
+
+class RetentionDialog(ctk.CTkToplevel):
+    """Arşiv (_REVISIONS) saklama politikası dialog'u"""
+    
+    # (ayar anahtarı, etiket)
+    FIELDS = [
+        ('keep_last', "Dosya başına son N sürüm:"),
+        ('keep_daily', "Son D günün her birinden bir sürüm:"),
+        ('keep_weekly', "Son W haftanın her birinden bir sürüm:"),
+        ('keep_monthly', "Son M ayın her birinden bir sürüm:"),
+        ('max_mb', "Toplam arşiv boyutu sınırı (MB):"),
+    ]
+    
+    def __init__(self, parent, target_path: str, policy: dict, revision_count: int = 0):
+        """
+        Args:
+            parent: Ana pencere
+            target_path: Arşivi temizlenecek hedef klasör
+            policy: Kayıtlı saklama politikası (SettingsManager.get_retention_policy)
+            revision_count: İndeksteki sürüm sayısı
+        """
+        super().__init__(parent)
+        
+        self.result = None  # (politika dict, dry_run)
+        self.title("Arşivi Temizle")
+        self.geometry("560x430")
+        
+        # Modal yap
+        self.transient(parent)
+        self.grab_set()
+        
+        # ESC tuşu ile kapat
+        self.bind('<Escape>', lambda e: self.destroy())
+        
+        self._create_widgets(target_path, policy, revision_count)
+    
+    def _create_widgets(self, target_path: str, policy: dict, revision_count: int):
+        """Widget'ları oluştur"""
+        main_frame = ctk.CTkFrame(self)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        ctk.CTkLabel(main_frame, text=f"Hedef: {target_path}", anchor="w",
+                    wraplength=500, justify="left").pack(fill="x", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text=f"Arşiv indeksindeki sürüm sayısı: {revision_count}",
+                    anchor="w", text_color="gray").pack(fill="x", pady=(0, 15))
+        
+        self.entries = {}
+        for key, label in self.FIELDS:
+            row = ctk.CTkFrame(main_frame, fg_color="transparent")
+            row.pack(fill="x", pady=3)
+            ctk.CTkLabel(row, text=label, anchor="w").pack(side="left")
+            entry = ctk.CTkEntry(row, width=90)
+            entry.pack(side="right")
+            entry.insert(0, str(policy.get(key, 0)))
+            self.entries[key] = entry
+        
+        ctk.CTkLabel(main_frame, text="0: kural kullanılmaz. Herhangi bir kuralın seçtiği sürüm saklanır;\n"
+                                      "boyut sınırı aşılırsa en eski sürümlerden başlanarak silinir.",
+                    anchor="w", justify="left", text_color="gray").pack(fill="x", pady=(10, 15))
+        
+        # Butonlar
+        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_frame.pack(fill="x", side="bottom")
+        
+        ctk.CTkButton(button_frame, text="Temizle", command=lambda: self._on_ok(False),
+                     width=100, fg_color="#C0392B", hover_color="#922B21").pack(side="right", padx=(5, 0))
+        ctk.CTkButton(button_frame, text="Önizle", command=lambda: self._on_ok(True),
+                     width=100).pack(side="right", padx=(5, 0))
+        ctk.CTkButton(button_frame, text="İptal", command=self.destroy,
+                     width=100).pack(side="right")
+    
+    def _on_ok(self, dry_run: bool):
+        """Önizle / Temizle butonuna basıldı"""
+        policy = {}
+        for key, entry in self.entries.items():
+            try:
+                policy[key] = int(entry.get().strip() or 0)
+            except ValueError:
+                policy[key] = -1
+            if policy[key] < 0:
+                messagebox.showwarning("Uyarı", "Değerler 0 veya daha büyük tam sayı olmalıdır!", parent=self)
+                return
+        
+        if not any(policy.values()):
+            messagebox.showwarning("Uyarı", "En az bir saklama kuralı girilmelidir!", parent=self)
+            return
+        
+        self.result = (policy, dry_run)
         self.destroy()
 
 
@@ -454,7 +593,7 @@ class AnalysisSelectionDialog:
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Analiz Edilecek Mapping'leri Seç")
-        self.dialog.geometry("900x650+100+100")
+        self.dialog.geometry("900x750+100+100")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
@@ -607,6 +746,64 @@ class AnalysisSelectionDialog:
         )
         deleted_cb.pack(side="left", padx=10)
         
+        # Hariç tutulan dosya istatistikleri - kapalıysa tamamen hariç tutulan
+        # klasörler (node_modules, __pycache__, .git gibi) hiç taranmaz
+        self.calculate_excluded_stats_var = ctk.BooleanVar(value=saved_selections.get('calculate_excluded_stats', True))
+        excluded_stats_cb = ctk.CTkCheckBox(
+            options_frame,
+            text="Hariç tutulan klasörlerin dosya sayısı/boyutunu hesapla",
+            variable=self.calculate_excluded_stats_var
+        )
+        excluded_stats_cb.pack(pady=(0, 5))
+        
+        # Kataloğa güven - tarihi değişmeyen klasörlerdeki dosyalar stat edilmez;
+        # "Silinenler" de kapalıysa hedef klasör listelenmez (katalogla aynı dosyalar
+        # hedefe bakılmadan atlanır)
+        self.trust_catalog_var = ctk.BooleanVar(value=saved_selections.get('trust_catalog', False))
+        trust_catalog_cb = ctk.CTkCheckBox(
+            options_frame,
+            text="Değişmeyen dosyaları kontrol etme (kataloğa güven - Silinenler kapalıysa hedef taranmaz)",
+            variable=self.trust_catalog_var
+        )
+        trust_catalog_cb.pack(pady=(0, 5))
+        
+        # İçerik karşılaştırması - aynı boyutlu dosyaların özetleri karşılaştırılır
+        self.compare_content_var = ctk.BooleanVar(value=saved_selections.get('compare_content', False))
+        compare_content_cb = ctk.CTkCheckBox(
+            options_frame,
+            text="İçerik karşılaştırması yap (hash - sadece tarihi değişenleri kopyalama)",
+            variable=self.compare_content_var
+        )
+        compare_content_cb.pack(pady=(0, 5))
+        
+        # Paralel analiz - farklı disklerdeki eşleşmeler aynı anda analiz edilir
+        parallel_frame = ctk.CTkFrame(options_frame, fg_color="transparent")
+        parallel_frame.pack(pady=(0, 5))
+        
+        self.parallel_analysis_var = ctk.BooleanVar(value=saved_selections.get('parallel_analysis', False))
+        parallel_cb = ctk.CTkCheckBox(
+            parallel_frame,
+            text="Eşleşmeleri paralel analiz et",
+            variable=self.parallel_analysis_var
+        )
+        parallel_cb.pack(side="left", padx=(10, 15))
+        
+        per_device_label = ctk.CTkLabel(
+            parallel_frame,
+            text="Disk başına eşzamanlı tarama:",
+            font=("Arial", 10)
+        )
+        per_device_label.pack(side="left", padx=(0, 5))
+        
+        self.per_device_limit_var = ctk.StringVar(value=str(saved_selections.get('per_device_limit', 1)))
+        per_device_menu = ctk.CTkOptionMenu(
+            parallel_frame,
+            values=["1", "2", "3", "4"],
+            variable=self.per_device_limit_var,
+            width=60
+        )
+        per_device_menu.pack(side="left")
+        
         # Gösterilecek dosya sayısı
         count_frame = ctk.CTkFrame(options_frame)
         count_frame.pack(pady=(5, 5))
@@ -728,6 +925,11 @@ class AnalysisSelectionDialog:
             'show_skipped_files': self.show_skipped_files_var.get(),
             'show_revision_files': self.show_revision_files_var.get(),
             'show_deleted_files': self.show_deleted_files_var.get(),
+            'calculate_excluded_stats': self.calculate_excluded_stats_var.get(),
+            'trust_catalog': self.trust_catalog_var.get(),
+            'parallel_analysis': self.parallel_analysis_var.get(),
+            'compare_content': self.compare_content_var.get(),
+            'per_device_limit': int(self.per_device_limit_var.get()),
             'max_files_to_show': max_files
         }
         self.dialog.destroy()